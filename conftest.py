@@ -3,8 +3,36 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parent
 SRC_PATH = PROJECT_ROOT / "src"
 
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """Start every test with an empty cache; cached pages outlive rollbacks."""
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    django_db_modify_db_settings_parallel_suffix: None,
+) -> None:
+    """Add ``test_replica``, a second connection to the test database.
+
+    It stands in for a read replica in the routing tests, whatever database
+    the settings point at.
+    """
+    from django.db import connections
+
+    default = connections.settings["default"]
+    connections.settings["test_replica"] = {
+        **default,
+        "TEST": {**default["TEST"], "MIRROR": "default"},
+    }
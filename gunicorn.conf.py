@@ -0,0 +1,89 @@
+"""Gunicorn configuration, read from the GUNICORN_* application settings.
+
+Run with ``gunicorn -c gunicorn.conf.py`` (the Dockerfile's CMD); the app to
+serve follows from the worker class. With ``GUNICORN_PRELOAD`` the master
+imports Django and compiles the public templates once, then freezes the
+garbage collector's view of those objects, so forked workers keep sharing
+their memory pages instead of copying them when a collection touches them.
+"""
+
+from __future__ import annotations
+
+import gc
+
+from django.core.exceptions import ImproperlyConfigured
+
+from echofield.settings.config import cfg
+
+# Gunicorn worker class and app of each GUNICORN_WORKER_CLASS.
+WORKER_MODELS = {
+    "sync": ("sync", "echofield.wsgi:application"),
+    "gthread": ("gthread", "echofield.wsgi:application"),
+    "uvicorn": ("uvicorn_worker.UvicornWorker", "echofield.asgi:application"),
+}
+
+_worker_model = cfg.GUNICORN_WORKER_CLASS.strip().lower()
+if _worker_model not in WORKER_MODELS:
+    raise ImproperlyConfigured(
+        f"Unknown GUNICORN_WORKER_CLASS {cfg.GUNICORN_WORKER_CLASS!r}; "
+        f"use one of {', '.join(WORKER_MODELS)}."
+    )
+worker_class, wsgi_app = WORKER_MODELS[_worker_model]
+
+bind = cfg.GUNICORN_BIND
+workers = max(1, cfg.GUNICORN_WORKERS)
+threads = max(1, cfg.GUNICORN_THREADS) if _worker_model == "gthread" else 1
+preload_app = cfg.GUNICORN_PRELOAD
+max_requests = max(0, cfg.GUNICORN_MAX_REQUESTS)
+max_requests_jitter = max(0, cfg.GUNICORN_MAX_REQUESTS_JITTER)
+# Outlives nginx's idle upstream connections, so nginx never reuses one
+# Gunicorn has just closed. The sync worker ignores it.
+keepalive = max(1, cfg.GUNICORN_KEEPALIVE)
+timeout = max(1, cfg.GUNICORN_TIMEOUT)
+
+if preload_app:
+    # Nothing the preloaded app allocates is collected before the first fork;
+    # pre_fork freezes it and turns collection back on.
+    gc.disable()
+
+
+def when_ready(server: object) -> None:
+    if preload_app and cfg.GUNICORN_WARM_CACHES:
+        from blog.utils.warmup import warm_shared_caches
+
+        warm_shared_caches()
+
+
+def pre_fork(server: object, worker: object) -> None:
+    if not preload_app:
+        return
+    # A connection opened while loading the app must not be shared by workers.
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        if connection.settings_dict.get("OPTIONS", {}).get("pool"):
+            connection.close_pool()
+    gc.freeze()
+    # The master keeps running (and respawning workers) for the server's
+    # lifetime; its later garbage is collected, and workers forked from it
+    # start with collection on.
+    gc.enable()
+
+
+def post_fork(server: object, worker: object) -> None:
+    if preload_app:
+        # Start from an empty connection handler; this worker opens its own
+        # connections (and pools) on first use.
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_worker_init(worker: object) -> None:
+    if cfg.GUNICORN_WARM_CACHES:
+        from blog.utils.warmup import warm_shared_caches, warm_worker_caches
+
+        if not preload_app:
+            warm_shared_caches()
+        warm_worker_caches()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import Category, Post
+from .models import Category, Job, Post, PostSlug
 
 
 @admin.register(Category)
@@ -18,3 +18,19 @@ class PostAdmin(admin.ModelAdmin):
     list_filter = ("published_at", "categories")
     search_fields = ("title", "slug")
     filter_horizontal = ("categories",)
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "post", "status", "attempts", "run_after", "updated_at")
+    list_filter = ("status", "kind")
+    search_fields = ("dedupe_key", "last_error")
+    raw_id_fields = ("post",)
+
+
+@admin.register(PostSlug)
+class PostSlugAdmin(admin.ModelAdmin):
+    list_display = ("slug", "lang", "post", "created_at")
+    list_filter = ("lang",)
+    search_fields = ("slug",)
+    raw_id_fields = ("post",)
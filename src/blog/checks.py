@@ -0,0 +1,35 @@
+"""System checks for deployment settings the blog depends on."""
+
+from __future__ import annotations
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.checks import CheckMessage, Tags, Warning, register
+
+from .utils.page_cache import page_cache_is_shared
+
+
+@register(Tags.caches)
+def check_page_cache_is_shared(
+    app_configs: list[AppConfig] | None, **kwargs: object
+) -> list[CheckMessage]:
+    """Warn when cached pages and their invalidation stay in one process."""
+    backend = settings.CACHES["default"]["BACKEND"]
+    if (
+        not settings.PAGE_CACHE_TIMEOUT
+        or page_cache_is_shared()
+        or settings.CACHE_PROCESSES <= 1
+    ):
+        return []
+    return [
+        Warning(
+            f"The page cache is per process ({backend}), but "
+            f"{settings.CACHE_PROCESSES} processes serve or change pages.",
+            hint=(
+                "An edit handled by one process leaves the others serving "
+                "stale pages for up to PAGE_CACHE_TIMEOUT seconds. Set "
+                "CACHE_BACKEND=file, or GUNICORN_WORKERS=1."
+            ),
+            id="blog.W001",
+        )
+    ]
@@ -0,0 +1,141 @@
+"""Handlers and the processing loop for the database-backed job queue."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Callable
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Post
+from .models.jobs import Job
+from .utils.images import delete_image_variants
+from .utils.schedule import warm_pages
+
+logger = logging.getLogger(__name__)
+
+# Delay before retry ``n`` is ``RETRY_BASE_DELAY * 2 ** (n - 1)``, capped.
+RETRY_BASE_DELAY = timedelta(seconds=30)
+RETRY_MAX_DELAY = timedelta(hours=1)
+
+
+def handle_generate_image_variants(job: Job) -> None:
+    """Generate featured-image variants for the image named in the payload."""
+    post = Post.objects.filter(pk=job.post_id).first()
+    if post is None or post.featured_image.name != job.payload.get("image"):
+        # The post was deleted or its image replaced; a newer job (or the
+        # deletion job) takes care of the current state.
+        return
+    post.generate_featured_image_variants(strict=True)
+
+
+def handle_delete_image_variants(job: Job) -> None:
+    """Remove the variants derived from the image named in the payload."""
+    image_name = str(job.payload.get("image") or "")
+    if not image_name:
+        return
+    storage = Post._meta.get_field("featured_image").storage
+    variants = job.payload.get("variants")
+    delete_image_variants(
+        image_name, storage, variants if isinstance(variants, dict) else None
+    )
+
+
+def handle_warm_pages(job: Job) -> None:
+    """Render the pages of posts that just went live into the page cache."""
+    post_ids = job.payload.get("post_ids")
+    if isinstance(post_ids, list):
+        warm_pages([int(pk) for pk in post_ids])
+
+
+JOB_HANDLERS: dict[str, Callable[[Job], None]] = {
+    Job.Kind.GENERATE_IMAGE_VARIANTS: handle_generate_image_variants,
+    Job.Kind.DELETE_IMAGE_VARIANTS: handle_delete_image_variants,
+    Job.Kind.WARM_PAGES: handle_warm_pages,
+}
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+
+
+# Columns ``run_job`` writes when recording a failed run.
+_OUTCOME_FIELDS = ["status", "run_after", "locked_at", "last_error", "updated_at"]
+
+
+def _schedule_retry(job: Job) -> bool:
+    """Put a failed job back in the queue, unless a newer one took its key.
+
+    The check and the save are one transaction. An ``enqueue`` that still
+    slips in between makes the save violate the unique pending key; that
+    counts as superseded as well. Returns whether the retry was scheduled.
+    """
+    try:
+        with transaction.atomic():
+            if (
+                job.dedupe_key
+                and Job.objects.filter(
+                    dedupe_key=job.dedupe_key, status=Job.Status.PENDING
+                ).exists()
+            ):
+                return False
+            job.status = Job.Status.PENDING
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+            job.save(update_fields=_OUTCOME_FIELDS)
+    except IntegrityError:
+        return False
+    return True
+
+
+def run_job(job: Job) -> bool:
+    """Run a claimed job and record the outcome; return True on success."""
+    handler = JOB_HANDLERS.get(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind {job.kind!r}")
+        handler(job)
+    except Exception as exc:
+        job.last_error = f"{type(exc).__name__}: {exc}"
+        job.locked_at = None
+        if handler is not None and job.attempts < job.max_attempts:
+            if _schedule_retry(job):
+                logger.warning(
+                    "Job %s failed (attempt %s/%s), retrying",
+                    job.pk,
+                    job.attempts,
+                    job.max_attempts,
+                    exc_info=True,
+                )
+                return False
+            # A job enqueued for the same key while this one ran replaces the
+            # retry.
+            job.last_error += " (superseded by a newer job)"
+            logger.warning("Job %s failed, superseded by a newer job", job.pk)
+        else:
+            logger.exception("Job %s failed permanently", job.pk)
+        job.status = Job.Status.FAILED
+        job.save(update_fields=_OUTCOME_FIELDS)
+        return False
+
+    job.status = Job.Status.DONE
+    job.locked_at = None
+    job.last_error = ""
+    job.save(update_fields=["status", "locked_at", "last_error", "updated_at"])
+    return True
+
+
+def process_jobs(limit: int | None = None) -> int:
+    """Claim and run due jobs until the queue is empty or ``limit`` is reached."""
+    processed = 0
+    while limit is None or processed < limit:
+        job = Job.objects.claim_next()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+__all__ = ["JOB_HANDLERS", "process_jobs", "retry_delay", "run_job"]
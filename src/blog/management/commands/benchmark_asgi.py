@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import ModuleType
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from echofield.urls import build_urlpatterns
+
+from ...models import Post
+
+MODES = ("wsgi", "asgi")
+
+# Seconds each query of the current request waits before running; 0 for
+# requests that were not picked to be slow.
+_query_delay: ContextVar[float] = ContextVar("benchmark_query_delay", default=0.0)
+
+
+def _delay_query(
+    execute: Callable[..., object],
+    sql: str,
+    params: object,
+    many: bool,
+    context: dict[str, object],
+) -> object:
+    delay = _query_delay.get()
+    if delay:
+        time.sleep(delay)
+    return execute(sql, params, many, context)
+
+
+def _install_delay(connection: BaseDatabaseWrapper, **kwargs: object) -> None:
+    if _delay_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_delay_query)
+
+
+@contextmanager
+def _slow_queries() -> Iterator[None]:
+    """Let requests that set ``_query_delay`` wait on every query they run.
+
+    Stands in for slow I/O (a busy database or object storage): the waiting
+    thread is blocked, as it would be on a real socket.
+    """
+    connection_created.connect(_install_delay)
+    try:
+        yield
+    finally:
+        connection_created.disconnect(_install_delay)
+
+
+def _request_paths(posts: int) -> list[str]:
+    """Paths of the public pages the benchmark requests, in a fixed mix."""
+    slugs = list(
+        Post.public.published().values_list("slug", flat=True)[: max(1, posts)]
+    )
+    details = [reverse("post_detail", kwargs={"slug": slug}) for slug in slugs]
+    return [reverse("post_list"), *details, reverse("sitemap"), reverse("robots_txt")]
+
+
+def _urlconf(*, async_views: bool) -> ModuleType:
+    """The project URLconf with the async or the sync public views."""
+    urlconf = ModuleType(f"benchmark_urls_{'async' if async_views else 'sync'}")
+    urlconf.urlpatterns = build_urlpatterns(async_views=async_views)  # type: ignore[attr-defined]
+    return urlconf
+
+
+def _percentile(timings: list[float], fraction: float) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare sync workers (WSGI) with the async views (ASGI) on the public "
+        "pages when some requests wait on slow I/O"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--mode",
+            action="append",
+            choices=MODES,
+            help="Serving path to benchmark; repeat to compare (default: both)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests per mode (default: 200)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests the async views serve at once (default: 50)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Sync workers serving WSGI requests, as in gunicorn (default: 2)",
+        )
+        parser.add_argument(
+            "--slow-ratio",
+            type=float,
+            default=0.2,
+            help="Share of requests whose queries wait on slow I/O (default: 0.2)",
+        )
+        parser.add_argument(
+            "--slow-ms",
+            type=float,
+            default=200.0,
+            help="Wait per query of a slow request, in ms (default: 200)",
+        )
+        parser.add_argument(
+            "--posts",
+            type=int,
+            default=5,
+            help="Post pages in the request mix (default: 5)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        modes = options["mode"] or list(MODES)
+        total = max(1, int(str(options["requests"])))
+        concurrency = max(1, int(str(options["concurrency"])))
+        workers = max(1, int(str(options["workers"])))
+        slow_ratio = min(1.0, max(0.0, float(str(options["slow_ratio"]))))
+        delay = max(0.0, float(str(options["slow_ms"]))) / 1000
+
+        paths = _request_paths(int(str(options["posts"])))
+        # The same requests, in the same order, for every mode.
+        rng = random.Random(0)  # noqa: S311
+        plan = [
+            (paths[number % len(paths)], delay if rng.random() < slow_ratio else 0.0)
+            for number in range(total)
+        ]
+        self.stdout.write(
+            f"{total} requests over {len(paths)} pages sent at once, "
+            f"{slow_ratio:.0%} waiting {delay * 1000:.0f} ms per query"
+        )
+        # Measure the views, not the page cache. The test clients send
+        # ``Host: testserver``.
+        with (
+            override_settings(
+                PAGE_CACHE_TIMEOUT=0,
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ),
+            _slow_queries(),
+        ):
+            for mode in modes:  # type: ignore[union-attr]
+                # Each server gets the views it is deployed with.
+                with override_settings(
+                    ROOT_URLCONF=_urlconf(async_views=mode == "asgi")
+                ):
+                    started = time.perf_counter()
+                    if mode == "wsgi":
+                        timings = self._serve_wsgi(plan, workers)
+                        label = f"wsgi ({workers} workers)"
+                    else:
+                        timings = asyncio.run(self._serve_asgi(plan, concurrency))
+                        label = "asgi"
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{label:<18} median {statistics.median(timings) * 1000:8.1f} ms  "
+                    f"p95 {_percentile(timings, 0.95) * 1000:8.1f} ms  "
+                    f"{total / elapsed:8.1f} req/s"
+                )
+
+    def _serve_wsgi(self, plan: list[tuple[str, float]], workers: int) -> list[float]:
+        """Serve ``plan`` through the sync views like ``workers`` sync workers.
+
+        Each worker serves one request at a time.
+
+        Latency counts from when all requests were sent, so time spent queued
+        behind busy workers shows up as it would for visitors.
+        """
+        sent = time.perf_counter()
+
+        def serve(path: str, delay: float) -> float:
+            token = _query_delay.set(delay)
+            try:
+                response = Client().get(path, secure=True)
+                response.close()
+                connections.close_all()
+            finally:
+                _query_delay.reset(token)
+            self._check(path, response.status_code)
+            return time.perf_counter() - sent
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(serve, *zip(*plan, strict=True)))
+
+    async def _serve_asgi(
+        self, plan: list[tuple[str, float]], concurrency: int
+    ) -> list[float]:
+        """Serve ``plan`` through the async views, ``concurrency`` at a time.
+
+        Each request gets its own thread for sync code, as under the ASGI
+        handler, so one slow request no longer holds up the others.
+        """
+        client = AsyncClient()
+        slots = asyncio.Semaphore(concurrency)
+        sent = time.perf_counter()
+
+        async def serve(path: str, delay: float) -> float:
+            async with slots, ThreadSensitiveContext():
+                _query_delay.set(delay)
+                response = await client.get(path, secure=True)
+                await sync_to_async(connections.close_all)()
+            self._check(path, response.status_code)
+            return time.perf_counter() - sent
+
+        return list(await asyncio.gather(*(serve(*request) for request in plan)))
+
+    def _check(self, path: str, status: int) -> None:
+        if status != 200:
+            self.stderr.write(f"{path} returned {status}")
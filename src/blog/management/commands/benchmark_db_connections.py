@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import copy
+import statistics
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from ...models import Post
+
+# How each mode connects, as changes to the default alias's settings.
+MODES = ("fresh", "persistent", "prepared", "pool")
+BENCHMARK_ALIAS = "benchmark_db_connections"
+
+
+def _mode_settings(mode: str) -> dict[str, object]:
+    database = copy.deepcopy(connections[DEFAULT_DB_ALIAS].settings_dict)
+    options = {
+        key: value
+        for key, value in database["OPTIONS"].items()
+        if key not in ("pool", "server_side_binding", "prepare_threshold")
+    }
+    database["CONN_HEALTH_CHECKS"] = True
+    if mode == "fresh":
+        database["CONN_MAX_AGE"] = 0
+    elif mode in ("persistent", "prepared"):
+        database["CONN_MAX_AGE"] = 600
+    if mode == "prepared":
+        options["server_side_binding"] = True
+        options["prepare_threshold"] = 1
+    if mode == "pool":
+        from psycopg_pool import ConnectionPool
+
+        database["CONN_MAX_AGE"] = 0
+        options["pool"] = {
+            **settings.DATABASE_POOL_OPTIONS,
+            "check": ConnectionPool.check_connection,
+        }
+    database["OPTIONS"] = options
+    return database
+
+
+@contextmanager
+def _benchmark_alias(mode: str) -> Iterator[str]:
+    """Register a temporary database alias connecting the way ``mode`` does."""
+    connections.settings[BENCHMARK_ALIAS] = _mode_settings(mode)
+    try:
+        yield BENCHMARK_ALIAS
+    finally:
+        connection = connections[BENCHMARK_ALIAS]
+        if mode == "pool":
+            connection.close_pool()
+        connection.close()
+        del connections[BENCHMARK_ALIAS]
+        del connections.settings[BENCHMARK_ALIAS]
+
+
+def _serve(alias: str, requests: int, queries: int) -> list[tuple[float, float]]:
+    """Serve ``requests`` simulated page views in this thread.
+
+    Each one reads a page of post cards ``queries`` times, between the
+    connection handling Django does when a request starts and finishes.
+    Returns ``(connect, total)`` seconds per request.
+    """
+    connection = connections[alias]
+    timings = []
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            connection.close_if_unusable_or_obsolete()
+            connection.ensure_connection()
+            connected = time.perf_counter()
+            for _ in range(queries):
+                list(Post.public.using(alias).published().cards()[:20])
+            connection.close_if_unusable_or_obsolete()
+            timings.append((connected - started, time.perf_counter() - started))
+    finally:
+        connection.close()
+    return timings
+
+
+class Command(BaseCommand):
+    help = "Benchmark database connection modes (fresh, persistent, prepared, pool) under concurrent load"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--mode",
+            action="append",
+            choices=MODES,
+            help="Mode to benchmark; repeat to compare (default: all)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Simulated requests per mode (default: 500)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Threads serving requests at once (default: 8)",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=3,
+            help="Post list queries per request (default: 3)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        if connections[DEFAULT_DB_ALIAS].vendor != "postgresql":
+            raise CommandError("Connection modes can only be compared on PostgreSQL.")
+        modes = options["mode"] or list(MODES)
+        if "pool" in modes and find_spec("psycopg_pool") is None:  # type: ignore[operator]
+            raise CommandError("The pool mode needs the psycopg-pool package.")
+        concurrency = max(1, int(str(options["concurrency"])))
+        per_thread = max(1, int(str(options["requests"])) // concurrency)
+        queries = max(1, int(str(options["queries"])))
+
+        self.stdout.write(
+            f"{per_thread * concurrency} requests per mode on {concurrency} threads, "
+            f"{queries} post list queries each"
+        )
+        for mode in modes:  # type: ignore[union-attr]
+            with (
+                _benchmark_alias(str(mode)) as alias,
+                ThreadPoolExecutor(max_workers=concurrency) as executor,
+            ):
+                started = time.perf_counter()
+                results = executor.map(
+                    _serve,
+                    [alias] * concurrency,
+                    [per_thread] * concurrency,
+                    [queries] * concurrency,
+                )
+                timings = [timing for batch in results for timing in batch]
+                elapsed = time.perf_counter() - started
+            connects = sorted(connect for connect, _total in timings)
+            totals = sorted(total for _connect, total in timings)
+            p95 = totals[min(len(totals) - 1, int(len(totals) * 0.95))]
+            self.stdout.write(
+                f"{mode:<11} connect median {statistics.median(connects) * 1000:7.3f} ms  "
+                f"request median {statistics.median(totals) * 1000:7.3f} ms  "
+                f"p95 {p95 * 1000:7.3f} ms  {len(timings) / elapsed:8.1f} req/s"
+            )
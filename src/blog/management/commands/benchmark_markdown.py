@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable
+
+import markdown
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...utils.rendering import RENDERER_BACKENDS, build_renderer
+from .create_fixtures import LOREM_EN, LOREM_UK, QUALITY_POSTS
+
+
+def _build_corpus(scale: int) -> list[str]:
+    """Return the fixture posts (both languages), each repeated ``scale`` times."""
+    documents = [
+        post[key] for post in QUALITY_POSTS for key in ("content_en", "content_uk")
+    ]
+    documents += [LOREM_EN, LOREM_UK]
+    return ["\n\n".join([doc] * scale) for doc in documents]
+
+
+class Command(BaseCommand):
+    help = "Benchmark Markdown rendering over the create_fixtures corpus"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--backend",
+            action="append",
+            choices=sorted(RENDERER_BACKENDS),
+            help="Backend to benchmark; repeat to compare (default: MARKDOWN_BACKEND)",
+        )
+        parser.add_argument(
+            "--extensions",
+            default=None,
+            help="Comma-separated extensions (default: MARKDOWN_EXTENSIONS)",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=20,
+            help="Number of timed passes over the corpus (default: 20)",
+        )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Repeat each fixture post N times to simulate long articles",
+        )
+        parser.add_argument(
+            "--no-baseline",
+            action="store_true",
+            help="Skip the markdown.markdown() baseline (fresh parser per call)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        rounds = max(1, int(str(options["rounds"])))
+        corpus = _build_corpus(max(1, int(str(options["scale"]))))
+        corpus_bytes = sum(len(doc.encode()) for doc in corpus)
+
+        raw_extensions = options["extensions"]
+        if raw_extensions is None:
+            extensions = tuple(settings.MARKDOWN_EXTENSIONS)
+        else:
+            extensions = tuple(
+                item.strip() for item in str(raw_extensions).split(",") if item.strip()
+            )
+        backends = options["backend"] or [settings.MARKDOWN_BACKEND]
+
+        self.stdout.write(
+            f"Corpus: {len(corpus)} documents, {corpus_bytes / 1024:.1f} KiB; "
+            f"{rounds} rounds; extensions: {', '.join(extensions) or '(none)'}"
+        )
+
+        candidates: list[tuple[str, Callable[[str], str]]] = []
+        if not options["no_baseline"]:
+            candidates.append(
+                (
+                    "markdown.markdown() baseline",
+                    lambda text: markdown.markdown(text, extensions=list(extensions)),
+                )
+            )
+        for backend in backends:  # type: ignore[union-attr]
+            try:
+                renderer = build_renderer(str(backend), extensions)
+            except ImproperlyConfigured as exc:
+                raise CommandError(str(exc)) from exc
+            candidates.append((f"{renderer.name} (reused parser)", renderer.render))
+
+        for label, render in candidates:
+            # Warm-up pass: imports, extension loading, per-thread parser setup.
+            for document in corpus:
+                render(document)
+            timings = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                for document in corpus:
+                    render(document)
+                timings.append(time.perf_counter() - started)
+            median = statistics.median(timings)
+            per_doc_us = median / len(corpus) * 1_000_000
+            throughput = corpus_bytes / median / (1024 * 1024)
+            self.stdout.write(
+                f"{label:<36} median {median * 1000:8.2f} ms/pass  "
+                f"{per_doc_us:8.1f} µs/doc  {throughput:6.2f} MiB/s  "
+                f"(best {min(timings) * 1000:.2f} ms)"
+            )
@@ -11,78 +11,13 @@ from django.utils import timezone
 
 from ...models import Post
 
-
-class Command(BaseCommand):
-    help = "Create blog post fixtures with interesting content in both languages"
-
-    def add_arguments(self, parser: CommandParser) -> None:
-        parser.add_argument(
-            "--count",
-            type=int,
-            default=10,
-            help="Number of quality posts to create (default: 10)",
-        )
-        parser.add_argument(
-            "--bulk",
-            type=int,
-            default=0,
-            help="Number of bulk/lorem ipsum posts to create (default: 0)",
-        )
-        parser.add_argument(
-            "--seed",
-            type=int,
-            default=None,
-            help="Random seed for slug generation. Use different seeds to create unique slugs (default: random)",
-        )
-
-    def handle(self, *args: object, **options: dict[str, object]) -> None:
-        quality_count = int(options["count"])
-        bulk_count = int(options["bulk"])
-        seed = options.get("seed")
-
-        # Initialize random seed if provided
-        if seed is not None:
-            random.seed(seed)
-            self.stdout.write(f"Using random seed: {seed}")
-
-        self.stdout.write(f"Creating {quality_count} quality posts...")
-        self._create_quality_posts(quality_count, seed)
-
-        if bulk_count > 0:
-            self.stdout.write(f"Creating {bulk_count} bulk posts...")
-            self._create_bulk_posts(bulk_count, seed)
-
-        self.stdout.write(self.style.SUCCESS("Fixtures created successfully!"))
-
-    def _randomize_slug(self, base_slug: str, seed: int | None) -> str:
-        """Add a random suffix to the slug to make it unique."""
-        if seed is None:
-            # Generate a random 6-character suffix
-            suffix = "".join(
-                random.choices(string.ascii_lowercase + string.digits, k=6)
-            )
-        else:
-            # Use seed-based randomization for reproducibility
-            # Create a deterministic suffix based on the base slug and seed
-            # Create a deterministic integer seed from seed and base_slug
-            # Use a simple polynomial hash for consistency
-            slug_hash = sum(ord(c) * (i + 1) for i, c in enumerate(base_slug))
-            deterministic_seed = seed + slug_hash
-            temp_rng = random.Random(deterministic_seed)
-            suffix = "".join(
-                temp_rng.choices(string.ascii_lowercase + string.digits, k=6)
-            )
-        return f"{base_slug}-{suffix}"
-
-    def _create_quality_posts(self, count: int, seed: int | None) -> None:
-        """Create interesting, well-written posts in both languages."""
-        posts_data = [
-            {
-                "title_en": "Getting Started with TypeScript",
-                "title_uk": "Початок роботи з TypeScript",
-                "slug_en": "getting-started-with-typescript",
-                "slug_uk": "pochatok-roboty-z-typescript",
-                "content_en": """# Getting Started with TypeScript
+QUALITY_POSTS: list[dict[str, str]] = [
+    {
+        "title_en": "Getting Started with TypeScript",
+        "title_uk": "Початок роботи з TypeScript",
+        "slug_en": "getting-started-with-typescript",
+        "slug_uk": "pochatok-roboty-z-typescript",
+        "content_en": """# Getting Started with TypeScript
 
 TypeScript is a powerful superset of JavaScript that adds static type checking to your code. In this post, we'll explore the basics of TypeScript and how it can improve your development workflow.
 
@@ -103,7 +38,7 @@ function greet(name: string): string {
 ```
 
 Start using TypeScript today and see the difference it makes!""",
-                "content_uk": """# Початок роботи з TypeScript
+        "content_uk": """# Початок роботи з TypeScript
 
 TypeScript — це потужне розширення JavaScript, яке додає статичну перевірку типів до вашого коду. У цій статті ми дослідимо основи TypeScript та як він може покращити ваш робочий процес розробки.
 
@@ -124,13 +59,13 @@ function greet(name: string): string {
 ```
 
 Почніть використовувати TypeScript сьогодні та побачте різницю!""",
-            },
-            {
-                "title_en": "Understanding Django ORM",
-                "title_uk": "Розуміння Django ORM",
-                "slug_en": "understanding-django-orm",
-                "slug_uk": "rozuminnia-django-orm",
-                "content_en": """# Understanding Django ORM
+    },
+    {
+        "title_en": "Understanding Django ORM",
+        "title_uk": "Розуміння Django ORM",
+        "slug_en": "understanding-django-orm",
+        "slug_uk": "rozuminnia-django-orm",
+        "content_en": """# Understanding Django ORM
 
 Django's Object-Relational Mapping (ORM) is one of its most powerful features. It allows you to interact with your database using Python code instead of SQL.
 
@@ -155,7 +90,7 @@ recent = posts.filter(published_at__gte=timezone.now() - timedelta(days=7))
 ```
 
 Master the ORM to write efficient, maintainable Django applications.""",
-                "content_uk": """# Розуміння Django ORM
+        "content_uk": """# Розуміння Django ORM
 
 Об'єктно-реляційне відображення (ORM) Django — одна з найпотужніших його функцій. Воно дозволяє взаємодіяти з базою даних, використовуючи код Python замість SQL.
 
@@ -180,13 +115,13 @@ recent = posts.filter(published_at__gte=timezone.now() - timedelta(days=7))
 ```
 
 Опануйте ORM, щоб писати ефективні, підтримувані додатки Django.""",
-            },
-            {
-                "title_en": "CSS Custom Properties Deep Dive",
-                "title_uk": "Поглиблений огляд CSS Custom Properties",
-                "slug_en": "css-custom-properties-deep-dive",
-                "slug_uk": "pohlyblenyi-ohliad-css-custom-properties",
-                "content_en": """# CSS Custom Properties Deep Dive
+    },
+    {
+        "title_en": "CSS Custom Properties Deep Dive",
+        "title_uk": "Поглиблений огляд CSS Custom Properties",
+        "slug_en": "css-custom-properties-deep-dive",
+        "slug_uk": "pohlyblenyi-ohliad-css-custom-properties",
+        "content_en": """# CSS Custom Properties Deep Dive
 
 CSS custom properties (variables) revolutionize how we write maintainable stylesheets. They enable dynamic theming, runtime value changes, and better code organization.
 
@@ -211,7 +146,7 @@ CSS custom properties (variables) revolutionize how we write maintainable styles
 ```
 
 Custom properties are the foundation of modern CSS architecture.""",
-                "content_uk": """# Поглиблений огляд CSS Custom Properties
+        "content_uk": """# Поглиблений огляд CSS Custom Properties
 
 CSS custom properties (змінні) революціонізують те, як ми пишемо підтримувані таблиці стилів. Вони дозволяють динамічне темування, зміну значень під час виконання та кращу організацію коду.
 
@@ -236,13 +171,13 @@ CSS custom properties (змінні) революціонізують те, як
 ```
 
 Custom properties є основою сучасної архітектури CSS.""",
-            },
-            {
-                "title_en": "Building a REST API with Django REST Framework",
-                "title_uk": "Побудова REST API з Django REST Framework",
-                "slug_en": "building-rest-api-django-rest-framework",
-                "slug_uk": "pobudova-rest-api-django-rest-framework",
-                "content_en": """# Building a REST API with Django REST Framework
+    },
+    {
+        "title_en": "Building a REST API with Django REST Framework",
+        "title_uk": "Побудова REST API з Django REST Framework",
+        "slug_en": "building-rest-api-django-rest-framework",
+        "slug_uk": "pobudova-rest-api-django-rest-framework",
+        "content_en": """# Building a REST API with Django REST Framework
 
 Django REST Framework (DRF) makes it easy to build powerful, flexible REST APIs. Let's explore the core concepts.
 
@@ -272,7 +207,7 @@ class PostViewSet(viewsets.ModelViewSet):
 ```
 
 DRF provides everything you need for modern API development.""",
-                "content_uk": """# Побудова REST API з Django REST Framework
+        "content_uk": """# Побудова REST API з Django REST Framework
 
 Django REST Framework (DRF) спрощує створення потужних, гнучких REST API. Дослідимо основні концепції.
 
@@ -302,13 +237,13 @@ class PostViewSet(viewsets.ModelViewSet):
 ```
 
 DRF надає все необхідне для сучасного розробки API.""",
-            },
-            {
-                "title_en": "Modern JavaScript: Async/Await Patterns",
-                "title_uk": "Сучасний JavaScript: Патерни Async/Await",
-                "slug_en": "modern-javascript-async-await-patterns",
-                "slug_uk": "suchasnyi-javascript-paterny-async-await",
-                "content_en": """# Modern JavaScript: Async/Await Patterns
+    },
+    {
+        "title_en": "Modern JavaScript: Async/Await Patterns",
+        "title_uk": "Сучасний JavaScript: Патерни Async/Await",
+        "slug_en": "modern-javascript-async-await-patterns",
+        "slug_uk": "suchasnyi-javascript-paterny-async-await",
+        "content_en": """# Modern JavaScript: Async/Await Patterns
 
 Async/await syntax makes asynchronous code more readable and maintainable. Let's explore best practices.
 
@@ -338,7 +273,7 @@ const [users, posts] = await Promise.all([
 ```
 
 Async/await simplifies complex asynchronous workflows.""",
-                "content_uk": """# Сучасний JavaScript: Патерни Async/Await
+        "content_uk": """# Сучасний JavaScript: Патерни Async/Await
 
 Синтаксис async/await робить асинхронний код більш читабельним та підтримуваним. Дослідимо найкращі практики.
 
@@ -368,8 +303,84 @@ const [users, posts] = await Promise.all([
 ```
 
 Async/await спрощує складні асинхронні робочі процеси.""",
-            },
-        ]
+    },
+]
+
+
+LOREM_EN = """Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.
+
+Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident."""
+
+LOREM_UK = """Лорем іпсум долор сіт амет, консецтетур адіпісцінг еліт. Сед до еіусмод темпор інцідідунт ут лабор ет долор магна алікуа. Ут енім ад мінім веніам, квіс ноструд ехерцітатіон улламо лаборіс.
+
+Дуіс ауте іруре долор ін репрегендеріт ін волуптате веліт ессе ціллум долор еу фугіат нулла паріатур. Екцептеур сінт окцеакат цупідатат нон проідент."""
+
+
+class Command(BaseCommand):
+    help = "Create blog post fixtures with interesting content in both languages"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=10,
+            help="Number of quality posts to create (default: 10)",
+        )
+        parser.add_argument(
+            "--bulk",
+            type=int,
+            default=0,
+            help="Number of bulk/lorem ipsum posts to create (default: 0)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for slug generation. Use different seeds to create unique slugs (default: random)",
+        )
+
+    def handle(self, *args: object, **options: dict[str, object]) -> None:
+        quality_count = int(options["count"])
+        bulk_count = int(options["bulk"])
+        seed = options.get("seed")
+
+        # Initialize random seed if provided
+        if seed is not None:
+            random.seed(seed)
+            self.stdout.write(f"Using random seed: {seed}")
+
+        self.stdout.write(f"Creating {quality_count} quality posts...")
+        self._create_quality_posts(quality_count, seed)
+
+        if bulk_count > 0:
+            self.stdout.write(f"Creating {bulk_count} bulk posts...")
+            self._create_bulk_posts(bulk_count, seed)
+
+        self.stdout.write(self.style.SUCCESS("Fixtures created successfully!"))
+
+    def _randomize_slug(self, base_slug: str, seed: int | None) -> str:
+        """Add a random suffix to the slug to make it unique."""
+        if seed is None:
+            # Generate a random 6-character suffix
+            suffix = "".join(
+                random.choices(string.ascii_lowercase + string.digits, k=6)
+            )
+        else:
+            # Use seed-based randomization for reproducibility
+            # Create a deterministic suffix based on the base slug and seed
+            # Create a deterministic integer seed from seed and base_slug
+            # Use a simple polynomial hash for consistency
+            slug_hash = sum(ord(c) * (i + 1) for i, c in enumerate(base_slug))
+            deterministic_seed = seed + slug_hash
+            temp_rng = random.Random(deterministic_seed)
+            suffix = "".join(
+                temp_rng.choices(string.ascii_lowercase + string.digits, k=6)
+            )
+        return f"{base_slug}-{suffix}"
+
+    def _create_quality_posts(self, count: int, seed: int | None) -> None:
+        """Create interesting, well-written posts in both languages."""
+        posts_data = QUALITY_POSTS
 
         # Load images from tmp/ folder
         images = []
@@ -437,14 +448,6 @@ Async/await спрощує складні асинхронні робочі пр
 
     def _create_bulk_posts(self, count: int, seed: int | None) -> None:
         """Create bulk posts with lorem ipsum-like content."""
-        lorem_en = """Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.
-
-Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident."""
-
-        lorem_uk = """Лорем іпсум долор сіт амет, консецтетур адіпісцінг еліт. Сед до еіусмод темпор інцідідунт ут лабор ет долор магна алікуа. Ут енім ад мінім веніам, квіс ноструд ехерцітатіон улламо лаборіс.
-
-Дуіс ауте іруре долор ін репрегендеріт ін волуптате веліт ессе ціллум долор еу фугіат нулла паріатур. Екцептеур сінт окцеакат цупідатат нон проідент."""
-
         for i in range(count):
             # Randomize slugs to avoid conflicts
             base_slug_en = f"bulk-post-{i + 1}"
@@ -455,13 +458,13 @@ Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu
             Post.objects.create(
                 title=f"Bulk Post {i + 1}",
                 slug=slug_en,
-                content=lorem_en,
+                content=LOREM_EN,
                 title_en=f"Bulk Post {i + 1}",
                 title_uk=f"Масовий пост {i + 1}",
                 slug_en=slug_en,
                 slug_uk=slug_uk,
-                content_en=lorem_en,
-                content_uk=lorem_uk,
+                content_en=LOREM_EN,
+                content_uk=LOREM_UK,
                 status=Post.Status.PUBLISHED,
                 published_at=timezone.now() - timedelta(days=random.randint(0, 60)),
             )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...models import Post
+from ...models.cards import refresh_category_labels
+from ...utils.page_cache import bump_page_cache_version
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized category labels stored on every post"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of posts recomputed per batch (default: 500)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        batch_size = max(1, int(str(options["batch_size"])))
+        post_ids = list(Post.objects.order_by("pk").values_list("pk", flat=True))
+        total = 0
+        for start in range(0, len(post_ids), batch_size):
+            batch = post_ids[start : start + batch_size]
+            total += refresh_category_labels(batch)
+        if total:
+            # bulk_update sends no post_save.
+            bump_page_cache_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated category labels of {total} of {len(post_ids)} post(s)."
+            )
+        )
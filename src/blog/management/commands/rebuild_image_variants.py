@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...models import Post
+from ...utils.images import (
+    GeneratedVariants,
+    delete_image_variants,
+    generate_image_variants,
+    manifest_is_current,
+    normalize_manifest,
+    variant_formats,
+    variant_names,
+    variant_widths,
+)
+
+CHECKPOINT_INTERVAL = 2.0
+
+
+def _rebuild(post: Post) -> tuple[GeneratedVariants, int]:
+    """Generate the variants of one post; runs in a worker thread.
+
+    Only the storage backend is touched here; manifests are written by the
+    main thread, so workers never need a database connection of their own.
+    """
+    image = post.featured_image
+    original_bytes = image.storage.size(image.name)
+    return generate_image_variants(image, strict=True), original_bytes
+
+
+class Command(BaseCommand):
+    help = "Regenerate missing or stale featured-image variants for all posts"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Posts processed concurrently (default: 4)",
+        )
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Only posts without any recorded variants",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild every post, even when its variants are current",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the posts that would be rebuilt without writing anything",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=str(Path(settings.BASE_DIR) / ".rebuild_image_variants.json"),
+            help="Progress file used to resume an interrupted run",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and start from the first post",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        workers = max(1, int(str(options["workers"])))
+        checkpoint = Path(str(options["checkpoint"]))
+        widths = variant_widths()
+        formats = variant_formats()
+        # A checkpoint only applies to a run with the same selection.
+        signature = {
+            "widths": widths,
+            "formats": list(formats),
+            "only_missing": bool(options["only_missing"]),
+            "force": bool(options["force"]),
+        }
+
+        resume_after = 0
+        if not options["restart"] and checkpoint.exists():
+            state = json.loads(checkpoint.read_text())
+            if state.get("signature") == signature:
+                resume_after = int(state.get("last_pk", 0))
+                self.stdout.write(f"Resuming after post #{resume_after}.")
+
+        queryset = (
+            Post.objects.exclude(featured_image="")
+            .exclude(featured_image__isnull=True)
+            .filter(pk__gt=resume_after)
+            .only(
+                "pk",
+                "featured_image",
+                "featured_image_variants",
+                "featured_image_width",
+            )
+            .order_by("pk")
+        )
+
+        def needs_rebuild(post: Post) -> bool:
+            if options["force"]:
+                return True
+            if options["only_missing"]:
+                return not normalize_manifest(post.featured_image_variants)
+            # Rows without recorded details predate them; rebuilding fills
+            # them in.
+            return post.featured_image_width is None or not manifest_is_current(
+                post.featured_image_variants,
+                widths,
+                formats,
+                source_width=post.featured_image_width,
+            )
+
+        candidates = (
+            post for post in queryset.iterator(chunk_size=200) if needs_rebuild(post)
+        )
+
+        if options["dry_run"]:
+            count = 0
+            for post in candidates:
+                count += 1
+                self.stdout.write(f"#{post.pk} {post.featured_image.name}")
+            self.stdout.write(f"Would rebuild variants for {count} post(s).")
+            return
+
+        self._verbosity = int(str(options["verbosity"]))
+        self._order: deque[int] = deque()
+        self._finished: set[int] = set()
+        self._last_pk = resume_after
+        self._last_saved = time.monotonic()
+        self._rebuilt = 0
+        self._failed: list[int] = []
+        self._variants = 0
+        self._written = 0
+        self._original = 0
+        self._widest: dict[str, int] = dict.fromkeys(formats, 0)
+
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                in_flight: dict[Future[tuple[GeneratedVariants, int]], Post] = {}
+                for post in candidates:
+                    # Keep a bounded window of posts (and their images) in memory.
+                    while len(in_flight) >= workers * 2:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._finish(in_flight.pop(future), future)
+                            self._checkpoint(checkpoint, signature)
+                    self._order.append(post.pk)
+                    in_flight[pool.submit(_rebuild, post)] = post
+                for future in list(in_flight):
+                    wait([future])
+                    self._finish(in_flight.pop(future), future)
+                    self._checkpoint(checkpoint, signature)
+        except BaseException:
+            self._checkpoint(checkpoint, signature, force=True)
+            raise
+        elapsed = time.perf_counter() - started
+
+        if checkpoint.exists():
+            checkpoint.unlink()
+        self._report(elapsed)
+
+    def _finish(
+        self, post: Post, future: Future[tuple[GeneratedVariants, int]]
+    ) -> None:
+        image_name = post.featured_image.name
+        try:
+            generated, original_bytes = future.result()
+        except Exception as exc:
+            self._failed.append(post.pk)
+            self.stderr.write(f"#{post.pk} {image_name}: {type(exc).__name__}: {exc}")
+        else:
+            previous = normalize_manifest(post.featured_image_variants)
+            stored = post.store_featured_image_variants(image_name, generated)
+            if stored:
+                # Files of labels or formats dropped from the configuration.
+                kept = variant_names(stored)
+                stale = {
+                    fmt: {
+                        label: info
+                        for label, info in variants.items()
+                        if info["name"] not in kept
+                    }
+                    for fmt, variants in previous.items()
+                }
+                if variant_names(stale):
+                    storage = post.featured_image.storage
+                    delete_image_variants(image_name, storage, stale)
+                self._rebuilt += 1
+                self._original += original_bytes
+                for fmt, variants in stored.items():
+                    self._variants += len(variants)
+                    self._written += sum(info["bytes"] for info in variants.values())
+                    widest = max(variants.values(), key=lambda info: info["width"])
+                    self._widest[fmt] = self._widest.get(fmt, 0) + widest["bytes"]
+            if self._verbosity >= 2:
+                self.stdout.write(f"#{post.pk} {image_name}: {len(stored)} format(s)")
+
+        # The checkpoint records the highest pk below which every post is
+        # finished; workers complete out of order.
+        self._finished.add(post.pk)
+        while self._order and self._order[0] in self._finished:
+            self._finished.remove(self._order[0])
+            self._last_pk = self._order.popleft()
+
+    def _checkpoint(
+        self, checkpoint: Path, signature: dict[str, object], *, force: bool = False
+    ) -> None:
+        if not force and time.monotonic() - self._last_saved < CHECKPOINT_INTERVAL:
+            return
+        temporary = checkpoint.with_name(checkpoint.name + ".tmp")
+        temporary.write_text(
+            json.dumps({"signature": signature, "last_pk": self._last_pk})
+        )
+        os.replace(temporary, checkpoint)
+        self._last_saved = time.monotonic()
+
+    def _report(self, elapsed: float) -> None:
+        mib = 1024 * 1024
+        rate = self._rebuilt / elapsed if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {self._rebuilt} post(s) in {elapsed:.1f}s "
+                f"({rate:.2f} posts/s): {self._variants} variant(s), "
+                f"{self._written / mib:.1f} MiB written."
+            )
+        )
+        for fmt, widest in self._widest.items():
+            if not self._original:
+                break
+            saved = self._original - widest
+            self.stdout.write(
+                f"{fmt}: originals {self._original / mib:.1f} MiB -> widest "
+                f"variants {widest / mib:.1f} MiB "
+                f"({saved / mib:.1f} MiB, {saved / self._original:.0%} saved)"
+            )
+        if self._failed:
+            self.stderr.write(
+                f"{len(self._failed)} post(s) failed: "
+                + ", ".join(f"#{pk}" for pk in self._failed)
+            )
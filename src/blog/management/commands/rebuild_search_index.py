@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...models import Post
+from ...utils.search import index_posts
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of every post"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of posts indexed per batch (default: 500)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        batch_size = max(1, int(str(options["batch_size"])))
+        post_ids = list(Post.objects.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(post_ids), batch_size):
+            batch = post_ids[start : start + batch_size]
+            index_posts(Post.objects.filter(pk__in=batch))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {len(post_ids)} post(s) for search.")
+        )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import QuerySet
+from django.utils import timezone, translation
+
+from ...models import Post
+from ...utils.page_cache import bump_page_cache_version
+from ...utils.rendering import get_renderer
+from ...utils.search import index_posts
+
+
+class Command(BaseCommand):
+    help = "Re-render stored post HTML rendered by an older Markdown pipeline"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-render every post, not only rows with a stale renderer version",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Number of posts written per UPDATE batch (default: 200)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        batch_size = max(1, int(str(options["batch_size"])))
+        version = get_renderer().version
+        queryset = Post.objects.order_by("pk")
+        if not options["all"]:
+            queryset = queryset.exclude(content_html_version=version)
+
+        # The pages change, so ``updated_at`` (their Last-Modified) moves too.
+        fields = [*Post.rendered_content_fields(), "updated_at"]
+        now = timezone.now()
+        # Disable modeltranslation's lookup rewriting so the base column is
+        # written as-is instead of being folded into the active language.
+        writer = Post.objects.rewrite(False)
+        total = 0
+        batch: list[Post] = []
+        # The base ``content_html`` column mirrors the default language, the
+        # same way modeltranslation populates ``content`` itself.
+        with translation.override(settings.MODELTRANSLATION_DEFAULT_LANGUAGE):
+            for post in queryset.iterator(chunk_size=batch_size):
+                post.render_content()
+                post.updated_at = now
+                batch.append(post)
+                if len(batch) >= batch_size:
+                    self._write(writer, batch, fields)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                self._write(writer, batch, fields)
+                total += len(batch)
+        if total:
+            # bulk_update sends no post_save.
+            bump_page_cache_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Re-rendered {total} post(s) with renderer version {version}."
+            )
+        )
+
+    def _write(
+        self, writer: QuerySet[Post], batch: list[Post], fields: list[str]
+    ) -> None:
+        writer.bulk_update(batch, fields)
+        # The search index is built from the rendered HTML.
+        index_posts(Post.objects.filter(pk__in=[post.pk for post in batch]))
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import signal
+import time
+from datetime import timedelta
+from types import FrameType
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+from django.utils import timezone
+
+from ...jobs import process_jobs
+from ...models.jobs import Job
+from ...utils.schedule import check_go_live, schedule_warming
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (image variants, page warming) until stopped"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the jobs that are due now and exit",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: 2)",
+        )
+        parser.add_argument(
+            "--purge-after-days",
+            type=int,
+            default=7,
+            help="Delete finished jobs older than N days; 0 disables (default: 7)",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        sleep = max(0.1, float(str(options["sleep"])))
+        purge_days = int(str(options["purge_after_days"]))
+        self._stopping = False
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, self._stop)
+            signal.signal(signal.SIGINT, self._stop)
+
+        total = 0
+        last_purge = 0.0
+        while not self._stopping:
+            close_old_connections()
+            # Publish on time even when no visitor comes by, then queue the
+            # warming of what went live (whoever noticed it first).
+            check_go_live()
+            schedule_warming()
+            processed = process_jobs(limit=None if options["once"] else 50)
+            total += processed
+            if processed:
+                self.stdout.write(f"Processed {processed} job(s).")
+            if options["once"]:
+                break
+            if not processed:
+                if purge_days > 0 and time.monotonic() - last_purge > 3600:
+                    self._purge(purge_days)
+                    last_purge = time.monotonic()
+                time.sleep(sleep)
+
+        if options["once"] and purge_days > 0:
+            self._purge(purge_days)
+        self.stdout.write(self.style.SUCCESS(f"Worker stopped after {total} job(s)."))
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        # Finish the job in progress, then leave the loop.
+        self._stopping = True
+
+    def _purge(self, days: int) -> None:
+        cutoff = timezone.now() - timedelta(days=days)
+        Job.objects.filter(status=Job.Status.DONE, updated_at__lt=cutoff).delete()
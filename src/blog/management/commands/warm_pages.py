@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...utils.schedule import take_went_live, warm_pages, warming_enabled
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the post list and the pages of the given posts (default: the "
+        "posts that went live since the last warming) into the page cache"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "post_ids",
+            nargs="*",
+            type=int,
+            help="Ids of the posts whose pages to warm",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        if not warming_enabled():
+            self.stdout.write(
+                "Not warming: PAGE_CACHE_WARM_URL is unset, the page cache is "
+                "off, or the cache is per process."
+            )
+            return
+        post_ids = list(options["post_ids"]) or take_went_live()  # type: ignore[call-overload]
+        warmed = warm_pages(post_ids)
+        self.stdout.write(self.style.SUCCESS(f"Warmed {warmed} page(s)."))
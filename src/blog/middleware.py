@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponsePermanentRedirect
+from django.urls import reverse
+from django.utils.translation import get_language
+
+from .models import Post, PostSlug
+from .routers import PRIMARY_READS_COOKIE, RequestRouting, request_routing
+from .utils.redirects import SlugRedirectCache, SlugRedirectMap, with_query_string
+from .utils.schedule import check_go_live
+
+
+def load_slug_redirects() -> SlugRedirectMap:
+    """Build the slug map of all published posts (two queries)."""
+    codes = [code for code, _label in settings.LANGUAGES]
+    canonical: dict[str, dict[int, str]] = {code: {} for code in codes}
+    rows = Post.public.published().values_list(
+        "pk", "slug", *(f"slug_{code}" for code in codes)
+    )
+    for pk, slug, *localized in rows:
+        for code, local in zip(codes, localized, strict=True):
+            canonical[code][pk] = local or slug
+    history = PostSlug.objects.order_by("pk").values_list("slug", "post_id")
+    return SlugRedirectMap(canonical, history)
+
+
+slug_redirects = SlugRedirectCache(load_slug_redirects)
+
+
+class _SyncAndAsyncMiddleware:
+    """Base of middleware that runs in sync (WSGI) and async (ASGI) stacks.
+
+    In an async stack, ``__call__`` must hand over to ``__acall__``, so
+    requests to async views never switch threads on the way.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+class SlugRedirectMiddleware(_SyncAndAsyncMiddleware):
+    """Redirect old and other-language post slugs before the view runs.
+
+    Lookups are answered from an in-process :class:`SlugRedirectMap`, so once
+    it is built a redirect costs no queries. Slugs the map does not know are
+    left to :class:`~blog.views.PostDetailView`. Must come after
+    ``LocaleMiddleware``, which activates the language redirected to.
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)  # type: ignore[return-value]
+        return self.get_response(request)  # type: ignore[return-value]
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return await self.get_response(request)  # type: ignore[misc]
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., HttpResponse],
+        view_args: tuple[object, ...],
+        view_kwargs: dict[str, object],
+    ) -> HttpResponse | None:
+        match = request.resolver_match
+        if request.method not in ("GET", "HEAD") or match is None:
+            return None
+        if match.url_name != "post_detail":
+            return None
+        lang = get_language() or settings.LANGUAGE_CODE
+        target = slug_redirects.get().redirect_target(str(view_kwargs["slug"]), lang)
+        if target is None:
+            return None
+        return HttpResponsePermanentRedirect(
+            with_query_string(reverse("post_detail", kwargs={"slug": target}), request)
+        )
+
+
+class GoLiveMiddleware(_SyncAndAsyncMiddleware):
+    """Expire cached public state once a scheduled post's time has come.
+
+    Costs one cache read per request; see :func:`blog.utils.schedule.check_go_live`.
+    Pages are warmed again by the ``run_jobs`` worker, never in a request.
+    Must come before middleware and views that read the page cache or the
+    slug redirect map.
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)  # type: ignore[return-value]
+        check_go_live()
+        return self.get_response(request)  # type: ignore[return-value]
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        await sync_to_async(check_go_live)()
+        return await self.get_response(request)  # type: ignore[misc]
+
+
+class ReplicaMiddleware(_SyncAndAsyncMiddleware):
+    """Route the reads of public views to a replica; see :mod:`blog.routers`.
+
+    A request reads from a replica when it is a GET or HEAD, its view is
+    marked with :func:`~blog.routers.replica_reads`, and the visitor carries
+    no ``primary_reads`` cookie. Responses to requests that wrote set that
+    cookie for ``REPLICA_PIN_SECONDS``, so the visitor's next requests read
+    their own writes from the primary. Should come first, so that it also
+    sees the writes of other middleware (sessions).
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)  # type: ignore[return-value]
+        routing = RequestRouting()
+        token = request_routing.set(routing)
+        try:
+            response: HttpResponse = self.get_response(request)  # type: ignore[assignment]
+        finally:
+            request_routing.reset(token)
+        return self._pin_after_write(request, response, routing)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        routing = RequestRouting()
+        # Code the request runs in worker threads gets a copy of this context,
+        # holding the same ``routing``.
+        token = request_routing.set(routing)
+        try:
+            response = await self.get_response(request)  # type: ignore[misc]
+        finally:
+            request_routing.reset(token)
+        return self._pin_after_write(request, response, routing)
+
+    def _pin_after_write(
+        self, request: HttpRequest, response: HttpResponse, routing: RequestRouting
+    ) -> HttpResponse:
+        if (
+            routing.wrote
+            and settings.DATABASE_REPLICAS
+            and settings.REPLICA_PIN_SECONDS
+        ):
+            response.set_cookie(
+                PRIMARY_READS_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=request.is_secure(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., HttpResponse],
+        view_args: tuple[object, ...],
+        view_kwargs: dict[str, object],
+    ) -> HttpResponse | None:
+        routing = request_routing.get()
+        if (
+            routing is not None
+            and not routing.wrote
+            and settings.DATABASE_REPLICAS
+            and request.method in ("GET", "HEAD")
+            and getattr(view_func, "replica_reads", False)
+            and PRIMARY_READS_COOKIE not in request.COOKIES
+        ):
+            routing.replica = random.choice(settings.DATABASE_REPLICAS)  # noqa: S311
+        return None
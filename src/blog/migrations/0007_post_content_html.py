@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2025-11-24 10:12
+
+from django.db import migrations, models
+
+from blog.utils.rendering import RENDERER_VERSION, render_markdown
+
+
+def render_existing_posts(apps, schema_editor):  # noqa: ANN001, ANN201
+    Post = apps.get_model("blog", "Post")
+    posts = list(Post.objects.all())
+    for post in posts:
+        post.content_html = render_markdown(post.content)
+        post.content_html_en = render_markdown(post.content_en)
+        post.content_html_uk = render_markdown(post.content_uk)
+        post.content_html_version = RENDERER_VERSION
+    Post.objects.bulk_update(
+        posts,
+        ["content_html", "content_html_en", "content_html_uk", "content_html_version"],
+        batch_size=200,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_category_post_categories"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_html",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                verbose_name="Rendered content",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_html_en",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                null=True,
+                verbose_name="Rendered content",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_html_uk",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                null=True,
+                verbose_name="Rendered content",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_html_version",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Renderer version"
+            ),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 5.2.7 on 2025-11-25 09:40
+
+from django.db import migrations, models
+
+from blog.utils.rendering import summarize_html
+
+
+def summarize_existing_posts(apps, schema_editor):  # noqa: ANN001, ANN201
+    Post = apps.get_model("blog", "Post")
+    posts = list(Post.objects.all())
+    fields = []
+    for suffix in ("", "_en", "_uk"):
+        fields += [f"excerpt{suffix}", f"word_count{suffix}", f"reading_time{suffix}"]
+    for post in posts:
+        for suffix in ("", "_en", "_uk"):
+            summary = summarize_html(getattr(post, f"content_html{suffix}"))
+            setattr(post, f"excerpt{suffix}", summary.excerpt)
+            setattr(post, f"word_count{suffix}", summary.word_count)
+            setattr(post, f"reading_time{suffix}", summary.reading_time)
+    Post.objects.bulk_update(posts, fields, batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0007_post_content_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="excerpt",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=160,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="excerpt_en",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=160,
+                null=True,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="excerpt_uk",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=160,
+                null=True,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Reading time (minutes)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time_en",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                editable=False,
+                null=True,
+                verbose_name="Reading time (minutes)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time_uk",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                editable=False,
+                null=True,
+                verbose_name="Reading time (minutes)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="word_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Word count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="word_count_en",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, null=True, verbose_name="Word count"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="word_count_uk",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, null=True, verbose_name="Word count"
+            ),
+        ),
+        migrations.RunPython(summarize_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2025-11-27 14:05
+
+import logging
+
+from django.db import migrations, models
+from PIL import Image
+
+from blog.utils.images import WEBP_VARIANT_WIDTHS, _variant_name
+
+logger = logging.getLogger(__name__)
+
+
+def record_existing_variants(apps, schema_editor):  # noqa: ANN001, ANN201
+    """One-off scan of storage so existing posts get a manifest too."""
+    Post = apps.get_model("blog", "Post")
+    for post in Post.objects.exclude(featured_image="").exclude(featured_image=None):
+        storage = post.featured_image.storage
+        manifest = {}
+        for label in WEBP_VARIANT_WIDTHS:
+            name = _variant_name(post.featured_image.name, label)
+            try:
+                if not storage.exists(name):
+                    continue
+                with storage.open(name) as handle, Image.open(handle) as image:
+                    width, height = image.size
+                manifest[label] = {
+                    "name": name,
+                    "width": width,
+                    "height": height,
+                    "bytes": storage.size(name),
+                }
+            except Exception:
+                logger.exception("Failed inspecting variant %s", name)
+        if manifest:
+            Post.objects.filter(pk=post.pk).update(featured_image_variants=manifest)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0008_post_content_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="featured_image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="Featured image variants",
+            ),
+        ),
+        migrations.RunPython(record_existing_variants, migrations.RunPython.noop),
+    ]
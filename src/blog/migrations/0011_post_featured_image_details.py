@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2025-11-29 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0010_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="featured_image_color",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=7,
+                verbose_name="Featured image colour",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="featured_image_height",
+            field=models.PositiveIntegerField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Featured image height",
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="featured_image_placeholder",
+            field=models.TextField(
+                blank=True, editable=False, verbose_name="Featured image placeholder"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="featured_image_width",
+            field=models.PositiveIntegerField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Featured image width",
+            ),
+        ),
+    ]
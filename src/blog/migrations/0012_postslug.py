@@ -0,0 +1,83 @@
+# Generated by Django 5.2.7 on 2025-11-30 11:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def record_current_slugs(apps, schema_editor):  # noqa: ANN001, ANN201
+    """Seed the history with the slugs every post currently has."""
+    Post = apps.get_model("blog", "Post")
+    PostSlug = apps.get_model("blog", "PostSlug")
+    codes = [code for code, _label in settings.LANGUAGES]
+    rows = []
+    for pk, slug, *localized in Post.objects.values_list(
+        "pk", "slug", *(f"slug_{code}" for code in codes)
+    ):
+        rows.append(PostSlug(post_id=pk, lang="", slug=slug))
+        rows += [
+            PostSlug(post_id=pk, lang=code, slug=local)
+            for code, local in zip(codes, localized, strict=True)
+            if local
+        ]
+    PostSlug.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0011_post_featured_image_details"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostSlug",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "lang",
+                    models.CharField(blank=True, max_length=8, verbose_name="Language"),
+                ),
+                (
+                    "slug",
+                    models.SlugField(
+                        db_index=False, max_length=320, verbose_name="Slug"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Post slug",
+                "verbose_name_plural": "Post slugs",
+                "ordering": ["pk"],
+            },
+        ),
+        migrations.AddField(
+            model_name="postslug",
+            name="post",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="slug_history",
+                to="blog.post",
+                verbose_name="Post",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="postslug",
+            constraint=models.UniqueConstraint(
+                fields=("slug", "lang"), name="blog_postslug_unique_slug_lang"
+            ),
+        ),
+        migrations.RunPython(record_current_slugs, migrations.RunPython.noop),
+    ]
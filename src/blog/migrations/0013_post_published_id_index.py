@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2025-12-01 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0012_postslug"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="post",
+            options={"ordering": ["-published_at", "-id"]},
+        ),
+        migrations.RemoveIndex(
+            model_name="post",
+            name="blog_post_publish_698bc0_idx",
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-published_at", "-id"], name="blog_post_published_id_idx"
+            ),
+        ),
+    ]
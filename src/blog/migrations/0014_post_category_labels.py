@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2025-12-02 10:40
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_category_labels(apps, schema_editor):  # noqa: ANN001, ANN201
+    """Store the category names of existing posts, per language."""
+    Post = apps.get_model("blog", "Post")
+    codes = [code for code, _label in settings.LANGUAGES]
+    fallbacks = settings.MODELTRANSLATION_FALLBACK_LANGUAGES
+    names = defaultdict(lambda: defaultdict(list))
+    rows = Post.categories.through.objects.values_list(
+        "post_id", *(f"category__name_{code}" for code in codes)
+    )
+    for post_id, *localized in rows:
+        by_code = dict(zip(codes, localized, strict=True))
+        for code in codes:
+            name = next((by_code[c] for c in (code, *fallbacks) if by_code.get(c)), "")
+            names[post_id][code].append(name)
+    for post_id, labels in names.items():
+        Post.objects.filter(pk=post_id).update(
+            category_labels={code: sorted(values) for code, values in labels.items()}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0013_post_published_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="category_labels",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="Category labels"
+            ),
+        ),
+        migrations.RunPython(fill_category_labels, migrations.RunPython.noop),
+    ]
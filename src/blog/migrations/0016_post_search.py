@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2025-12-04 16:15
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+from blog.utils.search import create_search_index, drop_search_index, index_posts
+
+
+def build_search_index(apps, schema_editor):  # noqa: ANN001, ANN201
+    """Create the GIN indexes or FTS5 tables and index existing posts."""
+    create_search_index(schema_editor)
+    Post = apps.get_model("blog", "Post")
+    index_posts(Post.objects.using(schema_editor.connection.alias).all())
+
+
+def remove_search_index(apps, schema_editor):  # noqa: ANN001, ANN201
+    drop_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0015_post_public_order_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector_en",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="search_vector_uk",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(build_search_index, remove_search_index),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2025-12-05 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0016_post_search"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="job",
+            name="kind",
+            field=models.CharField(
+                choices=[
+                    ("generate_image_variants", "Generate image variants"),
+                    ("delete_image_variants", "Delete image variants"),
+                    ("warm_pages", "Warm cached pages"),
+                ],
+                max_length=64,
+                verbose_name="Kind",
+            ),
+        ),
+    ]
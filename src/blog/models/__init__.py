@@ -1,4 +1,6 @@
 from .categories import Category
+from .jobs import Job
 from .posts import Post
+from .slugs import PostSlug
 
-__all__ = ["Post", "Category"]
+__all__ = ["Post", "Category", "Job", "PostSlug"]
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models.query import ValuesIterable
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import get_language
+
+# Translated columns a card reads, per language.
+CARD_TRANSLATED_FIELDS = ("title", "excerpt", "reading_time")
+
+
+def _language_codes() -> list[str]:
+    return [code for code, _label in settings.LANGUAGES]
+
+
+def card_fields() -> list[str]:
+    """Return the columns :meth:`PostPublicQuerySet.cards` selects."""
+    codes = _language_codes()
+    return [
+        "pk",
+        "slug",
+        *(f"slug_{code}" for code in codes),
+        *(f"{name}_{code}" for name in CARD_TRANSLATED_FIELDS for code in codes),
+        "published_at",
+        "updated_at",
+        "category_labels",
+    ]
+
+
+def _localized(row: Mapping[str, object], name: str, lang: str) -> object:
+    """Return ``name`` in ``lang``, falling back like modeltranslation does."""
+    for code in (lang, *settings.MODELTRANSLATION_FALLBACK_LANGUAGES):
+        value = row.get(f"{name}_{code}")
+        if value not in (None, ""):
+            return value
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class PostCard:
+    """What list-style pages show of a post, read without the post's content.
+
+    Titles and excerpts are resolved for the language active when the card was
+    loaded; ``slugs`` holds the canonical slug of every language.
+    """
+
+    pk: int
+    title: str
+    slug: str
+    slugs: dict[str, str]
+    published_at: datetime | None
+    updated_at: datetime
+    excerpt: str
+    reading_time: int
+    categories: tuple[str, ...]
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, object], lang: str) -> PostCard:
+        slug = str(row["slug"])
+        return cls(
+            pk=int(str(row["pk"])),
+            title=str(_localized(row, "title", lang) or ""),
+            slug=slug,
+            slugs={
+                code: str(row.get(f"slug_{code}") or slug) for code in _language_codes()
+            },
+            published_at=row["published_at"],  # type: ignore[arg-type]
+            updated_at=row["updated_at"],  # type: ignore[arg-type]
+            excerpt=str(_localized(row, "excerpt", lang) or ""),
+            reading_time=int(str(_localized(row, "reading_time", lang) or 0)),
+            categories=tuple(
+                localized_labels(row["category_labels"] or {}, lang)  # type: ignore[arg-type]
+            ),
+        )
+
+    @property
+    def url(self) -> str:
+        """Detail URL under the slug of the active language (no redirect)."""
+        lang = get_language() or settings.LANGUAGE_CODE
+        return reverse("post_detail", kwargs={"slug": self.slugs.get(lang, self.slug)})
+
+    def get_absolute_url(self) -> str:
+        return reverse("post_detail", kwargs={"slug": self.slug})
+
+
+def localized_labels(labels: Mapping[str, list[str]], lang: str) -> list[str]:
+    """Pick the category labels of ``lang`` from ``Post.category_labels``."""
+    for code in (lang, *settings.MODELTRANSLATION_FALLBACK_LANGUAGES):
+        if code in labels:
+            return labels[code]
+    return []
+
+
+def build_category_labels(post_ids: list[int]) -> dict[int, dict[str, list[str]]]:
+    """Compute ``Post.category_labels`` for ``post_ids`` in one query.
+
+    Every language gets the sorted names of the post's categories, each
+    falling back across languages the way modeltranslation does.
+    """
+    from .posts import Post
+
+    codes = _language_codes()
+    rows = Post.categories.through.objects.filter(post_id__in=post_ids).values(
+        "post_id", *(f"category__name_{code}" for code in codes)
+    )
+    names: defaultdict[int, list[dict[str, object]]] = defaultdict(list)
+    for row in rows:
+        names[row["post_id"]].append(
+            {f"name_{code}": row[f"category__name_{code}"] for code in codes}
+        )
+    return {
+        post_id: {
+            code: sorted(
+                str(_localized(name, "name", code) or "") for name in post_names
+            )
+            for code in codes
+        }
+        for post_id, post_names in names.items()
+    }
+
+
+def refresh_category_labels(post_ids: Iterable[int]) -> int:
+    """Recompute ``category_labels`` of these posts from their categories.
+
+    Drafts and scheduled posts are refreshed too, so they go live with
+    current labels. Only rows whose labels changed are written; their
+    ``updated_at`` moves too, so the pages showing them get new validators.
+    Returns the number of posts updated.
+    """
+    from .posts import Post
+
+    rows = list(
+        Post.objects.filter(pk__in=post_ids)
+        .order_by()
+        .values_list("pk", "category_labels")
+    )
+    labels = build_category_labels([pk for pk, _current in rows])
+    now = timezone.now()
+    changed = [
+        Post(pk=pk, category_labels=labels.get(pk, {}), updated_at=now)
+        for pk, current in rows
+        if labels.get(pk, {}) != current
+    ]
+    Post.objects.bulk_update(changed, ["category_labels", "updated_at"])
+    return len(changed)
+
+
+class PostCardIterable(ValuesIterable):
+    """Yield :class:`PostCard` objects for the rows of a ``values()`` query."""
+
+    def __iter__(self) -> Iterator[PostCard]:  # type: ignore[override]
+        lang = get_language() or settings.LANGUAGE_CODE
+        for row in super().__iter__():
+            yield PostCard.from_row(row, lang)
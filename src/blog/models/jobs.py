@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+# A job left RUNNING longer than this is assumed to belong to a crashed worker
+# and becomes claimable again.
+JOB_LOCK_TIMEOUT = timedelta(minutes=15)
+# Recorded on a job whose worker stopped before finishing it.
+STALE_JOB_ERROR = "Worker stopped while running the job (lock expired)"
+
+
+class JobManager(models.Manager["Job"]):
+    def enqueue(
+        self,
+        kind: str,
+        *,
+        payload: dict[str, object] | None = None,
+        post: models.Model | None = None,
+        dedupe_key: str = "",
+        run_after: datetime | None = None,
+    ) -> "Job":
+        """Queue a job, folding it into a pending job with the same dedupe key.
+
+        While a job with ``dedupe_key`` is still pending, enqueueing again only
+        refreshes its payload, so repeated saves of a post leave one job that
+        acts on the latest state.
+        """
+        payload = payload or {}
+        run_after = run_after or timezone.now()
+        for _attempt in range(2):
+            try:
+                with transaction.atomic():
+                    if dedupe_key:
+                        pending = (
+                            self.select_for_update()
+                            .filter(dedupe_key=dedupe_key, status=Job.Status.PENDING)
+                            .first()
+                        )
+                        if pending is not None:
+                            pending.payload = payload
+                            pending.run_after = run_after
+                            pending.save(
+                                update_fields=["payload", "run_after", "updated_at"]
+                            )
+                            return pending
+                    return self.create(
+                        kind=kind,
+                        payload=payload,
+                        post=post,
+                        dedupe_key=dedupe_key,
+                        run_after=run_after,
+                    )
+            except IntegrityError:
+                # A concurrent enqueue created the pending job first; retry to
+                # fold into it.
+                continue
+        raise IntegrityError(f"Could not enqueue job with dedupe key {dedupe_key!r}")
+
+    def claim_next(self) -> "Job | None":
+        """Lock and mark the next due job as running, or return ``None``.
+
+        A job reclaimed from a crashed worker (RUNNING past
+        ``JOB_LOCK_TIMEOUT``) counts its lost run as a failed attempt. It is
+        marked FAILED instead of run again once that used up its attempts.
+        """
+        now = timezone.now()
+        while True:
+            with transaction.atomic():
+                job = (
+                    self.select_for_update(skip_locked=True)
+                    .filter(
+                        Q(status=Job.Status.PENDING, run_after__lte=now)
+                        | Q(
+                            status=Job.Status.RUNNING,
+                            locked_at__lt=now - JOB_LOCK_TIMEOUT,
+                        )
+                    )
+                    .order_by("run_after", "pk")
+                    .first()
+                )
+                if job is None:
+                    return None
+                if job.status == Job.Status.RUNNING:
+                    job.last_error = STALE_JOB_ERROR
+                    if job.attempts >= job.max_attempts:
+                        job.status = Job.Status.FAILED
+                        job.locked_at = None
+                        job.save(
+                            update_fields=[
+                                "status",
+                                "locked_at",
+                                "last_error",
+                                "updated_at",
+                            ]
+                        )
+                        continue
+                job.status = Job.Status.RUNNING
+                job.locked_at = now
+                job.attempts += 1
+                job.save(
+                    update_fields=[
+                        "status",
+                        "locked_at",
+                        "attempts",
+                        "last_error",
+                        "updated_at",
+                    ]
+                )
+            return job
+
+
+class Job(models.Model):
+    """A unit of background work processed by the ``run_jobs`` worker."""
+
+    class Kind(models.TextChoices):
+        GENERATE_IMAGE_VARIANTS = (
+            "generate_image_variants",
+            _("Generate image variants"),
+        )
+        DELETE_IMAGE_VARIANTS = "delete_image_variants", _("Delete image variants")
+        WARM_PAGES = "warm_pages", _("Warm cached pages")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    kind = models.CharField(_("Kind"), max_length=64, choices=Kind.choices)
+    payload = models.JSONField(_("Payload"), default=dict, blank=True)
+    post = models.ForeignKey(
+        "Post",
+        verbose_name=_("Post"),
+        related_name="jobs",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    dedupe_key = models.CharField(_("Dedupe key"), max_length=255, blank=True)
+    status = models.CharField(
+        _("Status"), max_length=16, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(_("Attempts"), default=0)
+    max_attempts = models.PositiveSmallIntegerField(_("Max attempts"), default=5)
+    run_after = models.DateTimeField(_("Run after"), default=timezone.now)
+    locked_at = models.DateTimeField(_("Locked at"), null=True, blank=True)
+    last_error = models.TextField(_("Last error"), blank=True)
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
+
+    objects: JobManager = JobManager()
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = _("Job")
+        verbose_name_plural = _("Jobs")
+        indexes = [
+            models.Index(fields=["status", "run_after"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=Q(status="pending") & ~Q(dedupe_key=""),
+                name="blog_job_unique_pending_dedupe_key",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} #{self.pk} ({self.status})"
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (self.Status.PENDING, self.Status.RUNNING)
@@ -1,22 +1,44 @@
 from __future__ import annotations
 
-import re
+from datetime import datetime
+from typing import Any, Iterable, cast
 
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Q
+from django.db.models import Case, Count, Min, Q, Value, When
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import strip_tags
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
-from markdown import markdown
 from typing_extensions import Self
 
 from ..utils.images import (
-    WEBP_VARIANT_WIDTHS,
-    delete_webp_variants,
-    generate_webp_variants,
-    get_variant_urls,
+    VARIANT_FORMATS,
+    GeneratedVariants,
+    ImageDetails,
+    VariantManifest,
+    build_srcset,
+    delete_image_variants,
+    generate_image_variants,
+    largest_variant_url,
+    normalize_manifest,
 )
+from ..utils.page_cache import bump_page_cache_version
+from ..utils.redirects import invalidate_slug_redirects
+from ..utils.rendering import get_renderer, render_markdown, summarize_html
+from ..utils.search import index_posts
+from .cards import PostCardIterable, card_fields, localized_labels
+from .jobs import Job
+from .slugs import PostSlug
+
+
+def _published_count_aggregates() -> dict[str, Count | Min]:
+    now = timezone.now()
+    return {
+        "count": Count("pk", filter=Q(published_at__lte=now)),
+        "upcoming": Min("published_at", filter=Q(published_at__gt=now)),
+    }
 
 
 class PostPublicQuerySet(models.QuerySet["Post"]):
@@ -33,6 +55,32 @@ class PostPublicQuerySet(models.QuerySet["Post"]):
             published_at__lte=now,
         )
 
+    def cards(self) -> "Self":
+        """Return the rows as :class:`PostCard` objects instead of posts.
+
+        Only the columns list-style pages show are selected (no Markdown or
+        HTML); category names come from ``category_labels``, so a page of
+        cards is a single query. The result is still a lazy queryset, so it
+        can be counted, sliced and paginated.
+        """
+        clone = self.values(*card_fields())
+        clone._iterable_class = PostCardIterable
+        return clone
+
+    def published_count(self) -> tuple[int, datetime | None]:
+        """Count published posts and find the next scheduled publication.
+
+        Both come from one query; the count stays valid until that moment
+        (or until posts are saved or deleted).
+        """
+        totals = self.aggregate(**_published_count_aggregates())
+        return totals["count"], totals["upcoming"]
+
+    async def apublished_count(self) -> tuple[int, datetime | None]:
+        """Async :meth:`published_count`."""
+        totals = await self.aaggregate(**_published_count_aggregates())
+        return totals["count"], totals["upcoming"]
+
     def for_slug(self, slug: str, lang: str | None = None) -> "Self":
         """Filter *published* posts by their slug.
 
@@ -47,6 +95,59 @@ class PostPublicQuerySet(models.QuerySet["Post"]):
             return qs.filter(**filter_kwargs)
         return qs.filter(Q(slug=slug) | Q(slug_en=slug) | Q(slug_uk=slug))
 
+    def matching_slug(self, slug: str, lang: str) -> "Self":
+        """Return the published posts using ``slug``, best match first.
+
+        Every slug column is unique (and therefore indexed), and former slugs
+        are found through the ``(slug, lang)`` index of :class:`PostSlug`. The
+        candidates are collected as a ``UNION`` of those index lookups rather
+        than one ``OR`` spanning both tables, which PostgreSQL could only
+        answer with a sequential scan. Each post carries a
+        ``matched_slug_lang`` attribute naming the language whose slug matched
+        (``""`` when only the base ``slug`` did); a match in ``lang`` comes
+        before other languages. Slugs the post no longer uses come last, with
+        ``matched_slug_lang`` ``None``.
+        """
+        codes = [lang, *(code for code, _label in settings.LANGUAGES if code != lang)]
+        current = Q(slug=slug)
+        for code in codes:
+            current |= Q(**{f"slug_{code}": slug})
+        candidates = (
+            Post.objects.filter(current)
+            .values("pk")
+            .union(PostSlug.objects.filter(slug=slug).values("post_id"))
+        )
+        matched = Case(
+            *(When(**{f"slug_{code}": slug}, then=Value(code)) for code in codes),
+            When(slug=slug, then=Value("")),
+            default=Value(None),
+            output_field=models.CharField(null=True),
+        )
+        return (
+            self.published()
+            .filter(pk__in=candidates)
+            .annotate(matched_slug_lang=matched)
+            .order_by(
+                Case(
+                    When(matched_slug_lang=lang, then=Value(0)),
+                    When(matched_slug_lang__isnull=True, then=Value(2)),
+                    default=Value(1),
+                ),
+                "pk",
+            )
+        )
+
+    def resolve_slug(self, slug: str, lang: str) -> "Post | None":
+        """Find a published post by any of its slugs in a single query.
+
+        See :meth:`matching_slug` for how slugs are matched and ranked.
+        """
+        return self.matching_slug(slug, lang).first()
+
+    async def aresolve_slug(self, slug: str, lang: str) -> "Post | None":
+        """Async :meth:`resolve_slug`."""
+        return await self.matching_slug(slug, lang).afirst()
+
 
 class PostPublicManager(models.Manager["Post"]):
     def get_queryset(self) -> PostPublicQuerySet:
@@ -67,6 +168,30 @@ class PostPublicManager(models.Manager["Post"]):
         """
         return self.get_queryset().for_slug(slug, lang)
 
+    def resolve_slug(self, slug: str, lang: str) -> "Post | None":
+        """
+        Shortcut to find a published post by any of its slugs.
+        """
+        return self.get_queryset().resolve_slug(slug, lang)
+
+    async def aresolve_slug(self, slug: str, lang: str) -> "Post | None":
+        """
+        Async shortcut to find a published post by any of its slugs.
+        """
+        return await self.get_queryset().aresolve_slug(slug, lang)
+
+    def published_count(self) -> tuple[int, datetime | None]:
+        """
+        Shortcut to count published posts along with the next publication time.
+        """
+        return self.get_queryset().published_count()
+
+    async def apublished_count(self) -> tuple[int, datetime | None]:
+        """
+        Async shortcut to count published posts and find the next publication.
+        """
+        return await self.get_queryset().apublished_count()
+
 
 class Post(models.Model):
     title = models.CharField(_("Title"), max_length=300)
@@ -80,9 +205,47 @@ class Post(models.Model):
         _("Slug (Ukrainian)"), max_length=320, unique=True, null=True, blank=True
     )
     content = models.TextField(_("Content"), blank=True, null=False)
+    # Markdown is rendered once on save and stored per language (via
+    # modeltranslation) so public pages only read a column.
+    content_html = models.TextField(
+        _("Rendered content"), blank=True, default="", editable=False
+    )
+    content_html_version = models.PositiveSmallIntegerField(
+        _("Renderer version"), default=0, editable=False
+    )
+    # Plain-text facts derived from ``content_html`` at the same time, so list
+    # cards, meta tags and JSON-LD never strip tags at request time.
+    excerpt = models.CharField(
+        _("Excerpt"), max_length=160, blank=True, default="", editable=False
+    )
+    word_count = models.PositiveIntegerField(_("Word count"), default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(
+        _("Reading time (minutes)"), default=0, editable=False
+    )
     featured_image = models.ImageField(
         _("Featured image"), upload_to="posts/featured/", null=True, blank=True
     )
+    # Manifest of generated variants (format -> label -> name/width/height/
+    # bytes), so templates build srcsets without asking the storage backend
+    # what exists.
+    featured_image_variants = models.JSONField(
+        _("Featured image variants"), default=dict, blank=True, editable=False
+    )
+    # Intrinsic size, average colour and an inline blurred placeholder of the
+    # original, recorded with the variants. Plain columns rather than
+    # ``ImageField.width_field``, which would open the file on every save.
+    featured_image_width = models.PositiveIntegerField(
+        _("Featured image width"), null=True, blank=True, editable=False
+    )
+    featured_image_height = models.PositiveIntegerField(
+        _("Featured image height"), null=True, blank=True, editable=False
+    )
+    featured_image_color = models.CharField(
+        _("Featured image colour"), max_length=7, blank=True, editable=False
+    )
+    featured_image_placeholder = models.TextField(
+        _("Featured image placeholder"), blank=True, editable=False
+    )
     published_at = models.DateTimeField(_("Published at"), null=True, blank=True)
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
@@ -92,15 +255,34 @@ class Post(models.Model):
         related_name="posts",
         blank=True,
     )
-    FEATURED_IMAGE_VARIANTS = tuple(WEBP_VARIANT_WIDTHS.keys())
+    # Sorted category names per language ({"en": [...], "uk": [...]}), kept
+    # in sync by ``blog.signals`` so pages show categories without a join.
+    category_labels = models.JSONField(
+        _("Category labels"), default=dict, blank=True, editable=False
+    )
+    # Full-text search vectors per language, maintained by
+    # ``blog.utils.search`` (PostgreSQL only; other databases use FTS5 tables).
+    search_vector_en = SearchVectorField(null=True, editable=False)
+    search_vector_uk = SearchVectorField(null=True, editable=False)
+    # Rendered width of the featured image: the 700px ``.container`` minus
+    # its 1rem padding on each side on narrower screens.
+    FEATURED_IMAGE_SIZES = "(max-width: 732px) calc(100vw - 2rem), 700px"
 
     objects: models.Manager["Post"] = models.Manager()
     public: PostPublicManager = PostPublicManager()
 
     class Meta:
-        ordering = ["-published_at", "-created_at"]
+        # ``id`` breaks ties so the order is total; cursor pagination
+        # (``blog.utils.pagination``) relies on it.
+        ordering = ["-published_at", "-id"]
         indexes = [
-            models.Index(fields=["published_at"]),
+            # Serves ``published()`` in list order: drafts (no date) are left
+            # out, so the index only grows with published and scheduled posts.
+            models.Index(
+                fields=["-published_at", "-id"],
+                condition=Q(published_at__isnull=False),
+                name="blog_post_public_order_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -109,81 +291,260 @@ class Post(models.Model):
     def get_absolute_url(self) -> str:
         return reverse("post_detail", kwargs={"slug": self.slug})
 
-    @property
-    def content_html(self) -> str:
-        """Return the post content rendered from Markdown to HTML.
-
-        The raw Markdown is stored in the ``content`` TextField. For rendering,
-        we convert it to HTML on the backend so the public frontend never needs
-        to load any Markdown libraries.
-        """
-
-        if not self.content:
-            return ""
+    @classmethod
+    def rendered_content_fields(cls) -> list[str]:
+        """Return the stored columns written by :meth:`render_content`."""
+        translated = ("content_html", "excerpt", "word_count", "reading_time")
+        fields = [*translated, "content_html_version"]
+        fields += [
+            f"{name}_{code}"
+            for name in translated
+            for code, _label in settings.LANGUAGES
+        ]
+        return fields
 
-        # Basic backwards-compatibility: if the content already looks like HTML,
-        # don't re-run it through the Markdown renderer.
-        if "<" in self.content and re.search(r"<[a-zA-Z][^>]*>", self.content):
-            return self.content
+    def render_content(self) -> None:
+        """Render the Markdown of every language into the stored HTML columns.
 
-        return markdown(self.content)
+        The raw Markdown is stored in the ``content_*`` fields; the public
+        frontend only ever reads the pre-rendered ``content_html_*`` columns
+        (and the excerpt/word count/reading time derived from them), so it
+        never needs to load any Markdown libraries.
+        """
+        renderer = get_renderer()
+        for code, _label in settings.LANGUAGES:
+            html = render_markdown(getattr(self, f"content_{code}", None), renderer)
+            summary = summarize_html(html)
+            setattr(self, f"content_html_{code}", html)
+            setattr(self, f"excerpt_{code}", summary.excerpt)
+            setattr(self, f"word_count_{code}", summary.word_count)
+            setattr(self, f"reading_time_{code}", summary.reading_time)
+        self.content_html_version = renderer.version
 
     def save(self, *args: object, **kwargs: object) -> None:  # type: ignore[override]
+        update_fields = cast("Iterable[str] | None", kwargs.get("update_fields"))
+        if update_fields is None:
+            self.render_content()
+        elif any(name.startswith("content") for name in update_fields):
+            self.render_content()
+            kwargs["update_fields"] = {*update_fields, *self.rendered_content_fields()}
+
         previous_image: str | None = None
+        previous_variants: dict[str, object] = {}
+        previous_slugs: list[str] = []
+        codes = [code for code, _label in settings.LANGUAGES]
+        slug_fields = ["slug", *(f"slug_{code}" for code in codes)]
+        # The search index is built from these.
+        text_fields = [
+            f"{name}_{code}" for name in ("title", "content_html") for code in codes
+        ]
+        vector_fields = [f"search_vector_{code}" for code in codes]
+        previous: dict[str, Any] | None = None
         if self.pk:
-            previous_image = (
+            previous = (
                 Post.objects.filter(pk=self.pk)
-                .values_list("featured_image", flat=True)
+                .values(
+                    "featured_image",
+                    "featured_image_variants",
+                    *text_fields,
+                    *vector_fields,
+                    *slug_fields,
+                )
                 .first()
             )
+        if previous is not None:
+            previous_image = previous["featured_image"]
+            previous_variants = previous["featured_image_variants"]
+            previous_slugs = [previous[name] or "" for name in slug_fields]
+            if update_fields is None:
+                # A full save writes every column; keep the stored vectors
+                # rather than whatever this instance last read.
+                for name in vector_fields:
+                    setattr(self, name, previous[name])
+        text_changed = previous is None or any(
+            getattr(self, name) != previous[name] for name in text_fields
+        )
+        new_image = self.featured_image.name if self.featured_image else None
+        if previous_image != new_image:
+            # Variants of the old image are stale; until new ones exist the
+            # templates fall back to the original upload.
+            self.featured_image_variants = {}
+            self._apply_featured_image_details(None)
         super().save(*args, **kwargs)
-        self._sync_featured_image_variants(previous_image)
+        if [slug for _lang, slug in self._slugs()] != previous_slugs:
+            # Earlier slugs stay recorded, so their URLs keep redirecting.
+            PostSlug.objects.record(self, self._slugs())
+        invalidate_slug_redirects()
+        if text_changed and (
+            update_fields is None
+            or any(name.startswith(("title", "content")) for name in update_fields)
+        ):
+            index_posts(Post.objects.filter(pk=self.pk))
+        self._sync_featured_image_variants(previous_image, previous_variants)
 
     def delete(self, *args: object, **kwargs: object) -> None:  # type: ignore[override]
         current_image = self.featured_image.name if self.featured_image else None
-        storage = self._meta.get_field("featured_image").storage
+        current_variants = self.featured_image_variants
         super().delete(*args, **kwargs)
+        invalidate_slug_redirects()
         if current_image:
-            delete_webp_variants(current_image, storage, self.FEATURED_IMAGE_VARIANTS)
+            self._discard_featured_image_variants(current_image, current_variants)
+
+    def _slugs(self) -> list[tuple[str, str]]:
+        """Return ``(lang, slug)`` for the base slug and every localized one."""
+        return [
+            ("", self.slug),
+            *(
+                (code, getattr(self, f"slug_{code}", None) or "")
+                for code, _label in settings.LANGUAGES
+            ),
+        ]
 
-    def _sync_featured_image_variants(self, previous_image: str | None) -> None:
-        storage = self._meta.get_field("featured_image").storage
+    def _sync_featured_image_variants(
+        self, previous_image: str | None, previous_variants: dict[str, object]
+    ) -> None:
         new_image = self.featured_image.name if self.featured_image else None
+        if previous_image == new_image:
+            return
 
-        if previous_image and previous_image != new_image:
-            delete_webp_variants(previous_image, storage, self.FEATURED_IMAGE_VARIANTS)
+        if previous_image:
+            self._discard_featured_image_variants(previous_image, previous_variants)
 
-        if not self.featured_image or not new_image:
+        if not new_image:
             return
 
-        if previous_image == new_image:
-            return
+        if settings.BACKGROUND_JOBS_ENABLED:
+            # One pending job per post: saving again before the worker gets
+            # to it only points the job at the latest image.
+            Job.objects.enqueue(
+                Job.Kind.GENERATE_IMAGE_VARIANTS,
+                payload={"image": new_image},
+                post=self,
+                dedupe_key=f"post:{self.pk}:image-variants",
+            )
+        else:
+            self.generate_featured_image_variants()
+
+    def _discard_featured_image_variants(
+        self, image_name: str, variants: dict[str, object]
+    ) -> None:
+        if settings.BACKGROUND_JOBS_ENABLED:
+            Job.objects.enqueue(
+                Job.Kind.DELETE_IMAGE_VARIANTS,
+                payload={"image": image_name, "variants": variants},
+                dedupe_key=f"image:{image_name}:delete-variants",
+            )
+        else:
+            storage = self._meta.get_field("featured_image").storage
+            delete_image_variants(image_name, storage, variants)
+
+    def generate_featured_image_variants(
+        self, *, strict: bool = False
+    ) -> VariantManifest:
+        """Generate variants of the current featured image and record them."""
+        image_name = self.featured_image.name if self.featured_image else None
+        if not image_name:
+            return {}
+        generated = generate_image_variants(self.featured_image, strict=strict)
+        return self.store_featured_image_variants(image_name, generated)
+
+    def store_featured_image_variants(
+        self, image_name: str, generated: GeneratedVariants
+    ) -> VariantManifest:
+        """Record generated variants for ``image_name`` without a full save.
+
+        The manifest and image details are only written while the row still
+        points at the same image; if it was replaced in the meantime the fresh
+        files are removed again and an empty manifest is returned.
+        """
+        manifest = generated.manifest
+        if not manifest:
+            return manifest
+        fields = self._apply_featured_image_details(generated.details)
+        fields["featured_image_variants"] = manifest
+        # The page changes (srcset, dimensions), so its validators must too.
+        fields["updated_at"] = timezone.now()
+        updated = Post.objects.filter(pk=self.pk, featured_image=image_name).update(
+            **fields
+        )
+        if not updated:
+            storage = self._meta.get_field("featured_image").storage
+            delete_image_variants(image_name, storage, manifest)
+            return {}
+        # A queryset update sends no post_save; pages still point at the
+        # original upload.
+        bump_page_cache_version()
+        self.featured_image_variants = manifest
+        return manifest
+
+    def _apply_featured_image_details(
+        self, details: ImageDetails | None
+    ) -> dict[str, object]:
+        fields: dict[str, object] = {
+            "featured_image_width": details.width if details else None,
+            "featured_image_height": details.height if details else None,
+            "featured_image_color": details.color if details else "",
+            "featured_image_placeholder": details.placeholder if details else "",
+        }
+        for name, value in fields.items():
+            setattr(self, name, value)
+        return fields
 
-        generate_webp_variants(self.featured_image, WEBP_VARIANT_WIDTHS)
+    @property
+    def featured_image_sources(self) -> list[dict[str, str]]:
+        """Return ``<source>`` attributes (type, srcset), preferred format first."""
+        if not self.featured_image:
+            return []
+        storage = self.featured_image.storage
+        manifest = normalize_manifest(self.featured_image_variants)
+        sources = []
+        for fmt, spec in VARIANT_FORMATS.items():
+            srcset = build_srcset(storage, manifest, fmt)
+            if srcset:
+                sources.append({"type": spec.mime_type, "srcset": srcset})
+        return sources
 
     @property
     def featured_image_webp_srcset(self) -> str:
         if not self.featured_image:
             return ""
-        urls = get_variant_urls(self.featured_image, self.FEATURED_IMAGE_VARIANTS)
-        ordered = []
-        for label in self.FEATURED_IMAGE_VARIANTS:
-            url = urls.get(label)
-            if url:
-                ordered.append(f"{url} {label}")
-        return ", ".join(ordered)
+        return build_srcset(
+            self.featured_image.storage, self.featured_image_variants, "webp"
+        )
+
+    @property
+    def featured_image_placeholder_style(self) -> str:
+        """Inline style painting the colour and blurred preview under the image."""
+        declarations = []
+        if self.featured_image_color:
+            declarations.append(f"background-color: {self.featured_image_color}")
+        if self.featured_image_placeholder:
+            declarations.append(
+                f"background-image: url({self.featured_image_placeholder}); "
+                "background-size: cover"
+            )
+        return "; ".join(declarations)
+
+    @property
+    def category_names(self) -> list[str]:
+        """Category names in the active language, from ``category_labels``."""
+        lang = get_language() or settings.LANGUAGE_CODE
+        return localized_labels(self.category_labels, lang)
 
     @property
     def seo_description(self) -> str:
-        plain = strip_tags(self.content_html)
-        normalized = " ".join(plain.split())
-        return (normalized[:155] + "...") if len(normalized) > 155 else normalized
+        return self.excerpt
 
     def get_social_image_url(self) -> str | None:
         if not self.featured_image:
             return None
-        urls = get_variant_urls(self.featured_image, ("2x", "1x"))
-        return urls.get("2x") or urls.get("1x") or self.featured_image.url
+        # Social crawlers rarely understand AVIF; share the widest WebP.
+        return (
+            largest_variant_url(
+                self.featured_image.storage, self.featured_image_variants, "webp"
+            )
+            or self.featured_image.url
+        )
 
     def build_json_ld(self, canonical_url: str) -> dict[str, object]:
         data: dict[str, object] = {
@@ -192,6 +553,7 @@ class Post(models.Model):
             "mainEntityOfPage": canonical_url,
             "headline": self.title,
             "description": self.seo_description,
+            "wordCount": self.word_count,
             "datePublished": (
                 self.published_at.isoformat() if self.published_at else None
             ),
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class PostSlugManager(models.Manager["PostSlug"]):
+    def record(self, post: models.Model, slugs: Iterable[tuple[str, str]]) -> None:
+        """Point every ``(lang, slug)`` pair at ``post`` in a single query.
+
+        Pairs already recorded for another post are taken over: a slug belongs
+        to whichever post used it last.
+        """
+        rows = [
+            PostSlug(post=post, lang=lang, slug=slug) for lang, slug in slugs if slug
+        ]
+        if rows:
+            self.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["slug", "lang"],
+                update_fields=["post"],
+            )
+
+
+class PostSlug(models.Model):
+    """A slug a post is or was reachable under, kept so old URLs redirect.
+
+    ``lang`` is the language of a ``slug_<lang>`` field, or empty for the base
+    ``slug``.
+    """
+
+    post = models.ForeignKey(
+        "Post",
+        verbose_name=_("Post"),
+        related_name="slug_history",
+        on_delete=models.CASCADE,
+    )
+    lang = models.CharField(_("Language"), max_length=8, blank=True)
+    slug = models.SlugField(_("Slug"), max_length=320, db_index=False)
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+
+    objects: PostSlugManager = PostSlugManager()
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = _("Post slug")
+        verbose_name_plural = _("Post slugs")
+        constraints = [
+            # Slug first, so lookups by slug alone are served by this index.
+            models.UniqueConstraint(
+                fields=["slug", "lang"], name="blog_postslug_unique_slug_lang"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.lang or '-'}:{self.slug}"
@@ -0,0 +1,82 @@
+"""Send public page reads to read replicas and everything else to the primary.
+
+Reads leave the primary only inside a request that
+:class:`~blog.middleware.ReplicaMiddleware` marked as a public read. That is a
+GET or HEAD to a view decorated with :func:`replica_reads`, from a visitor
+who wrote nothing in the last ``REPLICA_PIN_SECONDS``. In such a request the
+blog's models are read from one replica, picked for the whole request, until
+the request itself writes. Sessions and users stay on the primary. So do
+writes, migrations, editor views, management commands and the job worker.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+# Set on responses to requests that wrote; pins that visitor to the primary.
+PRIMARY_READS_COOKIE = "primary_reads"
+# Apps whose models public requests read from replicas.
+REPLICA_APPS = frozenset({"blog"})
+
+ViewT = TypeVar("ViewT", bound=Callable[..., object])
+
+
+@dataclass(slots=True)
+class RequestRouting:
+    """Where the current request reads from, and whether it wrote."""
+
+    replica: str | None = None
+    wrote: bool = False
+
+
+request_routing: ContextVar[RequestRouting | None] = ContextVar(
+    "blog_request_routing", default=None
+)
+
+
+def replica_reads(view: ViewT) -> ViewT:
+    """Mark a public, read-only view whose queries may go to a replica.
+
+    Works like ``csrf_exempt``: apply it to function views, or with
+    ``method_decorator(replica_reads, name="dispatch")`` to class-based ones.
+    """
+    view.replica_reads = True  # type: ignore[attr-defined]
+    return view
+
+
+class ReplicaRouter:
+    """Database router for ``DATABASE_REPLICAS`` (see the module docstring)."""
+
+    def db_for_read(self, model: type[Model], **hints: object) -> str | None:
+        routing = request_routing.get()
+        if routing is None or routing.replica is None or routing.wrote:
+            return None
+        if model._meta.app_label not in REPLICA_APPS:
+            return None
+        return routing.replica
+
+    def db_for_write(self, model: type[Model], **hints: object) -> str:
+        routing = request_routing.get()
+        if routing is not None:
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: object) -> bool | None:
+        # Replicas hold the primary's rows, so objects read from any of them relate.
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: object) -> bool | None:
+        # Replicas receive the schema through replication.
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Category, Post
+from .models.cards import refresh_category_labels
+from .utils.page_cache import bump_page_cache_version
+from .utils.pagination import POST_COUNT_VERSION_KEY
+from .utils.schedule import reset_go_live_clock
+from .utils.search import unindex_posts
+from .utils.versions import bump_version
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=Post.categories.through)
+def invalidate_public_pages(sender: type, **kwargs: object) -> None:
+    """Drop cached public pages whenever posts or categories change."""
+    bump_page_cache_version()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_counts(sender: type, **kwargs: object) -> None:
+    """Saving can publish or unpublish a post; recount paginated lists."""
+    bump_version(POST_COUNT_VERSION_KEY)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def reset_publication_clock(sender: type, **kwargs: object) -> None:
+    """The post may have been (re)scheduled; find the next go-live again."""
+    reset_go_live_clock()
+
+
+@receiver(m2m_changed, sender=Post.categories.through)
+def refresh_labels_on_categories_change(
+    sender: type,
+    instance: Post | Category,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: object,
+) -> None:
+    """Keep ``Post.category_labels`` in step with the post/category links."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_category_labels([instance.pk])
+        return
+    # ``category.posts.clear()`` reports no ids, so remember them beforehand.
+    if action == "pre_clear":
+        instance._cleared_post_ids = list(  # type: ignore[union-attr]
+            instance.posts.values_list("pk", flat=True)  # type: ignore[union-attr]
+        )
+    elif action == "post_clear":
+        post_ids = instance.__dict__.pop("_cleared_post_ids", [])
+        refresh_category_labels(post_ids)
+    elif action in ("post_add", "post_remove"):
+        refresh_category_labels(pk_set or ())
+
+
+@receiver(post_save, sender=Category)
+def refresh_labels_on_category_save(
+    sender: type, instance: Category, created: bool, **kwargs: object
+) -> None:
+    """A renamed category changes the labels of every post in it."""
+    if not created:
+        refresh_category_labels(
+            instance.posts.values_list("pk", flat=True)  # type: ignore[attr-defined]
+        )
+
+
+@receiver(pre_delete, sender=Category)
+def collect_category_posts(sender: type, instance: Category, **kwargs: object) -> None:
+    # The links are gone by ``post_delete``, and deleting them sends no
+    # ``m2m_changed``.
+    instance._deleted_post_ids = list(instance.posts.values_list("pk", flat=True))  # type: ignore[attr-defined]
+
+
+@receiver(post_delete, sender=Category)
+def refresh_labels_on_category_delete(
+    sender: type, instance: Category, **kwargs: object
+) -> None:
+    post_ids = instance.__dict__.pop("_deleted_post_ids", [])
+    refresh_category_labels(post_ids)
+
+
+@receiver(post_delete, sender=Post)
+def remove_from_search_index(sender: type, instance: Post, **kwargs: object) -> None:
+    unindex_posts([instance.pk], using=str(kwargs.get("using") or "default"))
@@ -1,24 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 
 from django.contrib.sitemaps import Sitemap
 from django.db.models import QuerySet
 
 from .models import Post
+from .models.cards import PostCard
 
 
 class PostSitemap(Sitemap):
     changefreq = "weekly"
     priority = 0.8
 
-    def items(self) -> QuerySet[Post]:
-        return Post.public.published()
+    def __init__(self, cards: Sequence[PostCard] | None = None) -> None:
+        # Cards loaded beforehand (by the async sitemap view), if any.
+        self.cards = cards
 
-    def lastmod(self, obj: Post) -> datetime | None:
+    def items(self) -> QuerySet[Post] | Sequence[PostCard]:
+        if self.cards is not None:
+            return self.cards
+        # Cards carry the slug and dates without loading any content.
+        return Post.public.published().cards()
+
+    def lastmod(self, obj: PostCard) -> datetime | None:
         return obj.updated_at or obj.published_at
 
-    def location(self, obj: Post) -> str:
+    def location(self, obj: PostCard) -> str:
         return obj.get_absolute_url()
 
 
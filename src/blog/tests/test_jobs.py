@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db.models.signals import pre_save
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from blog.jobs import JOB_HANDLERS, process_jobs
+from blog.models import Job, Post
+from blog.models.jobs import STALE_JOB_ERROR
+from blog.utils.schedule import next_go_live
+
+
+def _make_test_image(name: str = "featured.jpg") -> SimpleUploadedFile:
+    buffer = BytesIO()
+    Image.new("RGB", (1600, 900), (40, 90, 160)).save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@pytest.fixture
+def background_jobs(settings, tmp_path):  # noqa: ANN001, ANN201
+    settings.MEDIA_ROOT = tmp_path
+    settings.BACKGROUND_JOBS_ENABLED = True
+    return settings
+
+
+# The worker closes stale connections each loop, so no test transaction.
+@pytest.mark.django_db(transaction=True)
+def test_post_save_queues_variant_job_instead_of_processing(background_jobs) -> None:
+    post = Post.objects.create(
+        title="Queued", slug="queued", content="", featured_image=_make_test_image()
+    )
+
+    variant_1x = Path(background_jobs.MEDIA_ROOT) / "posts/featured/featured@1x.webp"
+    assert not variant_1x.exists()
+    post.refresh_from_db()
+    assert post.featured_image_variants == {}
+    # Falls back to the original upload until the worker has run.
+    assert post.get_social_image_url() == post.featured_image.url
+
+    call_command("run_jobs", "--once", stdout=StringIO())
+
+    post.refresh_from_db()
+    assert variant_1x.exists()
+    assert set(post.featured_image_variants["webp"]) == {
+        "320w",
+        "640w",
+        "960w",
+        "1x",
+        "2x",
+    }
+    job = Job.objects.get(post=post)
+    assert job.status == Job.Status.DONE
+    assert job.attempts == 1
+
+
+@pytest.mark.django_db
+def test_repeated_saves_fold_into_one_pending_job(background_jobs) -> None:
+    post = Post.objects.create(
+        title="Dedupe", slug="dedupe", content="", featured_image=_make_test_image()
+    )
+    post.featured_image = _make_test_image("replacement.jpg")
+    post.save()
+
+    pending = Job.objects.filter(
+        kind=Job.Kind.GENERATE_IMAGE_VARIANTS, status=Job.Status.PENDING
+    )
+    assert pending.count() == 1
+    assert pending.get().payload["image"] == post.featured_image.name
+    assert Job.objects.filter(kind=Job.Kind.DELETE_IMAGE_VARIANTS).count() == 1
+
+    assert process_jobs() == 2
+    post.refresh_from_db()
+    assert post.featured_image_variants["webp"]["1x"]["name"].startswith(
+        "posts/featured/replacement@1x"
+    )
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried_then_marked_failed(background_jobs, monkeypatch) -> None:
+    def broken(job: Job) -> None:
+        raise OSError("storage unavailable")
+
+    monkeypatch.setitem(JOB_HANDLERS, Job.Kind.DELETE_IMAGE_VARIANTS, broken)
+    job = Job.objects.enqueue(
+        Job.Kind.DELETE_IMAGE_VARIANTS, payload={"image": "posts/featured/x.jpg"}
+    )
+    Job.objects.filter(pk=job.pk).update(max_attempts=2)
+
+    assert process_jobs() == 1
+    job.refresh_from_db()
+    assert job.status == Job.Status.PENDING
+    assert job.run_after > job.updated_at
+    assert "storage unavailable" in job.last_error
+
+    Job.objects.filter(pk=job.pk).update(run_after=job.updated_at)
+    assert process_jobs() == 1
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED
+    assert job.attempts == 2
+
+
+@pytest.mark.django_db
+def test_retry_racing_a_new_enqueue_marks_the_job_superseded(
+    background_jobs, monkeypatch
+) -> None:
+    def broken(job: Job) -> None:
+        raise OSError("storage unavailable")
+
+    monkeypatch.setitem(JOB_HANDLERS, Job.Kind.DELETE_IMAGE_VARIANTS, broken)
+    job = Job.objects.enqueue(
+        Job.Kind.DELETE_IMAGE_VARIANTS,
+        payload={"image": "posts/featured/x.jpg"},
+        dedupe_key="race",
+    )
+
+    def enqueue_before_retry(
+        sender: type[Job], instance: Job, **kwargs: object
+    ) -> None:
+        # Another process enqueues after the superseded check, before the save.
+        if instance.pk == job.pk and instance.status == Job.Status.PENDING:
+            Job.objects.bulk_create(
+                [Job(kind=Job.Kind.DELETE_IMAGE_VARIANTS, dedupe_key="race")]
+            )
+
+    pre_save.connect(enqueue_before_retry, sender=Job)
+    try:
+        assert process_jobs(limit=1) == 1
+    finally:
+        pre_save.disconnect(enqueue_before_retry, sender=Job)
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED
+    assert job.last_error.endswith("(superseded by a newer job)")
+
+
+@pytest.mark.django_db
+def test_reclaimed_stale_job_records_the_lost_run(background_jobs) -> None:
+    stale = timezone.now() - timedelta(hours=1)
+    job = Job.objects.enqueue(Job.Kind.WARM_PAGES, payload={"post_ids": []})
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.Status.RUNNING, locked_at=stale, attempts=1
+    )
+
+    claimed = Job.objects.claim_next()
+    assert claimed is not None and claimed.pk == job.pk
+    assert claimed.attempts == 2
+    assert claimed.last_error == STALE_JOB_ERROR
+
+    # A job whose worker keeps dying is not claimed past its last attempt.
+    Job.objects.filter(pk=job.pk).update(locked_at=stale, max_attempts=2)
+    assert Job.objects.claim_next() is None
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED
+    assert job.last_error == STALE_JOB_ERROR
+
+
+@pytest.mark.django_db
+def test_editor_shows_image_job_status(
+    client, django_user_model, background_jobs
+) -> None:
+    user = django_user_model.objects.create_user(
+        "editor",
+        password="pw",  # noqa: S106
+        is_superuser=True,
+    )
+    client.force_login(user)
+    post = Post.objects.create(
+        title="Status", slug="status", content="", featured_image=_make_test_image()
+    )
+
+    response = client.get(reverse("post_update", kwargs={"pk": post.pk}))
+
+    assert response.context["image_job"].status == Job.Status.PENDING
+    assert b"image-job-pending" in response.content
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_warms_the_pages_a_request_expired(
+    background_jobs, client, monkeypatch
+) -> None:
+    background_jobs.PAGE_CACHE_WARM_URL = "https://testserver"
+    now = timezone.now()
+    post = Post.objects.create(
+        title="Soon", slug="soon", content="", published_at=now + timedelta(minutes=5)
+    )
+    # Caching any public page starts the clock.
+    assert next_go_live() == post.published_at
+    monkeypatch.setattr(timezone, "now", lambda: now + timedelta(minutes=6))
+
+    # A visitor notices first; the request only expires the cached pages.
+    client.get(reverse("robots_txt"), secure=True)
+    assert not Job.objects.filter(kind=Job.Kind.WARM_PAGES).exists()
+
+    call_command("run_jobs", "--once", stdout=StringIO())
+
+    job = Job.objects.get(kind=Job.Kind.WARM_PAGES)
+    assert job.payload == {"post_ids": [post.pk]}
+    assert job.status == Job.Status.DONE
+    # Queued once per go-live.
+    call_command("run_jobs", "--once", stdout=StringIO())
+    assert Job.objects.filter(kind=Job.Kind.WARM_PAGES).count() == 1
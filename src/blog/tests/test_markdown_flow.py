@@ -3,11 +3,20 @@ from __future__ import annotations
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
 from django.test.client import Client
 from django.urls import reverse
 from django.utils import timezone, translation
 
 from blog.models import Post
+from blog.utils.preview import render_preview_blocks, split_blocks
+from blog.utils.rendering import (
+    RENDERER_VERSION,
+    build_renderer,
+    get_renderer,
+    render_markdown,
+)
 
 
 @pytest.mark.django_db
@@ -74,3 +83,92 @@ def test_markdown_roundtrip_model_and_view(client: Client) -> None:
     body_uk = resp_uk.content.decode()
     assert "Привіт UA" in body_uk
     assert "<strong>" in body_uk
+
+
+def test_python_markdown_renderer_reuses_parser_and_resets_state() -> None:
+    renderer = build_renderer("python-markdown", ("footnotes",))
+
+    first = renderer.render("Text[^1]\n\n[^1]: First note")
+    parser = renderer._parser()
+    second = renderer.render("Plain paragraph")
+
+    assert "First note" in first
+    # Footnotes from the previous document must not leak into the next one.
+    assert second == "<p>Plain paragraph</p>"
+    assert renderer._parser() is parser
+
+
+def test_renderer_version_tracks_backend_and_extensions(settings) -> None:
+    settings.MARKDOWN_BACKEND = "python-markdown"
+    settings.MARKDOWN_EXTENSIONS = []
+    assert get_renderer().version == RENDERER_VERSION
+
+    settings.MARKDOWN_EXTENSIONS = ["extra"]
+    assert get_renderer().version != RENDERER_VERSION
+    assert "<table>" in render_markdown("| a |\n|---|\n| b |")
+
+
+def test_unknown_markdown_backend_is_rejected() -> None:
+    with pytest.raises(ImproperlyConfigured):
+        build_renderer("no-such-engine")
+
+
+class _CountingRenderer:
+    name = "counting"
+    extensions: tuple[str, ...] = ()
+    version = 999
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def render(self, text: str) -> str:
+        self.calls.append(text)
+        return build_renderer().render(text)
+
+
+def test_split_blocks_keeps_fences_and_collects_link_references() -> None:
+    blocks, references = split_blocks(
+        "# Title\n\n```\na\n\nb\n```\n\n- item\n\n    more\n\n[ref]: https://x.test\n"
+    )
+    assert blocks == ["# Title", "```\na\n\nb\n```", "- item\n\n    more"]
+    assert references == ["[ref]: https://x.test"]
+
+
+def test_preview_of_loose_lists_and_quotes_matches_the_published_html() -> None:
+    cache.clear()
+    renderer = build_renderer()
+    text = (
+        "Intro\n\n- one\n\n- two\n\n    two, more\n\n- three\n\n"
+        "1. first\n\n2. second\n\n> quoted\n\n> quoted again\n\nOutro"
+    )
+
+    blocks = render_preview_blocks(text, renderer)
+
+    def squash(html: str) -> str:
+        return "".join(html.split())
+
+    assert squash("".join(block.html for block in blocks)) == squash(
+        renderer.render(text)
+    )
+    # The lists run together into one, as in the full document.
+    assert [block.html.count("<li>") for block in blocks] == [0, 5, 0, 0]
+
+
+def test_preview_rerenders_only_changed_blocks() -> None:
+    cache.clear()
+    renderer = _CountingRenderer()
+    paragraphs = [f"Paragraph {i} with **bold** text." for i in range(50)]
+
+    first = render_preview_blocks("\n\n".join(paragraphs), renderer)
+    assert len(first) == 50
+    assert len(renderer.calls) == 50
+
+    paragraphs[10] = "Edited *paragraph*."
+    renderer.calls.clear()
+    second = render_preview_blocks(
+        "\n\n".join(paragraphs), renderer, known=[block.key for block in first]
+    )
+
+    assert renderer.calls == ["Edited *paragraph*."]
+    assert second[10].html == "<p>Edited <em>paragraph</em>.</p>"
+    assert all(block.html == "" for i, block in enumerate(second) if i != 10)
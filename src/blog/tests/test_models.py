@@ -1,16 +1,42 @@
 from __future__ import annotations
 
+import importlib
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from io import BytesIO
+from io import BytesIO, StringIO
 from pathlib import Path
+from typing import Any
 from urllib.parse import unquote
 
 import pytest
+from django.apps import apps
+from django.contrib.postgres.search import SearchQuery
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from PIL import Image
 
-from blog.models import Category, Post
+from blog.models import Category, Post, PostSlug
+from blog.utils import images
+from blog.utils.images import _discard_encode_pool, _encode_variants, _open_for_widths
+from blog.utils.pagination import (
+    CURSOR_ORDERING,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from blog.utils.rendering import get_renderer
+from blog.utils.search import search_posts
+
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="PostgreSQL text search"
+)
 
 
 @pytest.mark.django_db
@@ -116,8 +142,8 @@ def test_post_generates_webp_variants(tmp_path, settings) -> None:
     assert variant_2x.exists()
     post.refresh_from_db()
     srcset = unquote(post.featured_image_webp_srcset)
-    assert "@1x.webp 1x" in srcset
-    assert "@2x.webp 2x" in srcset
+    assert "@1x.webp 1280w" in srcset
+    assert "@2x.webp 1600w" in srcset
 
 
 @pytest.mark.django_db
@@ -136,3 +162,558 @@ def test_post_removing_featured_image_cleans_variants(tmp_path, settings) -> Non
     post.save()
 
     assert not variant_1x.exists()
+
+
+@pytest.mark.django_db
+def test_post_save_stores_rendered_html_per_language() -> None:
+    post = Post.objects.create(title="Rendered", slug="rendered", content="")
+    setattr(post, "content_en", "Hello **EN**")
+    setattr(post, "content_uk", "Привіт **UK**")
+    post.save()
+
+    stored = Post.objects.get(pk=post.pk)
+    assert "<strong>EN</strong>" in getattr(stored, "content_html_en")
+    assert "<strong>UK</strong>" in getattr(stored, "content_html_uk")
+    assert stored.content_html_version == get_renderer().version
+
+
+@pytest.mark.django_db
+def test_rerender_posts_command_refreshes_stale_rows() -> None:
+    post = Post.objects.create(title="Stale", slug="stale", content="*old*")
+    Post.objects.filter(pk=post.pk).update(
+        content_html_en="<p>outdated</p>", content_html_version=0
+    )
+
+    call_command("rerender_posts", stdout=StringIO())
+
+    stored = Post.objects.get(pk=post.pk)
+    assert getattr(stored, "content_html_en") == "<p><em>old</em></p>"
+    assert stored.content_html_version == get_renderer().version
+
+
+@pytest.mark.django_db
+def test_post_save_stores_excerpt_word_count_and_reading_time() -> None:
+    words = " ".join(["word"] * 450)
+    post = Post.objects.create(title="Summary", slug="summary", content="")
+    setattr(post, "content_en", f"# Heading\n\n{words}")
+    setattr(post, "content_uk", "Коротко")
+    post.save()
+
+    stored = Post.objects.get(pk=post.pk)
+    assert getattr(stored, "word_count_en") == 451
+    assert getattr(stored, "reading_time_en") == 3
+    assert getattr(stored, "excerpt_en").startswith("Heading word word")
+    assert getattr(stored, "excerpt_en").endswith("...")
+    assert getattr(stored, "excerpt_uk") == "Коротко"
+    assert getattr(stored, "reading_time_uk") == 1
+    assert len(stored.seo_description) <= 158
+
+
+@pytest.mark.django_db
+def test_post_records_variant_manifest_and_skips_storage_lookups(
+    tmp_path, settings, monkeypatch
+) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    post = Post.objects.create(
+        title="Manifest",
+        slug="manifest",
+        content="",
+        featured_image=_make_test_image(size=(1600, 900)),
+    )
+
+    stored = Post.objects.get(pk=post.pk)
+    manifest = stored.featured_image_variants["webp"]
+    assert manifest["1x"]["name"] == "posts/featured/featured@1x.webp"
+    assert (manifest["1x"]["width"], manifest["1x"]["height"]) == (1280, 720)
+    # The original is narrower than 2048px, so 2x is not upscaled.
+    assert manifest["2x"]["width"] == 1600
+    assert manifest["2x"]["bytes"] > 0
+
+    def _no_exists(name: str) -> bool:
+        raise AssertionError(f"storage.exists({name!r}) called while rendering")
+
+    monkeypatch.setattr(stored.featured_image.storage, "exists", _no_exists)
+    assert "@2x.webp 1600w" in unquote(stored.featured_image_webp_srcset)
+    assert unquote(stored.get_social_image_url() or "").endswith("@2x.webp")
+
+
+def test_open_for_widths_decodes_large_uploads_at_reduced_scale(tmp_path) -> None:
+    for fmt, name in (("JPEG", "camera.jpg"), ("PNG", "camera.png")):
+        buffer = BytesIO()
+        Image.new("RGB", (6000, 4000), (10, 20, 30)).save(buffer, format=fmt)
+        upload = SimpleUploadedFile(name, buffer.getvalue())
+
+        image, original_size = _open_for_widths(upload, 2048)
+
+        # Never below the widest variant, but far from the 6000px original.
+        assert 2048 <= image.width < 4096, fmt
+        assert image.mode == "RGB"
+        assert original_size == (6000, 4000)
+        image.close()
+
+
+@pytest.mark.django_db
+def test_post_encodes_variants_in_worker_processes(tmp_path, settings) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_ENCODE_WORKERS = 2
+    # Budget for the resized frames plus a single 2048px encode at a time.
+    settings.IMAGE_MEMORY_BUDGET_MB = 48
+    try:
+        post = Post.objects.create(
+            title="Parallel",
+            slug="parallel",
+            content="",
+            featured_image=_make_test_image(size=(3000, 2000)),
+        )
+    finally:
+        _discard_encode_pool()
+
+    manifest = Post.objects.get(pk=post.pk).featured_image_variants["webp"]
+    assert (manifest["2x"]["width"], manifest["2x"]["height"]) == (2048, 1365)
+    assert (manifest["1x"]["width"], manifest["1x"]["height"]) == (1280, 853)
+    assert (Path(tmp_path) / manifest["1x"]["name"]).stat().st_size == (
+        manifest["1x"]["bytes"]
+    )
+
+
+def test_parallel_encodes_count_frames_held_in_the_parent(
+    monkeypatch, settings
+) -> None:
+    frames = [Image.new("RGB", (1024, 1024)), Image.new("RGB", (1024, 1024))]
+    running: list[int] = []
+    lock = threading.Lock()
+
+    def encode(image: Image.Image, fmt: str) -> bytes:
+        with lock:
+            running.append(running[-1] + 1 if running else 1)
+        threading.Event().wait(0.05)
+        with lock:
+            running.append(running[-1] - 1)
+        return fmt.encode()
+
+    monkeypatch.setattr(images, "_encode_variant", encode)
+    monkeypatch.setattr(images, "_get_encode_pool", lambda _w: ThreadPoolExecutor(4))
+    settings.IMAGE_ENCODE_WORKERS = 4
+    # Two 4 MiB frames plus one 8 MiB encode fit; a second encode does not,
+    # even once the first frame is released. Encodes alone would fit twice.
+    settings.IMAGE_MEMORY_BUDGET_MB = 19
+
+    futures = _encode_variants(
+        {(fmt, str(n)): (frame, fmt) for n, frame in enumerate(frames) for fmt in "ab"}
+    )
+
+    assert sorted(future.result() for future in futures.values()) == [
+        b"a",
+        b"a",
+        b"b",
+        b"b",
+    ]
+    assert max(running) == 1
+    # The first frame was released once both of its encodes were done.
+    with pytest.raises(ValueError):
+        frames[0].getpixel((0, 0))
+
+
+@pytest.mark.django_db
+def test_post_variant_ladder_emits_avif_and_webp_sources(tmp_path, settings) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    post = Post.objects.create(
+        title="Ladder",
+        slug="ladder",
+        content="",
+        featured_image=_make_test_image(size=(1000, 500)),
+    )
+
+    manifest = Post.objects.get(pk=post.pk).featured_image_variants
+    # 1280 and 2048 cannot be filled by a 1000px original: one native-width
+    # variant remains, under the legacy 1x label.
+    assert set(manifest["webp"]) == {"320w", "640w", "960w", "1x"}
+    assert manifest["webp"]["1x"]["width"] == 1000
+    assert manifest["avif"]["320w"]["name"] == "posts/featured/featured@320w.avif"
+
+    sources = post.featured_image_sources
+    assert [source["type"] for source in sources] == ["image/avif", "image/webp"]
+    assert unquote(sources[1]["srcset"]).endswith("@1x.webp 1000w")
+
+
+def test_legacy_flat_variant_manifest_is_read_as_webp() -> None:
+    post = Post(title="Legacy", slug="legacy", content="")
+    post.featured_image.name = "posts/featured/old.jpg"
+    post.featured_image_variants = {
+        "1x": {"name": "posts/featured/old@1x.webp", "width": 1280, "height": 720},
+        "2x": {"name": "posts/featured/old@2x.webp", "width": 2048, "height": 1152},
+    }
+
+    assert [source["type"] for source in post.featured_image_sources] == ["image/webp"]
+    assert post.featured_image_webp_srcset == (
+        "/media/posts/featured/old%401x.webp 1280w, "
+        "/media/posts/featured/old%402x.webp 2048w"
+    )
+    assert post.get_social_image_url() == "/media/posts/featured/old%402x.webp"
+
+
+@pytest.mark.django_db
+def test_rebuild_image_variants_command_upgrades_stale_manifests(
+    tmp_path, settings
+) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_VARIANT_WIDTHS = [640, 1280]
+    settings.IMAGE_VARIANT_FORMATS = ["webp"]
+    current = Post.objects.create(
+        title="Current", slug="current", content="", featured_image=_make_test_image()
+    )
+    stale = Post.objects.create(
+        title="Stale",
+        slug="stale",
+        content="",
+        featured_image=_make_test_image("stale.jpg"),
+    )
+    # A legacy flat manifest pointing at a 2x file the ladder no longer has.
+    legacy_2x = Path(tmp_path) / "posts/featured/stale@2x.webp"
+    legacy_2x.write_bytes(b"old")
+    Post.objects.filter(pk=stale.pk).update(
+        featured_image_variants={
+            "2x": {"name": "posts/featured/stale@2x.webp", "width": 1600}
+        }
+    )
+    checkpoint = tmp_path / "checkpoint.json"
+
+    out = StringIO()
+    call_command(
+        "rebuild_image_variants", "--dry-run", f"--checkpoint={checkpoint}", stdout=out
+    )
+    assert "Would rebuild variants for 1 post(s)." in out.getvalue()
+    assert legacy_2x.exists()
+
+    out = StringIO()
+    call_command(
+        "rebuild_image_variants",
+        "--workers=2",
+        f"--checkpoint={checkpoint}",
+        stdout=out,
+    )
+
+    assert "Rebuilt 1 post(s)" in out.getvalue()
+    assert "webp: originals" in out.getvalue()
+    manifest = Post.objects.get(pk=stale.pk).featured_image_variants
+    assert set(manifest["webp"]) == {"640w", "1x"}
+    assert not legacy_2x.exists()
+    assert not checkpoint.exists()
+    assert set(Post.objects.get(pk=current.pk).featured_image_variants["webp"]) == {
+        "640w",
+        "1x",
+    }
+
+
+@pytest.mark.django_db
+def test_rebuild_image_variants_command_resumes_from_checkpoint(
+    tmp_path, settings
+) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_VARIANT_WIDTHS = [640]
+    settings.IMAGE_VARIANT_FORMATS = ["webp"]
+    first = Post.objects.create(
+        title="First", slug="first", content="", featured_image=_make_test_image()
+    )
+    second = Post.objects.create(
+        title="Second",
+        slug="second",
+        content="",
+        featured_image=_make_test_image("second.jpg"),
+    )
+    Post.objects.update(featured_image_variants={})
+    checkpoint = tmp_path / "checkpoint.json"
+    signature = {
+        "widths": {"640w": 640},
+        "formats": ["webp"],
+        "only_missing": True,
+        "force": False,
+    }
+    checkpoint.write_text(json.dumps({"signature": signature, "last_pk": first.pk}))
+
+    out = StringIO()
+    call_command(
+        "rebuild_image_variants",
+        "--only-missing",
+        f"--checkpoint={checkpoint}",
+        stdout=out,
+    )
+
+    assert f"Resuming after post #{first.pk}." in out.getvalue()
+    assert Post.objects.get(pk=first.pk).featured_image_variants == {}
+    assert "640w" in Post.objects.get(pk=second.pk).featured_image_variants["webp"]
+
+
+@pytest.mark.django_db
+def test_post_records_intrinsic_size_colour_and_placeholder(tmp_path, settings) -> None:
+    settings.MEDIA_ROOT = tmp_path
+    post = Post.objects.create(
+        title="Details",
+        slug="details",
+        content="",
+        featured_image=_make_test_image(size=(1600, 900), color=(220, 120, 80)),
+    )
+
+    stored = Post.objects.get(pk=post.pk)
+    assert (stored.featured_image_width, stored.featured_image_height) == (1600, 900)
+    red, green, blue = (
+        int(stored.featured_image_color[i : i + 2], 16) for i in (1, 3, 5)
+    )
+    assert abs(red - 220) < 8 and abs(green - 120) < 8 and abs(blue - 80) < 8
+    assert stored.featured_image_placeholder.startswith("data:image/webp;base64,")
+    assert len(stored.featured_image_placeholder) < 1000
+
+    stored.featured_image = None
+    stored.save()
+    assert Post.objects.get(pk=post.pk).featured_image_width is None
+
+
+@pytest.mark.django_db
+def test_category_labels_follow_category_changes() -> None:
+    post = Post.objects.create(title="Labels", slug="labels", content="")
+    physics = Category.objects.create(name="Physics", slug="physics")
+    setattr(physics, "name_uk", "Фізика")
+    physics.save()
+    art = Category.objects.create(name="Art", slug="art")
+
+    post.categories.add(physics, art)
+    assert Post.objects.get(pk=post.pk).category_labels == {
+        "en": ["Art", "Physics"],
+        "uk": ["Art", "Фізика"],
+    }
+
+    setattr(art, "name_en", "Arts")
+    art.save()
+    assert Post.objects.get(pk=post.pk).category_labels["en"] == ["Arts", "Physics"]
+
+    physics.posts.clear()
+    assert Post.objects.get(pk=post.pk).category_labels["uk"] == ["Arts"]
+
+    art.delete()
+    assert Post.objects.get(pk=post.pk).category_labels == {}
+
+
+@pytest.mark.django_db
+def test_scheduled_posts_go_live_with_current_category_labels() -> None:
+    post = Post.objects.create(
+        title="Soon",
+        slug="soon",
+        content="",
+        published_at=timezone.now() + timedelta(days=1),
+    )
+    physics = Category.objects.create(name="Physics", slug="physics")
+    post.categories.add(physics)
+
+    setattr(physics, "name_en", "Astrophysics")
+    physics.save()
+
+    assert Post.objects.get(pk=post.pk).category_labels["en"] == ["Astrophysics"]
+
+
+@pytest.mark.django_db
+def test_rebuild_category_labels_command_repairs_stale_rows() -> None:
+    post = Post.objects.create(title="Stale labels", slug="stale-labels", content="")
+    post.categories.add(Category.objects.create(name="Physics", slug="physics"))
+    Post.objects.filter(pk=post.pk).update(category_labels={"en": ["Old"]})
+
+    out = StringIO()
+    call_command("rebuild_category_labels", stdout=out)
+
+    assert "Updated category labels of 1 of 1 post(s)." in out.getvalue()
+    assert Post.objects.get(pk=post.pk).category_labels["en"] == ["Physics"]
+
+
+def _create_posts_for_plans(count: int = 5000) -> None:
+    """Fill the table like a real blog: mostly published, some drafts/scheduled."""
+    now = timezone.now()
+    posts = []
+    for index in range(count):
+        if index % 10 == 0:
+            published_at = None
+        elif index % 10 == 1:
+            published_at = now + timedelta(days=index)
+        else:
+            published_at = now - timedelta(hours=index)
+        posts.append(
+            Post(
+                title=f"Plan {index}",
+                slug=f"plan-{index}",
+                slug_en=f"plan-{index}-en",
+                slug_uk=f"plan-{index}-uk",
+                content="",
+                published_at=published_at,
+            )
+        )
+    Post.objects.bulk_create(posts, batch_size=500)
+    PostSlug.objects.bulk_create(
+        PostSlug(post_id=pk, lang="en", slug=f"old-{pk}")
+        for pk in Post.objects.values_list("pk", flat=True)[:500]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def _assert_index_plan(
+    plan: str, *, index: str | None = None, ordered: bool = True
+) -> None:
+    """Assert ``plan`` reads ``blog_post`` through an index.
+
+    With ``ordered``, the rows must also come out of the index in list order
+    rather than being sorted. Reads PostgreSQL ``EXPLAIN`` or SQLite
+    ``EXPLAIN QUERY PLAN`` output, depending on the test database.
+    """
+    if index is not None:
+        assert index in plan, plan
+    if connection.vendor == "postgresql":
+        assert "Seq Scan on blog_post " not in plan, plan
+        assert "Index Scan" in plan, plan
+        if ordered:
+            assert not re.search(r"^\s*(->\s+)?Sort\b", plan, re.MULTILINE), plan
+    else:
+        assert not re.search(r"\bSCAN blog_post\b(?! USING)", plan), plan
+        if ordered:
+            assert "TEMP B-TREE FOR ORDER BY" not in plan, plan
+
+
+@pytest.mark.django_db
+def test_public_list_queries_use_the_partial_order_index() -> None:
+    _create_posts_for_plans()
+    index = "blog_post_public_order_idx"
+
+    page = Post.public.published().cards()[40:50]
+    _assert_index_plan(page.explain(), index=index)
+
+    cursor = encode_cursor(Post.public.published()[100])
+    with CaptureQueriesContext(connection) as queries:
+        paginate_by_cursor(Post.public.published().cards(), 10, cursor)
+    assert len(queries) == 1
+    published_at, pk = decode_cursor(cursor)
+    keyset = (
+        Post.public.published()
+        .cards()
+        .filter(
+            Q(published_at__lt=published_at) | Q(published_at=published_at, pk__lt=pk),
+            published_at__lte=published_at,
+        )
+        .order_by(*CURSOR_ORDERING)[:11]
+    )
+    _assert_index_plan(keyset.explain(), index=index)
+
+
+@pytest.mark.django_db
+def test_slug_lookups_use_indexes() -> None:
+    _create_posts_for_plans()
+
+    for slug in ("plan-42", "plan-42-uk", "old-7"):
+        # Only the few candidate rows are sorted by match quality.
+        plan = Post.public.all().matching_slug(slug, "en").explain()
+        _assert_index_plan(plan, ordered=False)
+        assert "blog_postslug" in plan, plan
+
+
+@pytest.mark.django_db
+def test_saves_reindex_only_when_the_indexed_text_changes() -> None:
+    post = Post.objects.create(title="Glaciers", slug="glaciers", content="Ice.")
+
+    def reindexed(**kwargs: Any) -> bool:
+        with CaptureQueriesContext(connection) as queries:
+            post.save(**kwargs)
+        # The vector UPDATE (PostgreSQL) or the FTS5 rows (other databases).
+        return any(
+            "to_tsvector" in query["sql"] or "INTO blog_post_search_" in query["sql"]
+            for query in queries
+        )
+
+    post.published_at = timezone.now()
+    assert not reindexed()
+    assert not reindexed(update_fields=["title_en", "content_en"])
+    setattr(post, "content_en", "Ice moves.")
+    assert reindexed()
+    setattr(post, "title_uk", "Льодовики")
+    assert reindexed(update_fields=["title_uk"])
+
+
+@postgresql_only
+@pytest.mark.django_db
+def test_search_vectors_follow_saves() -> None:
+    post = Post.objects.create(
+        title="Glaciers", slug="glaciers", content="Running on ice."
+    )
+    vectors = Post.objects.values("search_vector_en", "search_vector_uk").get(
+        pk=post.pk
+    )
+    # English is stemmed; Ukrainian ("simple") indexes the English fallback as is.
+    assert "'glacier':1A" in vectors["search_vector_en"]
+    assert "'run':2B" in vectors["search_vector_en"]
+    assert "'glaciers':1A" in vectors["search_vector_uk"]
+
+    def matches(word: str) -> bool:
+        query = SearchQuery(word, config="english")
+        return Post.objects.filter(pk=post.pk, search_vector_en=query).exists()
+
+    # This instance never read its vectors; a full save must not clear them.
+    post.published_at = timezone.now()
+    post.save()
+    assert matches("glacier")
+
+    setattr(post, "title_en", "Moraines")
+    post.save()
+    assert not matches("glacier")
+    assert matches("moraine")
+
+
+@postgresql_only
+@pytest.mark.django_db
+def test_search_ranks_title_matches_above_newer_body_matches() -> None:
+    now = timezone.now()
+    body_match = Post.objects.create(
+        title="Field notes",
+        slug="field-notes",
+        content="A glacier, seen from the valley.",
+        published_at=now,
+    )
+    title_match = Post.objects.create(
+        title="Glacier",
+        slug="glacier",
+        content="Ice moves slowly.",
+        published_at=now - timedelta(days=1),
+    )
+
+    results = list(search_posts(Post.objects.all(), "glaciers", "en"))
+    assert [post.pk for post in results] == [title_match.pk, body_match.pk]
+    assert results[0].search_rank > results[1].search_rank
+
+    setattr(title_match, "title_uk", "Льодовики")
+    title_match.save()
+    results = list(search_posts(Post.objects.all(), "льодовики", "uk"))
+    assert [post.pk for post in results] == [title_match.pk]
+    # Not stemmed: another form of the word does not match.
+    assert list(search_posts(Post.objects.all(), "льодовик", "uk")) == []
+
+
+@postgresql_only
+@pytest.mark.django_db
+def test_search_migration_reverses() -> None:
+    migration = importlib.import_module("blog.migrations.0016_post_search")
+    post = Post.objects.create(title="Glaciers", slug="glaciers", content="")
+
+    def gin_indexes() -> list[str]:
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, "blog_post")
+        return sorted(
+            name
+            for name, details in constraints.items()
+            if details.get("type") == "gin"
+        )
+
+    indexes = ["blog_post_search_en_gin", "blog_post_search_uk_gin"]
+    assert gin_indexes() == indexes
+    with connection.schema_editor() as schema_editor:
+        migration.remove_search_index(apps, schema_editor)
+    assert gin_indexes() == []
+
+    Post.objects.update(search_vector_en=None, search_vector_uk=None)
+    with connection.schema_editor() as schema_editor:
+        migration.build_search_index(apps, schema_editor)
+    assert gin_indexes() == indexes
+    assert Post.objects.filter(pk=post.pk, search_vector_uk__isnull=False).exists()
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+from io import StringIO
+from types import ModuleType
 from typing import Any
 
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
+from django.core.management import call_command
+from django.db import connection, connections
 from django.http import HttpResponseRedirect
-from django.test.client import Client
-from django.urls import reverse, reverse_lazy
+from django.test.client import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse, reverse_lazy
 from django.utils import timezone, translation
 
+from blog.middleware import slug_redirects
 from blog.models import Category, Post
+from blog.models.cards import PostCard
+from blog.routers import PRIMARY_READS_COOKIE
+from blog.utils.pagination import encode_cursor
+from blog.utils.schedule import cap_timeout, check_go_live, next_go_live
+from blog.utils.warmup import warm_shared_caches, warm_worker_caches
+from echofield.urls import build_urlpatterns
 
 
 # Utility to populate all required localized fields (post.py/modeltranslation style)
@@ -84,6 +98,26 @@ def test_post_list_view_shows_only_published_posts(client: Client) -> None:
     assert {p.slug for p in posts} == {"visible-post"}
 
 
+@pytest.mark.django_db
+def test_excerpt_is_plain_text_escaped_once_on_the_list(client: Client) -> None:
+    post = Post.objects.create(
+        title="Ampersand",
+        slug="ampersand",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    setattr(post, "content_en", 'Salt & pepper, "quoted" **bold** < 5')
+    setattr(post, "content_uk", "Сіль & перець")
+    post.save()
+
+    stored = Post.objects.get(pk=post.pk)
+    assert getattr(stored, "content_html_en").count("&amp;") == 1
+    assert getattr(stored, "excerpt_en") == 'Salt & pepper, "quoted" bold < 5'
+    page = client.get(reverse("post_list"), secure=True).content.decode()
+    assert "Salt &amp; pepper, &quot;quoted&quot; bold &lt; 5" in page
+    assert "&amp;amp;" not in page
+
+
 @pytest.mark.django_db
 def test_post_list_view_sets_seo_context(client: Client) -> None:
     response = client.get(reverse("post_list"), secure=True)
@@ -466,3 +500,868 @@ def test_manage_list_pagination_for_superuser(
     assert hasattr(posts, "paginator")
     assert posts.paginator.count == 25
     assert posts.paginator.num_pages >= 2
+
+
+@pytest.mark.django_db
+def test_post_preview_view_requires_superuser(client: Client) -> None:
+    resp = client.post(
+        reverse("post_preview"),
+        data='{"content": "# Hi"}',
+        content_type="application/json",
+        secure=True,
+    )
+    assert resp.status_code in (301, 302)
+
+
+@pytest.mark.django_db
+def test_post_preview_view_renders_blocks_for_superuser(
+    client: Client, django_user_model: Any
+) -> None:
+    user = django_user_model.objects.create_user(
+        "previewer",
+        password="pw",
+        is_superuser=True,  # noqa: S106
+    )
+    client.force_login(user)
+    url = reverse("post_preview")
+
+    resp = client.post(
+        url,
+        data={"content": "# Hello\n\nSome **bold** text."},
+        content_type="application/json",
+        secure=True,
+    )
+    assert resp.status_code == 200
+    blocks = resp.json()["blocks"]
+    assert [block["html"] for block in blocks] == [
+        "<h1>Hello</h1>",
+        "<p>Some <strong>bold</strong> text.</p>",
+    ]
+
+    resp2 = client.post(
+        url,
+        data={"content": "# Hello\n\nChanged.", "known": [blocks[0]["key"]]},
+        content_type="application/json",
+        secure=True,
+    )
+    assert [block["html"] for block in resp2.json()["blocks"]] == [
+        "",
+        "<p>Changed.</p>",
+    ]
+
+    bad = client.post(
+        url, data="not json", content_type="application/json", secure=True
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.django_db
+def test_post_detail_picture_lists_formats_sizes_and_dimensions(client: Client) -> None:
+    post = Post.objects.create(
+        title="Picture",
+        slug="picture",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    Post.objects.filter(pk=post.pk).update(
+        featured_image="posts/featured/pic.jpg",
+        featured_image_variants={
+            "avif": {"640w": {"name": "posts/featured/pic@640w.avif", "width": 640}},
+            "webp": {"640w": {"name": "posts/featured/pic@640w.webp", "width": 640}},
+        },
+        featured_image_width=1600,
+        featured_image_height=900,
+        featured_image_color="#dc7850",
+        featured_image_placeholder="data:image/webp;base64,UklGRg==",
+    )
+    set_localized_post_fields(Post.objects.get(pk=post.pk), slug="picture-en")
+
+    response = client.get(
+        reverse("post_detail", kwargs={"slug": "picture-en"}), secure=True
+    )
+    content = response.content.decode()
+    assert content.index('type="image/avif"') < content.index('type="image/webp"')
+    assert "pic%40640w.avif 640w" in content
+    assert f'sizes="{Post.FEATURED_IMAGE_SIZES}"' in content
+    assert 'width="1600" height="900"' in content
+    assert "background-color: #dc7850" in content
+    assert "url(data:image/webp;base64,UklGRg==)" in content
+
+
+@pytest.mark.django_db
+def test_post_detail_resolves_slugs_with_a_single_query(
+    client: Client, django_assert_num_queries: Any, settings: Any
+) -> None:
+    # Measure the view itself, not the page cache in front of it.
+    settings.PAGE_CACHE_TIMEOUT = 0
+    post = Post.objects.create(
+        title="One query",
+        slug="one-query",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="one-query-en")
+    post.slug_uk = "odyn-zapyt"
+    post.save()
+
+    resolved = Post.public.resolve_slug("odyn-zapyt", "en")
+    assert resolved is not None
+    assert resolved.matched_slug_lang == "uk"
+
+    with translation.override("en"):
+        # The first request builds the slug redirect map.
+        client.get(reverse("post_detail", kwargs={"slug": "one-query-en"}), secure=True)
+
+        # Cross-language redirects are answered by the middleware alone.
+        with django_assert_num_queries(0):
+            response = client.get(
+                reverse("post_detail", kwargs={"slug": "odyn-zapyt"}), secure=True
+            )
+        assert response.status_code == 301
+        assert response["Location"].endswith("/one-query-en/")
+
+        with django_assert_num_queries(1):
+            response = client.get(
+                reverse("post_detail", kwargs={"slug": "no-such-post"}), secure=True
+            )
+        assert response.status_code == 404
+
+        # Category names are stored on the post: rendering adds no query.
+        with django_assert_num_queries(1):
+            response = client.get(
+                reverse("post_detail", kwargs={"slug": "one-query-en"}), secure=True
+            )
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_changed_slug_redirects_from_history_without_queries(
+    client: Client, django_assert_num_queries: Any
+) -> None:
+    post = Post.objects.create(
+        title="Renamed",
+        slug="renamed",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="first-name")
+    post.slug_en = "second-name"
+    post.save()
+    post.slug_en = "final-name"
+    post.save()
+
+    assert set(post.slug_history.values_list("lang", "slug")) >= {
+        ("", "renamed"),
+        ("en", "first-name"),
+        ("en", "second-name"),
+        ("en", "final-name"),
+    }
+    client.get(reverse("post_detail", kwargs={"slug": "final-name"}), secure=True)
+
+    for old_slug in ("first-name", "second-name", "renamed"):
+        with django_assert_num_queries(0):
+            response = client.get(
+                reverse("post_detail", kwargs={"slug": old_slug}), secure=True
+            )
+        assert response.status_code == 301
+        assert response["Location"].endswith("/final-name/")
+
+    response = client.get(
+        reverse("post_detail", kwargs={"slug": "renamed"}) + "?utm_source=feed&x=%20",
+        secure=True,
+    )
+    assert response["Location"].endswith("/final-name/?utm_source=feed&x=%20")
+
+
+@pytest.mark.django_db
+def test_former_slug_reused_by_another_post_resolves_to_new_owner(
+    client: Client,
+) -> None:
+    published_at = timezone.now() - timedelta(days=1)
+    first = Post.objects.create(
+        title="First", slug="first", content="", published_at=published_at
+    )
+    set_localized_post_fields(first, slug="shared-name")
+    first.slug_en = "first-renamed"
+    first.save()
+    second = Post.objects.create(
+        title="Second", slug="second", content="", published_at=published_at
+    )
+    set_localized_post_fields(second, slug="shared-name")
+
+    response = client.get(
+        reverse("post_detail", kwargs={"slug": "shared-name"}), secure=True
+    )
+
+    assert response.status_code == 200
+    assert response.context["post"] == second
+
+
+@pytest.mark.django_db
+def test_slug_history_of_unpublished_post_is_not_redirected(client: Client) -> None:
+    post = Post.objects.create(
+        title="Draft",
+        slug="draft",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="draft-old")
+    post.slug_en = "draft-new"
+    post.published_at = None
+    post.save()
+
+    response = client.get(
+        reverse("post_detail", kwargs={"slug": "draft-old"}), secure=True
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_view_redirects_former_slug_missing_from_stale_map(
+    client: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    post = Post.objects.create(
+        title="Stale",
+        slug="stale",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="stale-old")
+    client.get(reverse("post_detail", kwargs={"slug": "stale-old"}), secure=True)
+    # Another process renamed the post; this one's map has not caught up.
+    monkeypatch.setattr("blog.models.posts.invalidate_slug_redirects", lambda: None)
+    post.slug_en = "stale-new"
+    post.save()
+
+    response = client.get(
+        reverse("post_detail", kwargs={"slug": "stale-old"}) + "?utm_source=feed",
+        secure=True,
+    )
+
+    assert response.status_code == 301
+    assert response["Location"].endswith("/stale-new/?utm_source=feed")
+
+
+@pytest.mark.django_db
+def test_public_pages_are_cached_per_language_until_content_changes(
+    client: Client, django_assert_num_queries: Any
+) -> None:
+    post = Post.objects.create(
+        title="Cached",
+        slug="cached",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, title="Cached title", slug="cached-en")
+    list_url = reverse("post_list")
+
+    first = client.get(list_url, secure=True)
+    with django_assert_num_queries(0):
+        hit = client.get(list_url, secure=True)
+    assert hit.content == first.content
+    assert "Cached title" in hit.content.decode()
+
+    ukrainian = client.get(list_url, secure=True, HTTP_ACCEPT_LANGUAGE="uk")
+    assert '<html lang="uk"' in ukrainian.content.decode()
+    assert "УКР" in ukrainian.content.decode()
+
+    # Both saves and category changes invalidate the cached copy.
+    post.title_en = "Renamed title"
+    post.save()
+    assert "Renamed title" in client.get(list_url, secure=True).content.decode()
+    post.categories.add(create_category(name="Fresh", slug="fresh"))
+    assert "Fresh" in client.get(list_url, secure=True).content.decode()
+
+
+@pytest.mark.django_db
+def test_page_cache_is_skipped_for_editors_and_extra_query_params(
+    client: Client, django_assert_num_queries: Any
+) -> None:
+    Post.objects.create(
+        title="Editors",
+        slug="editors",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    list_url = reverse("post_list")
+    client.get(f"{list_url}?utm_source=feed", secure=True)
+    response = client.get(f"{list_url}?utm_source=feed", secure=True)
+    assert response.context is not None
+
+    user = get_user_model().objects.create_superuser(
+        "editor",
+        "editor@example.com",
+        "pw",  # noqa: S106
+    )
+    client.force_login(user)
+    client.get(list_url, secure=True)
+    response = client.get(list_url, secure=True)
+    assert response.context is not None
+
+
+@pytest.mark.django_db
+def test_language_switch_fetches_its_csrf_token_outside_cached_pages() -> None:
+    client = Client(enforce_csrf_checks=True)
+    switch = {"language": "uk", "next": "/"}
+
+    page = client.get(reverse("post_list"), secure=True)
+    assert b"csrfmiddlewaretoken" not in page.content
+    assert reverse("csrf_token").encode() in page.content
+    # Other sites cannot switch a visitor's language.
+    response = client.post(
+        reverse("set_language"),
+        switch,
+        secure=True,
+        HTTP_REFERER="https://testserver/",
+    )
+    assert response.status_code == 403
+
+    token = client.get(reverse("csrf_token"), secure=True)
+    assert "no-cache" in token["Cache-Control"]
+    response = client.post(
+        reverse("set_language"),
+        {**switch, "csrfmiddlewaretoken": token.json()["csrfToken"]},
+        secure=True,
+        HTTP_REFERER="https://testserver/",
+    )
+    assert response.status_code == 302
+    assert response.cookies["django_language"].value == "uk"
+
+
+@pytest.mark.django_db
+def test_post_detail_answers_conditional_get_without_rendering(
+    client: Client, django_assert_num_queries: Any, settings: Any
+) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    post = Post.objects.create(
+        title="Validators",
+        slug="validators",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="validators-en")
+    url = reverse("post_detail", kwargs={"slug": "validators-en"})
+
+    response = client.get(url, secure=True)
+    etag = response["ETag"]
+    assert etag.startswith('W/"')
+    assert response.has_header("Last-Modified")
+
+    with django_assert_num_queries(1):
+        response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    response = client.get(
+        url, secure=True, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+    )
+    assert response.status_code == 304
+
+    # Renaming a category shown on the page changes the validators.
+    category = create_category(name="Science", slug="science")
+    post.categories.add(category)
+    Post.objects.filter(pk=post.pk).update(updated_at=post.updated_at)
+    category.name_en = "Natural science"
+    category.save()
+    response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_cached_page_answers_conditional_get(
+    client: Client, django_assert_num_queries: Any
+) -> None:
+    post = Post.objects.create(
+        title="Cached validators",
+        slug="cached-validators",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="cached-validators-en")
+    url = reverse("post_detail", kwargs={"slug": "cached-validators-en"})
+    etag = client.get(url, secure=True)["ETag"]
+
+    with django_assert_num_queries(0):
+        response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_list_and_sitemap_validators_follow_publication_cut_off(
+    client: Client, settings: Any
+) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    now = timezone.now()
+    Post.objects.create(
+        title="Live", slug="live", content="", published_at=now - timedelta(days=2)
+    )
+    scheduled = Post.objects.create(
+        title="Scheduled",
+        slug="scheduled",
+        content="",
+        published_at=now + timedelta(days=1),
+    )
+
+    for url in (reverse("post_list"), reverse("sitemap")):
+        response = client.get(url, secure=True)
+        assert response.status_code == 200
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        response = client.get(url, secure=True, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == 304
+
+    etags = {
+        url: client.get(url, secure=True)["ETag"]
+        for url in (reverse("post_list"), reverse("sitemap"))
+    }
+    # Going live sends no signal and leaves updated_at alone.
+    Post.objects.filter(pk=scheduled.pk).update(published_at=now - timedelta(hours=1))
+    for url, etag in etags.items():
+        response = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200, url
+
+
+@pytest.mark.django_db
+def test_robots_txt_has_etag(client: Client) -> None:
+    response = client.get(reverse("robots_txt"))
+    response = client.get(reverse("robots_txt"), HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_walks_the_archive_without_offset_or_count(
+    client: Client, settings: Any
+) -> None:
+    settings.POST_LIST_PAGINATION = "cursor"
+    settings.PAGE_CACHE_TIMEOUT = 0
+    same_time = timezone.now() - timedelta(days=1)
+    # Shared publication times exercise the id tie-breaker.
+    for index in range(45):
+        Post.objects.create(
+            title=f"Archive {index}",
+            slug=f"archive-{index}",
+            content="",
+            published_at=same_time - timedelta(hours=index // 4),
+        )
+    expected = list(Post.public.published().values_list("pk", flat=True))
+
+    seen: list[int] = []
+    url = reverse("post_list")
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, secure=True)
+        assert response.status_code == 200
+        sql = " ".join(query["sql"].upper() for query in queries.captured_queries)
+        assert "OFFSET" not in sql
+        assert "COUNT(*)" not in sql
+        seen += [post.pk for post in response.context["posts"]]
+        page = response.context["page_obj"]
+        url = (
+            f"{reverse('post_list')}?after={page.next_cursor}"
+            if page.has_next()
+            else ""
+        )
+
+    assert seen == expected
+    assert 'rel="next"' not in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_after_token_works_in_page_mode_and_rejects_garbage(client: Client) -> None:
+    published_at = timezone.now() - timedelta(days=1)
+    first = Post.objects.create(
+        title="First", slug="first", content="", published_at=published_at
+    )
+    second = Post.objects.create(
+        title="Second", slug="second", content="", published_at=published_at
+    )
+
+    response = client.get(
+        reverse("post_list"), {"after": encode_cursor(second)}, secure=True
+    )
+    assert [post.pk for post in response.context["posts"]] == [first.pk]
+
+    response = client.get(reverse("post_list"), {"after": "not-a-cursor"}, secure=True)
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_post_list_caches_count_and_renders_elided_page_window(
+    client: Client, settings: Any
+) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    now = timezone.now()
+    Post.objects.bulk_create(
+        Post(
+            title=f"Bulk {index}",
+            slug=f"bulk-{index}",
+            content="",
+            published_at=now - timedelta(minutes=index + 1),
+        )
+        for index in range(200)
+    )
+    upcoming = now + timedelta(days=1)
+    Post.objects.create(
+        title="Upcoming", slug="upcoming", content="", published_at=upcoming
+    )
+    assert Post.public.published_count() == (200, upcoming)
+
+    def count_queries(url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, secure=True)
+        assert response.status_code == 200
+        return sum(
+            # The validators' aggregate (with MAX) is not the paginator count.
+            "COUNT(" in query["sql"].upper() and "MAX(" not in query["sql"].upper()
+            for query in queries.captured_queries
+        )
+
+    list_url = reverse("post_list")
+    assert count_queries(f"{list_url}?page=5") == 1
+    assert count_queries(f"{list_url}?page=6") == 0
+
+    response = client.get(f"{list_url}?page=5", secure=True)
+    assert response.context["page_window"] == [1, "…", 4, 5, 6, "…", 10]
+    content = response.content.decode()
+    assert 'href="?page=4"' in content
+    assert 'href="?page=7"' not in content
+    assert 'href="?page=6" class="pagination-link" rel="next"' in content
+    assert "?after=" not in content
+
+    # Publishing changes invalidate the cached count.
+    Post.objects.create(title="New", slug="new", content="", published_at=now)
+    assert count_queries(f"{list_url}?page=5") == 1
+
+
+@pytest.mark.django_db
+def test_list_pages_read_post_cards_without_content_columns(
+    client: Client, settings: Any
+) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    post = Post.objects.create(
+        title="Card",
+        slug="card",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(
+        post, title="Card title", slug="card-en", content="Long body " * 200
+    )
+    post.categories.add(create_category(name="Physics", slug="physics"))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("post_list"), secure=True)
+    sql = " ".join(query["sql"] for query in queries.captured_queries)
+    assert '"content_en"' not in sql
+    assert '"content_html_en"' not in sql
+    assert "blog_post_categories" not in sql
+
+    [card] = response.context["posts"]
+    assert isinstance(card, PostCard)
+    assert not hasattr(card, "__dict__")
+    assert card.title == "Card title"
+    assert card.categories == ("Physics",)
+    assert card.slugs == {"en": "card-en", "uk": "ua-card"}
+    content = response.content.decode()
+    assert 'href="/card-en/"' in content
+    assert "Physics" in content
+
+    with translation.override("uk"):
+        [card] = Post.public.published().cards()
+    assert card.title.startswith("УКР")
+    assert card.categories == ("UA Physics",)
+
+    sitemap = client.get(reverse("sitemap"), secure=True).content.decode()
+    assert "/card/</loc>" in sitemap
+
+
+@pytest.mark.django_db
+def test_post_search_ranks_title_matches_first_per_language(client: Client) -> None:
+    now = timezone.now()
+    body_match = Post.objects.create(
+        title="Field notes", slug="field-notes", content="", published_at=now
+    )
+    set_localized_post_fields(
+        body_match, content="We spent the morning running tests on a glacier."
+    )
+    title_match = Post.objects.create(
+        title="Glaciers", slug="glaciers", content="", published_at=now
+    )
+    set_localized_post_fields(title_match, content="Ice moves slowly.")
+    draft = Post.objects.create(title="Glacier draft", slug="draft", content="")
+    set_localized_post_fields(draft)
+    setattr(title_match, "content_uk", "Льодовик тане")
+    title_match.save()
+
+    url = reverse("post_search")
+    response = client.get(url, {"q": "glacier"}, secure=True)
+    assert response.status_code == 200
+    assert [card.pk for card in response.context["posts"]] == [
+        title_match.pk,
+        body_match.pk,
+    ]
+    assert '<meta name="robots" content="noindex, follow">' in (
+        response.content.decode()
+    )
+
+    # English is stemmed: "run" finds "running".
+    response = client.get(url, {"q": "run"}, secure=True)
+    assert [card.pk for card in response.context["posts"]] == [body_match.pk]
+
+    response = client.get(
+        url, {"q": "льодовик"}, secure=True, HTTP_ACCEPT_LANGUAGE="uk"
+    )
+    assert [card.pk for card in response.context["posts"]] == [title_match.pk]
+
+    # Saving re-indexes, deleting forgets.
+    setattr(body_match, "content_en", "Nothing about ice here.")
+    body_match.save()
+    title_match.delete()
+    response = client.get(url, {"q": "glacier"}, secure=True)
+    assert list(response.context["posts"]) == []
+    assert "No posts match" in response.content.decode()
+
+    response = client.get(url, {"q": '" AND ('}, secure=True)
+    assert response.status_code == 200
+    assert list(response.context["posts"]) == []
+
+
+@pytest.mark.django_db
+def test_cached_pages_follow_the_go_live_clock(
+    client: Client, django_assert_num_queries: Any, monkeypatch: Any, settings: Any
+) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 86400
+    settings.PAGE_CACHE_WARM_URL = "https://testserver"
+    now = timezone.now()
+    Post.objects.create(
+        title="Live", slug="live", content="", published_at=now - timedelta(days=1)
+    )
+    scheduled = Post.objects.create(
+        title="Scheduled",
+        slug="scheduled",
+        content="",
+        published_at=now + timedelta(hours=1),
+    )
+    set_localized_post_fields(scheduled, title="Scheduled", slug="scheduled-en")
+    list_url = reverse("post_list")
+    detail_url = reverse("post_detail", kwargs={"slug": "scheduled-en"})
+
+    assert "Scheduled" not in client.get(list_url, secure=True).content.decode()
+    assert next_go_live() == scheduled.published_at
+    # Cached pages never outlive the next publication.
+    assert 3590 < cap_timeout(settings.PAGE_CACHE_TIMEOUT) <= 3600
+
+    later = now + timedelta(hours=1, seconds=1)
+    monkeypatch.setattr(timezone, "now", lambda: later)
+    # The first request after the go-live expires the cached pages and
+    # renders only its own page.
+    assert "Scheduled" in client.get(list_url, secure=True).content.decode()
+    # One caller per go-live acts on it.
+    assert check_go_live() is False
+    assert next_go_live() is None
+    with CaptureQueriesContext(connection) as queries:
+        client.get(list_url, secure=True, HTTP_ACCEPT_LANGUAGE="uk")
+    assert queries
+
+    # The worker (or the command) renders the list and the new post.
+    out = StringIO()
+    with translation.override("en"):
+        call_command("warm_pages", stdout=out)
+        # Pages render in every language without switching the caller's.
+        assert translation.get_language() == "en"
+    assert "Warmed 4 page(s)." in out.getvalue()
+    ukrainian_url = reverse("post_detail", kwargs={"slug": "ua-scheduled"})
+    # Warming fills the shared page cache, not this process's slug map.
+    slug_redirects.get()
+    with django_assert_num_queries(0):
+        detail = client.get(detail_url, secure=True)
+        ukrainian_detail = client.get(
+            ukrainian_url, secure=True, HTTP_ACCEPT_LANGUAGE="uk"
+        )
+    assert detail.status_code == 200
+    assert '<html lang="uk"' in ukrainian_detail.content.decode()
+    # Nothing else went live since.
+    call_command("warm_pages", stdout=out)
+    assert "Warmed 2 page(s)." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_pages_are_not_warmed_into_a_per_process_cache(
+    monkeypatch: Any, settings: Any
+) -> None:
+    settings.PAGE_CACHE_WARM_URL = "https://testserver"
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    now = timezone.now()
+    Post.objects.create(
+        title="Soon", slug="soon", content="", published_at=now + timedelta(hours=1)
+    )
+    assert next_go_live() is not None
+    monkeypatch.setattr(timezone, "now", lambda: now + timedelta(hours=2))
+
+    assert check_go_live() is True
+    out = StringIO()
+    call_command("warm_pages", stdout=out)
+    assert "Not warming" in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "test_replica"])
+def test_public_reads_go_to_the_replica_except_after_writes(
+    client: Client, django_user_model: Any, settings: Any
+) -> None:
+    # A second connection to the test database stands in for the replica.
+    replica = "test_replica"
+    settings.DATABASE_REPLICAS = [replica]
+    settings.PAGE_CACHE_TIMEOUT = 0
+    post = Post.objects.create(
+        title="Replicated",
+        slug="replicated",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, title="Replicated", slug="replicated")
+    public_urls = [
+        reverse("post_list"),
+        reverse("post_detail", kwargs={"slug": "replicated"}),
+        reverse("sitemap"),
+        f"{reverse('post_search')}?q=replicated",
+    ]
+
+    def blog_queries(alias: str, urls: list[str]) -> int:
+        with CaptureQueriesContext(connections[alias]) as queries:
+            for url in urls:
+                assert client.get(url, secure=True).status_code == 200
+        return sum('"blog_' in query["sql"] for query in queries.captured_queries)
+
+    # The go-live clock (primary) is cached; everything else comes from the replica.
+    next_go_live()
+    assert blog_queries("default", public_urls) == 0
+    assert blog_queries(replica, public_urls) >= len(public_urls)
+
+    # Editor views read from the primary.
+    editor = django_user_model.objects.create_superuser(
+        "editor",
+        "editor@example.com",
+        "pw",  # noqa: S106
+    )
+    client.force_login(editor)
+    manage_url = reverse("post_manage_list")
+    assert blog_queries(replica, [manage_url]) == 0
+    assert blog_queries("default", [manage_url]) > 0
+
+    # After a write, the same visitor reads their own writes from the primary.
+    response = client.post(
+        reverse("post_update", args=[post.pk]),
+        {
+            "title": "Replicated again",
+            "slug": "replicated",
+            "content": "Edited",
+            "title_en": "Replicated again",
+            "title_uk": "Репліка",
+            "slug_en": "replicated",
+            "slug_uk": "replicated-uk",
+            "content_en": "Edited",
+            "content_uk": "Змінено",
+            "published_at": post.published_at.strftime("%Y-%m-%dT%H:%M"),
+        },
+        secure=True,
+    )
+    assert response.status_code == 302
+    assert response.cookies[PRIMARY_READS_COOKIE]["max-age"] == (
+        settings.REPLICA_PIN_SECONDS
+    )
+    assert blog_queries(replica, public_urls) == 0
+    assert blog_queries("default", public_urls) >= len(public_urls)
+
+    # Once the pin expires, reads go back to the replica.
+    client.cookies.pop(PRIMARY_READS_COOKIE)
+    assert blog_queries(replica, public_urls[:1]) > 0
+
+
+def _urlconf(*, async_views: bool) -> ModuleType:
+    urlconf = ModuleType(f"test_urls_{'async' if async_views else 'sync'}")
+    urlconf.urlpatterns = build_urlpatterns(async_views=async_views)  # type: ignore[attr-defined]
+    return urlconf
+
+
+def _create_served_post(title: str, slug: str) -> str:
+    post = Post.objects.create(
+        title=title,
+        slug=slug,
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, title=title, slug=slug)
+    return reverse("post_detail", kwargs={"slug": slug})
+
+
+@pytest.mark.django_db
+def test_public_views_serve_asgi_requests_concurrently(settings: Any) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    settings.ROOT_URLCONF = _urlconf(async_views=True)
+    detail_url = _create_served_post("Served async", "served-async")
+    urls = [reverse("post_list"), detail_url, reverse("sitemap"), reverse("robots_txt")]
+    assert all(iscoroutinefunction(resolve(url).func) for url in urls)
+
+    async def fetch_all() -> list[Any]:
+        client = AsyncClient()
+        return await asyncio.gather(*(client.get(url, secure=True) for url in urls))
+
+    listed, detail, sitemap, robots = async_to_sync(fetch_all)()
+    responses = (listed, detail, sitemap, robots)
+    assert [response.status_code for response in responses] == [200] * 4
+    assert "Served async" in listed.content.decode()
+    assert "Served async" in detail.content.decode()
+    assert detail_url in sitemap.content.decode()
+    assert detail.has_header("ETag") and robots.has_header("ETag")
+
+
+@pytest.mark.django_db
+def test_sync_workers_get_sync_public_views(client: Client, settings: Any) -> None:
+    settings.PAGE_CACHE_TIMEOUT = 0
+    settings.ROOT_URLCONF = _urlconf(async_views=False)
+    detail_url = _create_served_post("Served sync", "served-sync")
+    urls = [reverse("post_list"), detail_url, reverse("sitemap"), reverse("robots_txt")]
+    # Nothing for a WSGI worker to run through ``async_to_sync``.
+    assert not any(iscoroutinefunction(resolve(url).func) for url in urls)
+
+    listed, detail, sitemap, robots = (client.get(url, secure=True) for url in urls)
+    assert "Served sync" in listed.content.decode()
+    assert "Served sync" in detail.content.decode()
+    assert detail_url in sitemap.content.decode()
+    assert robots.status_code == 200
+    for url, response in zip(urls, (listed, detail, sitemap, robots), strict=True):
+        revalidated = client.get(url, secure=True, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert revalidated.status_code == 304, url
+
+    response = client.get(reverse("post_list"), {"after": "not-a-cursor"}, secure=True)
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warmed_worker_redirects_former_slugs_from_its_first_request(
+    client: Client, django_assert_num_queries: Any
+) -> None:
+    post = Post.objects.create(
+        title="Warm",
+        slug="warm",
+        content="",
+        published_at=timezone.now() - timedelta(days=1),
+    )
+    set_localized_post_fields(post, slug="cold-name")
+    post.slug_en = "warm-name"
+    post.save()
+
+    warm_shared_caches()
+    warm_worker_caches()
+
+    with django_assert_num_queries(0):
+        response = client.get(
+            reverse("post_detail", kwargs={"slug": "cold-name"}), secure=True
+        )
+    assert response.status_code == 301
+    assert response["Location"].endswith("/warm-name/")
@@ -5,13 +5,22 @@ from .models import Category, Post
 
 @register(Post)
 class PostTranslationOptions(TranslationOptions):
-    # We translate title and content only.
+    # We translate title and content, plus the HTML and plain-text summary
+    # rendered from content on save so the active language's markup is a
+    # plain column read.
     #
     # Slugs are kept canonical on the base ``slug`` field so that
     # ``post.slug`` is stable regardless of active language, while
     # language-specific slugs live on ``slug_en`` / ``slug_uk`` and
     # are used explicitly by query helpers and views.
-    fields = ("title", "content")
+    fields = (
+        "title",
+        "content",
+        "content_html",
+        "excerpt",
+        "word_count",
+        "reading_time",
+    )
 
 
 @register(Category)
@@ -1,19 +1,34 @@
-from django.urls import path
+from django.conf import settings
+from django.urls import URLPattern, path
 
 from .views import (
+    AsyncPostDetailView,
+    AsyncPostListView,
     PostCreateView,
     PostDetailView,
     PostListView,
     PostManageListView,
+    PostPreviewView,
+    PostSearchView,
     PostUpdateView,
 )
 
-urlpatterns = [
-    # Internal editor workflow (superadmins only)
-    path("manage/posts/", PostManageListView.as_view(), name="post_manage_list"),
-    path("manage/posts/new/", PostCreateView.as_view(), name="post_create"),
-    path("manage/posts/<int:pk>/", PostUpdateView.as_view(), name="post_update"),
-    # Public blog
-    path("", PostListView.as_view(), name="post_list"),
-    path("<slug:slug>/", PostDetailView.as_view(), name="post_detail"),
-]
+
+def build_urlpatterns(*, async_views: bool) -> list[URLPattern]:
+    """Return the blog's URLs, with the async or the sync public pages."""
+    list_view = AsyncPostListView if async_views else PostListView
+    detail_view = AsyncPostDetailView if async_views else PostDetailView
+    return [
+        # Internal editor workflow (superadmins only)
+        path("manage/posts/", PostManageListView.as_view(), name="post_manage_list"),
+        path("manage/posts/new/", PostCreateView.as_view(), name="post_create"),
+        path("manage/posts/<int:pk>/", PostUpdateView.as_view(), name="post_update"),
+        path("manage/posts/preview/", PostPreviewView.as_view(), name="post_preview"),
+        # Public blog
+        path("", list_view.as_view(), name="post_list"),
+        path("search/", PostSearchView.as_view(), name="post_search"),
+        path("<slug:slug>/", detail_view.as_view(), name="post_detail"),
+    ]
+
+
+urlpatterns = build_urlpatterns(async_views=settings.ASYNC_VIEWS)
@@ -0,0 +1,172 @@
+"""Validators (ETag / Last-Modified) for conditional GET on public pages.
+
+Validators are computed before the view runs, from at most one query (for
+post pages, the lookup the view needs anyway), so an unchanged page is
+answered with 304 without rendering. Async views load that query with the
+async ORM first (:func:`apublished_state`, :func:`aresolve_post`); the
+validators then read the memoized result.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import HttpRequest, HttpResponse
+from django.urls import reverse
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
+
+from ..models import Post
+
+
+def weak_etag(*parts: object) -> str:
+    """Return a weak ETag derived from ``parts``."""
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _latest(*values: datetime | None) -> datetime | None:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def published_state(request: HttpRequest) -> tuple[datetime | None, int]:
+    """Return when the set of published posts last changed, and its size.
+
+    The time is the later of the posts' ``updated_at`` (which also moves when
+    their category labels change) and the newest ``published_at`` that has
+    passed (the publication cut-off, which moves when a scheduled post goes
+    live). The count changes when posts are deleted or unpublished. Memoized
+    per request.
+    """
+    state: tuple[datetime | None, int] | None = getattr(
+        request, "_published_state", None
+    )
+    if state is None:
+        totals = Post.public.published().aggregate(**_PUBLISHED_STATE)
+        state = _remember_published_state(request, totals)
+    return state
+
+
+async def apublished_state(request: HttpRequest) -> tuple[datetime | None, int]:
+    """Async :func:`published_state`, sharing its memo."""
+    state: tuple[datetime | None, int] | None = getattr(
+        request, "_published_state", None
+    )
+    if state is None:
+        totals = await Post.public.published().aaggregate(**_PUBLISHED_STATE)
+        state = _remember_published_state(request, totals)
+    return state
+
+
+_PUBLISHED_STATE = {
+    "updated": Max("updated_at"),
+    "published": Max("published_at"),
+    "count": Count("pk"),
+}
+
+
+def _remember_published_state(
+    request: HttpRequest, totals: dict[str, object]
+) -> tuple[datetime | None, int]:
+    state = (
+        _latest(totals["updated"], totals["published"]),  # type: ignore[arg-type]
+        int(totals["count"]),  # type: ignore[call-overload]
+    )
+    request._published_state = state  # type: ignore[attr-defined]
+    return state
+
+
+def published_etag(request: HttpRequest, *args: object, **kwargs: object) -> str:
+    """ETag of pages listing published posts (post list, sitemap)."""
+    last_modified, count = published_state(request)
+    lang = get_language() or settings.LANGUAGE_CODE
+    return weak_etag("posts", lang, request.get_full_path(), count, last_modified)
+
+
+def published_last_modified(
+    request: HttpRequest, *args: object, **kwargs: object
+) -> datetime | None:
+    return published_state(request)[0]
+
+
+def resolve_post(request: HttpRequest, slug: str, lang: str) -> Post | None:
+    """Resolve ``slug`` like :meth:`PostPublicQuerySet.resolve_slug`, once per request.
+
+    The validators and the view share the result, so conditional GET adds no
+    query. The post's ``updated_at`` covers everything its page shows,
+    category names included.
+    """
+    resolved: Post | None | bool = getattr(request, "_resolved_post", False)
+    if resolved is False:
+        resolved = Post.public.resolve_slug(slug, lang)
+        request._resolved_post = resolved  # type: ignore[attr-defined]
+    return resolved or None
+
+
+async def aresolve_post(request: HttpRequest, slug: str, lang: str) -> Post | None:
+    """Async :func:`resolve_post`, sharing its memo."""
+    resolved: Post | None | bool = getattr(request, "_resolved_post", False)
+    if resolved is False:
+        resolved = await Post.public.aresolve_slug(slug, lang)
+        request._resolved_post = resolved  # type: ignore[attr-defined]
+    return resolved or None
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs from :meth:`get_etag`/:meth:`get_last_modified`.
+
+    The validators are computed before the view runs; a matching
+    ``If-None-Match``/``If-Modified-Since`` returns 304 without rendering.
+    In async views, :meth:`aload_validators` runs first, so the validators
+    do no I/O on the event loop.
+    """
+
+    def get_etag(self, request: HttpRequest) -> str | None:
+        return None
+
+    def get_last_modified(self, request: HttpRequest) -> datetime | None:
+        return None
+
+    async def aload_validators(self, request: HttpRequest) -> None:
+        """Load what the validators read, with the async ORM (async views)."""
+
+    def dispatch(
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        if self.view_is_async:  # type: ignore[attr-defined]
+            return self._aconditional_dispatch(request, *args, **kwargs)  # type: ignore[return-value]
+        return self._conditional(super().dispatch)(request, *args, **kwargs)  # type: ignore[misc]
+
+    async def _aconditional_dispatch(
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        await self.aload_validators(request)
+        dispatch = super().dispatch  # type: ignore[misc]
+
+        async def view(
+            request: HttpRequest, *args: object, **kwargs: object
+        ) -> HttpResponse:
+            return await dispatch(request, *args, **kwargs)
+
+        return await self._conditional(view)(request, *args, **kwargs)
+
+    def _conditional(self, view: Callable[..., object]) -> Callable[..., Any]:
+        return condition(
+            etag_func=lambda request, *a, **kw: self.get_etag(request),
+            last_modified_func=lambda request, *a, **kw: self.get_last_modified(
+                request
+            ),
+        )(view)
+
+
+def robots_etag(request: HttpRequest, *args: object, **kwargs: object) -> str:
+    """robots.txt only changes with the host the sitemap is advertised on."""
+    return weak_etag("robots", request.build_absolute_uri(reverse("sitemap")))
@@ -1,25 +1,200 @@
 from __future__ import annotations
 
+import base64
 import logging
+import math
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Hashable, Iterable, Mapping, NamedTuple, TypedDict, TypeVar
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import Storage
 from django.db.models.fields.files import ImageFieldFile
-from PIL import Image
+from PIL import Image, features
 
 logger = logging.getLogger(__name__)
 
+# Labels of the original two-variant scheme. These widths keep their ``@1x`` /
+# ``@2x`` file names so existing uploads and manifests stay valid; every other
+# width of the ladder is labelled ``<width>w``.
 WEBP_VARIANT_WIDTHS: Mapping[str, int] = {"1x": 1280, "2x": 2048}
+DEFAULT_VARIANT_WIDTHS = (320, 640, 960, 1280, 2048)
 WEBP_QUALITY = 82
 
+# Estimated bytes held per pixel while one variant is encoded: the RGB frame
+# plus the encoder's working buffers. Used to keep parallel encodes in budget.
+ENCODE_BYTES_PER_PIXEL = 8
+# Bytes per pixel of a resized frame waiting in this process (Pillow stores RGB
+# pixels in 32 bits); these count against the same budget.
+FRAME_BYTES_PER_PIXEL = 4
+ENCODE_TASKS_PER_CHILD = 50
 
-def _variant_name(original_name: str, label: str) -> str:
+# The inline placeholder is a tiny WebP the browser upscales (and thereby
+# blurs) until the real image arrives; ~150 bytes of base64 per post.
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+
+
+class VariantFormat(NamedTuple):
+    """How one output format is encoded and announced to browsers."""
+
+    pillow_format: str
+    extension: str
+    mime_type: str
+    options: Mapping[str, object]
+
+
+# Ordered by preference: ``<source>`` elements are emitted in this order.
+VARIANT_FORMATS: Mapping[str, VariantFormat] = {
+    "avif": VariantFormat("AVIF", "avif", "image/avif", {"quality": 55, "speed": 6}),
+    "webp": VariantFormat(
+        "WEBP", "webp", "image/webp", {"quality": WEBP_QUALITY, "method": 6}
+    ),
+}
+
+
+class VariantInfo(TypedDict):
+    """Manifest entry describing one generated variant."""
+
+    name: str
+    width: int
+    height: int
+    bytes: int
+
+
+class ImageDetails(NamedTuple):
+    """Facts about an original image recorded next to its variants.
+
+    Templates use them to reserve layout space and paint a placeholder
+    without opening the file.
+    """
+
+    width: int
+    height: int
+    color: str
+    placeholder: str
+
+
+# format -> label -> variant info, stored on the owning model so rendering
+# never has to ask the storage backend (an HTTP HEAD per label on R2) what
+# exists. Manifests written before AVIF support are flat (label -> info) and
+# describe WebP files; ``normalize_manifest`` reads both shapes.
+VariantManifest = dict[str, dict[str, VariantInfo]]
+
+_Key = TypeVar("_Key", bound=Hashable)
+
+
+class GeneratedVariants(NamedTuple):
+    """Result of :func:`generate_image_variants`."""
+
+    manifest: VariantManifest
+    details: ImageDetails | None
+
+
+def variant_label(width: int) -> str:
+    """Return the file-name label of a ladder width."""
+    for label, legacy_width in WEBP_VARIANT_WIDTHS.items():
+        if width == legacy_width:
+            return label
+    return f"{width}w"
+
+
+def variant_widths() -> dict[str, int]:
+    """Return the configured ladder (``IMAGE_VARIANT_WIDTHS``) keyed by label."""
+    widths = getattr(settings, "IMAGE_VARIANT_WIDTHS", None) or DEFAULT_VARIANT_WIDTHS
+    return {variant_label(width): width for width in sorted(set(widths))}
+
+
+def variant_formats() -> tuple[str, ...]:
+    """Return the configured output formats this Pillow build can encode."""
+    configured = getattr(settings, "IMAGE_VARIANT_FORMATS", None) or tuple(
+        VARIANT_FORMATS
+    )
+    formats = []
+    for name in VARIANT_FORMATS:
+        if name not in configured:
+            continue
+        if not features.check(name):
+            logger.warning("Pillow cannot encode %s; skipping those variants", name)
+            continue
+        formats.append(name)
+    return tuple(formats)
+
+
+def _is_flat_manifest(manifest: Mapping[str, object]) -> bool:
+    return any(
+        isinstance(value, Mapping) and "name" in value for value in manifest.values()
+    )
+
+
+def normalize_manifest(manifest: Mapping[str, object] | None) -> VariantManifest:
+    """Return a manifest in the per-format shape, upgrading legacy flat ones."""
+    if not manifest:
+        return {}
+    if _is_flat_manifest(manifest):
+        return {"webp": dict(manifest)}  # type: ignore[dict-item]
+    return {
+        fmt: dict(entries)  # type: ignore[misc]
+        for fmt, entries in manifest.items()
+        if isinstance(entries, Mapping)
+    }
+
+
+def manifest_is_current(
+    manifest: Mapping[str, object] | None,
+    widths: Mapping[str, int] | None = None,
+    formats: Iterable[str] | None = None,
+    source_width: int | None = None,
+) -> bool:
+    """Return True when a manifest matches the configured ladder and formats.
+
+    Every ladder width below the original's width must exist, plus the
+    smallest label the original itself could have been generated for. When
+    ``source_width`` is unknown the widest recorded variant stands in for it.
+    """
+    if not manifest or _is_flat_manifest(manifest):
+        return False
+    widths = widths or variant_widths()
+    formats = tuple(formats) if formats is not None else variant_formats()
+    entries = normalize_manifest(manifest)
+    if set(entries) != set(formats):
+        return False
+    for variants in entries.values():
+        if not variants or not set(variants) <= set(widths):
+            return False
+        widest = source_width or max(info["width"] for info in variants.values())
+        expected = {label for label, width in widths.items() if width < widest}
+        expected.add(
+            min(
+                (label for label, width in widths.items() if width >= widest),
+                key=widths.__getitem__,
+                default=max(widths, key=widths.__getitem__),
+            )
+        )
+        if set(variants) != expected:
+            return False
+    return True
+
+
+def variant_names(manifest: Mapping[str, object] | None) -> set[str]:
+    """Return the storage names of every variant recorded in a manifest."""
+    return {
+        info["name"]
+        for variants in normalize_manifest(manifest).values()
+        for info in variants.values()
+    }
+
+
+def _variant_name(original_name: str, label: str, extension: str = "webp") -> str:
     """Return the storage path for a derived variant."""
     path = Path(original_name)
-    variant = f"{path.stem}@{label}.webp"
+    variant = f"{path.stem}@{label}.{extension}"
     return str(path.with_name(variant)).replace("\\", "/")
 
 
@@ -33,90 +208,324 @@ def _resize_image(image: Image.Image, target_width: int) -> Image.Image:
     return image.resize((target_width, new_height), Image.LANCZOS)
 
 
-def delete_webp_variants(
+def _delete_names(storage: Storage, names: Iterable[str], *, check: bool) -> None:
+    for name in names:
+        try:
+            if not check or storage.exists(name):
+                storage.delete(name)
+        except Exception:  # pragma: no cover - storage backend specific
+            logger.exception("Failed deleting variant %s", name)
+
+
+def delete_image_variants(
     original_name: str,
     storage: Storage,
-    labels: Iterable[str] | None = None,
+    manifest: Mapping[str, object] | None = None,
 ) -> None:
-    """Remove existing derived variants for a given original image."""
-    for label in labels or WEBP_VARIANT_WIDTHS.keys():
-        variant_name = _variant_name(original_name, label)
-        try:
-            if storage.exists(variant_name):
-                storage.delete(variant_name)
-        except Exception:  # pragma: no cover - storage backend specific
-            logger.exception("Failed deleting variant %s", variant_name)
+    """Remove derived variants for a given original image.
+
+    With a manifest only the recorded files are deleted, without asking the
+    storage what exists. Otherwise every name the configured ladder (and the
+    legacy ``@1x``/``@2x`` labels) could have produced is checked.
+    """
+    names = variant_names(manifest)
+    if names:
+        _delete_names(storage, sorted(names), check=False)
+        return
+    labels = {*variant_widths(), *WEBP_VARIANT_WIDTHS}
+    _delete_names(
+        storage,
+        [
+            _variant_name(original_name, label, fmt.extension)
+            for fmt in VARIANT_FORMATS.values()
+            for label in sorted(labels)
+        ],
+        check=True,
+    )
+
+
+def _open_for_widths(
+    image_field: ImageFieldFile, max_width: int
+) -> tuple[Image.Image, tuple[int, int]]:
+    """Decode an upload at no more resolution than the widest variant needs.
+
+    JPEGs are decoded by libjpeg directly at 1/2, 1/4 or 1/8 scale via
+    ``draft()``; other formats are box-reduced by an integer factor right
+    after decoding, so the full-resolution frame is dropped early. Returns the
+    decoded image and the original's intrinsic size.
+    """
+    source = Image.open(image_field)
+    original_size = source.size
+    if source.width > max_width:
+        scale = max_width / source.width
+        source.draft("RGB", (max_width, math.ceil(source.height * scale)))
+    source.load()
+    image = source
+    factor = image.width // max_width
+    if factor >= 2:
+        image = image.reduce(factor)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if image is not source:
+        source.close()
+    return image, original_size
+
+
+def _describe_image(image: Image.Image, original_size: tuple[int, int]) -> ImageDetails:
+    """Return the intrinsic size, average colour and a blurred placeholder."""
+    red, green, blue = image.resize((1, 1), Image.BOX).getpixel((0, 0))  # type: ignore[misc]
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    thumbnail = image.resize((PLACEHOLDER_WIDTH, height), Image.BOX)
+    buffer = BytesIO()
+    thumbnail.save(buffer, format="WEBP", quality=PLACEHOLDER_QUALITY)
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return ImageDetails(
+        width=original_size[0],
+        height=original_size[1],
+        color=f"#{red:02x}{green:02x}{blue:02x}",
+        placeholder=f"data:image/webp;base64,{encoded}",
+    )
+
+
+def _downscale_chain(
+    image: Image.Image, widths: Mapping[str, int]
+) -> dict[str, Image.Image]:
+    """Resize to every width, widest first, each step from the previous result.
+
+    Widths the source cannot fill collapse into one variant at the source's
+    own width (kept under the smallest such label), so srcsets never list the
+    same pixels twice.
+    """
+    results: dict[str, Image.Image] = {}
+    current = image
+    previous: str | None = None
+    for label, width in sorted(widths.items(), key=lambda item: -item[1]):
+        current = _resize_image(current, width)
+        if previous is not None and results[previous].width == current.width:
+            results.pop(previous).close()
+        results[label] = current
+        previous = label
+    return results
+
+
+def _encode_variant(image: Image.Image, fmt: str) -> bytes:
+    """Encode one variant; runs in a pool process when encoding in parallel."""
+    spec = VARIANT_FORMATS[fmt]
+    buffer = BytesIO()
+    image.save(buffer, format=spec.pillow_format, **spec.options)
+    return buffer.getvalue()
+
+
+_encode_pool: ProcessPoolExecutor | None = None
+_encode_pool_lock = threading.Lock()
+
+
+def _get_encode_pool(workers: int) -> ProcessPoolExecutor:
+    global _encode_pool
+    with _encode_pool_lock:
+        if _encode_pool is None:
+            # "spawn" keeps the parent's DB connections and threads (gunicorn,
+            # the job worker) out of the children; recycling them bounds leaks.
+            _encode_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=ENCODE_TASKS_PER_CHILD,
+            )
+        return _encode_pool
+
+
+def _discard_encode_pool() -> None:
+    global _encode_pool
+    with _encode_pool_lock:
+        if _encode_pool is not None:
+            _encode_pool.shutdown(wait=False, cancel_futures=True)
+            _encode_pool = None
+
 
+def _frame_bytes(image: Image.Image) -> int:
+    return image.width * image.height * FRAME_BYTES_PER_PIXEL
 
-def generate_webp_variants(
+
+def _encode_variants(
+    tasks: Mapping[_Key, tuple[Image.Image, str]],
+) -> dict[_Key, Future[bytes]]:
+    """Encode variants, in parallel when ``IMAGE_ENCODE_WORKERS`` > 1.
+
+    ``IMAGE_MEMORY_BUDGET_MB`` covers both the resized frames this process
+    still holds and the estimated working memory of the encodes in flight.
+    Each frame is closed once its last encode has finished, which makes room
+    for more. The largest variants go first so a big encode never waits
+    behind small ones.
+    """
+    workers = getattr(settings, "IMAGE_ENCODE_WORKERS", 1)
+    futures: dict[_Key, Future[bytes]] = {}
+    if workers <= 1 or len(tasks) <= 1:
+        for key, (image, fmt) in tasks.items():
+            future: Future[bytes] = Future()
+            try:
+                future.set_result(_encode_variant(image, fmt))
+            except Exception as exc:  # pragma: no cover - Pillow specific
+                future.set_exception(exc)
+            futures[key] = future
+        return futures
+
+    budget = getattr(settings, "IMAGE_MEMORY_BUDGET_MB", 256) * 1024 * 1024
+    pool = _get_encode_pool(workers)
+    frames = {id(image): image for image, _fmt in tasks.values()}
+    unfinished = Counter(id(image) for image, _fmt in tasks.values())
+    held = sum(_frame_bytes(image) for image in frames.values())
+    in_flight: list[tuple[int, int, Future[bytes]]] = []
+    for key, (image, fmt) in sorted(
+        tasks.items(), key=lambda item: -item[1][0].width * item[1][0].height
+    ):
+        cost = image.width * image.height * ENCODE_BYTES_PER_PIXEL
+        while in_flight and held + sum(c for c, _, _ in in_flight) + cost > budget:
+            wait([f for _, _, f in in_flight], return_when=FIRST_COMPLETED)
+            for _cost, frame, done in in_flight:
+                if not done.done():
+                    continue
+                unfinished[frame] -= 1
+                if not unfinished[frame]:
+                    held -= _frame_bytes(frames[frame])
+                    frames.pop(frame).close()
+            in_flight = [entry for entry in in_flight if not entry[2].done()]
+        futures[key] = pool.submit(_encode_variant, image, fmt)
+        in_flight.append((cost, id(image), futures[key]))
+    return futures
+
+
+def generate_image_variants(
     image_field: ImageFieldFile,
     widths: Mapping[str, int] | None = None,
-) -> list[str]:
+    formats: Iterable[str] | None = None,
+    *,
+    strict: bool = False,
+) -> GeneratedVariants:
     """
-    Generate WebP variants (1x/2x) for an ImageFieldFile.
+    Generate the responsive variant ladder of an ImageFieldFile.
 
-    Returns a list of storage paths that were generated.
+    Every width (default: ``IMAGE_VARIANT_WIDTHS``) is encoded in every format
+    (default: ``IMAGE_VARIANT_FORMATS``). Returns a manifest of the variants
+    that were generated together with the original's details. Failures are
+    logged and skipped unless ``strict`` is set, in which case they propagate
+    so a background job can retry.
     """
     if not image_field or not image_field.name:
-        return []
+        return GeneratedVariants({}, None)
 
-    widths = widths or WEBP_VARIANT_WIDTHS
+    widths = widths or variant_widths()
+    formats = tuple(formats) if formats is not None else variant_formats()
     storage = image_field.storage
-    generated: list[str] = []
+    manifest: VariantManifest = {}
 
     try:
         image_field.open()
-        base_image = Image.open(image_field)
-        base_image.load()
-        base_image = base_image.convert("RGB")
+        base_image, original_size = _open_for_widths(image_field, max(widths.values()))
     except Exception:
+        image_field.close()
+        if strict:
+            raise
         logger.exception("Failed opening featured image for conversion")
-        return []
+        return GeneratedVariants({}, None)
 
     try:
-        for label, width in widths.items():
-            variant_name = _variant_name(image_field.name, label)
+        resized = _downscale_chain(base_image, widths)
+        details: ImageDetails | None = None
+        try:
+            # Derived from the smallest variant: cheap, and plenty for 16px.
+            details = _describe_image(
+                min(resized.values(), key=lambda image: image.width), original_size
+            )
+        except Exception:  # pragma: no cover - Pillow specific
+            if strict:
+                raise
+            logger.exception("Failed describing %s", image_field.name)
+        # The chain holds everything the encoders need; free the decoded frame.
+        base_image.close()
+        encoded = _encode_variants(
+            {
+                (fmt, label): (image, fmt)
+                for label, image in resized.items()
+                for fmt in formats
+            }
+        )
+        for (fmt, label), future in encoded.items():
+            variant_name = _variant_name(
+                image_field.name, label, VARIANT_FORMATS[fmt].extension
+            )
             try:
-                resized = _resize_image(base_image, width)
-                buffer = BytesIO()
-                resized.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=6)
-                delete_webp_variants(image_field.name, storage, labels=[label])
-                storage.save(variant_name, ContentFile(buffer.getvalue()))
-                buffer.close()
-                generated.append(variant_name)
-            except Exception:  # pragma: no cover - Pillow/storage specific
+                data = future.result()
+                _delete_names(storage, [variant_name], check=True)
+                saved_name = storage.save(variant_name, ContentFile(data))
+                manifest.setdefault(fmt, {})[label] = {
+                    "name": saved_name,
+                    "width": resized[label].width,
+                    "height": resized[label].height,
+                    "bytes": len(data),
+                }
+            except Exception as exc:  # pragma: no cover - Pillow/storage specific
+                if isinstance(exc, BrokenProcessPool):
+                    _discard_encode_pool()
+                if strict:
+                    raise
                 logger.exception(
-                    "Failed generating %s variant for %s", label, image_field.name
+                    "Failed generating %s %s variant for %s",
+                    fmt,
+                    label,
+                    image_field.name,
                 )
     finally:
         base_image.close()
         image_field.close()
-    return generated
+    return GeneratedVariants(manifest, details)
 
 
-def get_variant_urls(
-    image_field: ImageFieldFile,
-    labels: Iterable[str] | None = None,
-) -> dict[str, str]:
-    """Return available variant URLs keyed by label."""
-    if not image_field or not image_field.name:
-        return {}
-    labels = tuple(labels or WEBP_VARIANT_WIDTHS.keys())
-    storage = image_field.storage
-    urls: dict[str, str] = {}
-    for label in labels:
-        variant_name = _variant_name(image_field.name, label)
-        try:
-            if storage.exists(variant_name):
-                urls[label] = storage.url(variant_name)
-        except Exception:  # pragma: no cover
-            logger.exception("Failed resolving URL for %s", variant_name)
-    return urls
+def _sorted_variants(
+    manifest: Mapping[str, object] | None, fmt: str
+) -> list[VariantInfo]:
+    entries = normalize_manifest(manifest).get(fmt, {})
+    return sorted(entries.values(), key=lambda info: info["width"])
+
+
+def build_srcset(
+    storage: Storage, manifest: Mapping[str, object] | None, fmt: str
+) -> str:
+    """Return a width-descriptor ``srcset`` for one format of a manifest.
+
+    This is pure string work: only variants recorded in the manifest are
+    listed and the storage backend is never asked whether files exist.
+    """
+    return ", ".join(
+        f"{storage.url(info['name'])} {info['width']}w"
+        for info in _sorted_variants(manifest, fmt)
+    )
+
+
+def largest_variant_url(
+    storage: Storage, manifest: Mapping[str, object] | None, fmt: str = "webp"
+) -> str | None:
+    """Return the URL of the widest recorded variant of a format, if any."""
+    variants = _sorted_variants(manifest, fmt)
+    return storage.url(variants[-1]["name"]) if variants else None
 
 
 __all__ = [
+    "DEFAULT_VARIANT_WIDTHS",
+    "GeneratedVariants",
+    "ImageDetails",
+    "VARIANT_FORMATS",
     "WEBP_VARIANT_WIDTHS",
-    "delete_webp_variants",
-    "generate_webp_variants",
-    "get_variant_urls",
+    "VariantFormat",
+    "VariantInfo",
+    "VariantManifest",
+    "build_srcset",
+    "delete_image_variants",
+    "generate_image_variants",
+    "largest_variant_url",
+    "manifest_is_current",
+    "normalize_manifest",
+    "variant_formats",
+    "variant_label",
+    "variant_names",
+    "variant_widths",
 ]
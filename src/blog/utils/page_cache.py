@@ -0,0 +1,182 @@
+"""Full-page cache for the public list and detail pages of anonymous visitors."""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from django.utils.translation import get_language
+
+from .versions import acurrent_version, bump_version, current_version
+
+# Backends whose entries stay inside one process.
+PER_PROCESS_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+# Part of every page key; bumping it orphans all cached pages at once.
+PAGE_CACHE_VERSION_KEY = "blog:pages:version"
+PAGE_CACHE_KEY_PREFIX = "blog:page"
+# Query parameters that select different content; any other parameter
+# bypasses the cache rather than multiplying its keys.
+PAGE_CACHE_QUERY_PARAMS = frozenset({"page", "after"})
+# Response headers kept with a cached page; the validators let a cache hit
+# answer conditional requests with 304 too.
+PAGE_CACHE_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def page_cache_is_shared() -> bool:
+    """Whether every process on the host reads the pages cached by this one."""
+    return settings.CACHES["default"]["BACKEND"] not in PER_PROCESS_CACHES
+
+
+def bump_page_cache_version() -> None:
+    """Invalidate every cached page (in every process sharing the cache)."""
+    bump_version(PAGE_CACHE_VERSION_KEY)
+
+
+def page_cache_key(request: HttpRequest) -> str | None:
+    """Return the cache key of ``request``, or ``None`` if it is not cacheable.
+
+    Only anonymous GET/HEAD requests are cached. The key covers the current
+    version, the language, the absolute URL (scheme, host and path, which the
+    canonical links depend on) and the page number or cursor.
+    """
+    if not _cacheable(request, getattr(request, "user", None)):
+        return None
+    return _page_key(request, current_version(PAGE_CACHE_VERSION_KEY))
+
+
+async def apage_cache_key(request: HttpRequest) -> str | None:
+    """Async :func:`page_cache_key`, for async views."""
+    auser = getattr(request, "auser", None)
+    user = await auser() if auser is not None else None
+    if not _cacheable(request, user):
+        return None
+    return _page_key(request, await acurrent_version(PAGE_CACHE_VERSION_KEY))
+
+
+def _cacheable(request: HttpRequest, user: object) -> bool:
+    if not settings.PAGE_CACHE_TIMEOUT or request.method not in ("GET", "HEAD"):
+        return False
+    if user is not None and user.is_authenticated:  # type: ignore[attr-defined]
+        return False
+    return not set(request.GET) - PAGE_CACHE_QUERY_PARAMS
+
+
+def _page_key(request: HttpRequest, version: str) -> str:
+    lang = get_language() or settings.LANGUAGE_CODE
+    after = request.GET.get("after")
+    page = f"after={after}" if after else f"page={request.GET.get('page', '1')}"
+    url = request.build_absolute_uri(request.path)
+    digest = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+    return f"{PAGE_CACHE_KEY_PREFIX}:{version}:{lang}:{page}:{digest}"
+
+
+def load_page(key: str, request: HttpRequest) -> HttpResponse | None:
+    """Return the cached page, or a 304 if the client's copy is still current."""
+    return _cached_response(cache.get(key), request)
+
+
+async def aload_page(key: str, request: HttpRequest) -> HttpResponse | None:
+    """Async :func:`load_page`."""
+    return _cached_response(await cache.aget(key), request)
+
+
+def _cached_response(
+    entry: tuple[dict[str, str], bytes] | None, request: HttpRequest
+) -> HttpResponse | None:
+    if entry is None:
+        return None
+    headers, body = entry
+    last_modified = parse_http_date_safe(headers.get("Last-Modified", ""))
+    not_modified = get_conditional_response(
+        request, etag=headers.get("ETag"), last_modified=last_modified
+    )
+    response = not_modified or HttpResponse(zlib.decompress(body))
+    for name, value in headers.items():
+        if not_modified is None or name != "Content-Type":
+            response[name] = value
+    return response
+
+
+def store_page(key: str, request: HttpRequest, response: HttpResponse) -> None:
+    """Cache a rendered page unless it is personal to this visitor.
+
+    Responses setting cookies, or whose rendering asked for a CSRF token,
+    carry per-visitor state and are never cached.
+    """
+    if (
+        response.status_code != 200
+        or response.streaming
+        or response.cookies
+        or request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        or "private" in response.get("Cache-Control", "")
+    ):
+        return
+    headers = {
+        name: response[name] for name in PAGE_CACHE_HEADERS if response.has_header(name)
+    }
+    body = zlib.compress(response.content, 6)
+    # Imported late: the clock reads posts, whose module imports this one.
+    from .schedule import cap_timeout
+
+    cache.set(key, (headers, body), cap_timeout(settings.PAGE_CACHE_TIMEOUT))
+
+
+class PageCacheMixin:
+    """Serve anonymous visitors a compressed copy of the rendered page.
+
+    Entries are invalidated by :func:`bump_page_cache_version`, which
+    ``blog.signals`` calls whenever posts or categories change. Works for
+    sync and async views alike.
+    """
+
+    def dispatch(
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        if self.view_is_async:  # type: ignore[attr-defined]
+            return self._acached_dispatch(request, *args, **kwargs)  # type: ignore[return-value]
+        key = page_cache_key(request)
+        if key is None:
+            return super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        cached = load_page(key, request)
+        if cached is not None:
+            return cached
+        response: HttpResponse = super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        return _store_when_rendered(key, request, response)
+
+    async def _acached_dispatch(
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        key = await apage_cache_key(request)
+        if key is None:
+            return await super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        cached = await aload_page(key, request)
+        if cached is not None:
+            return cached
+        response: HttpResponse = await super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+            # Stored by the render callback, which runs off the event loop.
+            return _store_when_rendered(key, request, response)
+        await sync_to_async(store_page)(key, request, response)
+        return response
+
+
+def _store_when_rendered(
+    key: str, request: HttpRequest, response: HttpResponse
+) -> HttpResponse:
+    if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+        response.add_post_render_callback(
+            lambda rendered: store_page(key, request, rendered)
+        )
+    else:
+        store_page(key, request, response)
+    return response
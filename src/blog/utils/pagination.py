@@ -0,0 +1,185 @@
+"""Pagination helpers for post lists.
+
+:class:`CachedCountPaginator` keeps numbered pages but caches their
+``COUNT(*)``. Keyset (cursor) pagination over ``(published_at, id)``
+continues strictly after the last post of the previous page, so a page costs
+one indexed range scan however deep it is: no ``OFFSET`` and no ``COUNT(*)``.
+The order matches ``Post.Meta.ordering``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from ..models import Post
+from ..models.cards import PostCard
+from .versions import acurrent_version, current_version
+
+CURSOR_ORDERING = ("-published_at", "-id")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Bumped by ``blog.signals`` whenever posts are saved or deleted.
+POST_COUNT_VERSION_KEY = "blog:post-count:version"
+POST_COUNT_TIMEOUT = 3600
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator whose ``count`` is cached until posts change.
+
+    ``counter`` may return the count together with the time it expires (for
+    the public list, when the next scheduled post goes live). Async views
+    call :meth:`acount` first, which uses ``acounter``, and then paginate
+    without touching the cache or the database. The paginator also provides
+    the elided page window templates render, so pagination costs the same on
+    page 1 of 10 or of 10,000.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet[Post],
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+        *,
+        cache_key: str,
+        counter: Callable[[], tuple[int, datetime | None]] | None = None,
+        acounter: Callable[[], Awaitable[tuple[int, datetime | None]]] | None = None,
+    ) -> None:
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.cache_key = cache_key
+        self.counter = counter
+        self.acounter = acounter
+
+    @cached_property
+    def count(self) -> int:
+        key = self._count_key(current_version(POST_COUNT_VERSION_KEY))
+        count = cache.get(key)
+        if count is None:
+            expires_at = None
+            if self.counter is None:
+                count = super().count
+            else:
+                count, expires_at = self.counter()
+            cache.set(key, count, _count_timeout(expires_at))
+        return count
+
+    async def acount(self) -> int:
+        """Async ``count``; afterwards ``count`` is known without any I/O."""
+        if "count" in self.__dict__:
+            return self.count
+        key = self._count_key(await acurrent_version(POST_COUNT_VERSION_KEY))
+        count = await cache.aget(key)
+        if count is None:
+            expires_at = None
+            if self.acounter is None:
+                count = await self.object_list.acount()
+            else:
+                count, expires_at = await self.acounter()
+            await cache.aset(key, count, _count_timeout(expires_at))
+        self.__dict__["count"] = count
+        return count
+
+    def _count_key(self, version: str) -> str:
+        return f"blog:post-count:{version}:{self.cache_key}"
+
+    def page_window(self, number: int) -> list[int | str]:
+        """Return the page numbers around ``number``, with ellipses between."""
+        return list(self.get_elided_page_range(number, on_each_side=1, on_ends=1))
+
+
+def _count_timeout(expires_at: datetime | None) -> int:
+    if expires_at is None:
+        return POST_COUNT_TIMEOUT
+    remaining = (expires_at - timezone.now()).total_seconds()
+    return max(1, min(POST_COUNT_TIMEOUT, math.ceil(remaining)))
+
+
+def encode_cursor(post: Post | PostCard) -> str:
+    """Return the token of the position right after ``post``.
+
+    The token is ``<published_at in µs since the epoch>-<id>``: stable across
+    requests and deploys, and independent of the posts added since.
+    """
+    if post.published_at is None:
+        raise ValueError("Only published posts have a cursor position")
+    micros = (post.published_at - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}-{post.pk}"
+
+
+def decode_cursor(token: str) -> tuple[datetime, int]:
+    """Parse a token from :func:`encode_cursor`; raise ``ValueError`` if malformed."""
+    micros, _sep, pk = token.partition("-")
+    if not micros.isdigit() or not pk.isdigit():
+        raise ValueError(f"Invalid cursor {token!r}")
+    try:
+        return _EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except OverflowError as exc:
+        raise ValueError(f"Invalid cursor {token!r}") from exc
+
+
+@dataclass
+class CursorPage:
+    """One page of posts, shaped like the parts of ``Page`` templates use."""
+
+    object_list: list[PostCard]
+    next_cursor: str | None
+    is_first: bool
+
+    def __iter__(self) -> Iterator[PostCard]:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return not self.is_first
+
+
+def paginate_by_cursor(
+    queryset: QuerySet[Post], per_page: int, after: str | None
+) -> CursorPage:
+    """Return the ``per_page`` posts following the ``after`` token.
+
+    Raises ``ValueError`` for a malformed token.
+    """
+    posts = list(_after_cursor(queryset, after)[: per_page + 1])
+    return _cursor_page(posts, per_page, after)
+
+
+async def apaginate_by_cursor(
+    queryset: QuerySet[Post], per_page: int, after: str | None
+) -> CursorPage:
+    """Async :func:`paginate_by_cursor`."""
+    posts = [post async for post in _after_cursor(queryset, after)[: per_page + 1]]
+    return _cursor_page(posts, per_page, after)
+
+
+def _after_cursor(queryset: QuerySet[Post], after: str | None) -> QuerySet[Post]:
+    queryset = queryset.order_by(*CURSOR_ORDERING)
+    if after:
+        published_at, pk = decode_cursor(after)
+        # The redundant ``published_at <= …`` bound lets the planner start an
+        # index range scan at the cursor instead of filtering from the top.
+        queryset = queryset.filter(
+            Q(published_at__lt=published_at) | Q(published_at=published_at, pk__lt=pk),
+            published_at__lte=published_at,
+        )
+    return queryset
+
+
+def _cursor_page(posts: list[PostCard], per_page: int, after: str | None) -> CursorPage:
+    # One extra row tells whether another page follows.
+    next_cursor = encode_cursor(posts[per_page - 1]) if len(posts) > per_page else None
+    return CursorPage(posts[:per_page], next_cursor, is_first=not after)
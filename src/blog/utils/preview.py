@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Iterable, NamedTuple
+
+from django.core.cache import cache
+
+from .rendering import MarkdownRenderer, get_renderer, looks_like_html
+
+PREVIEW_CACHE_TIMEOUT = 60 * 60
+PREVIEW_CACHE_PREFIX = "blog:preview"
+
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+# Reference-style link definitions (``[id]: https://…``) apply document-wide,
+# so they are appended to every block instead of living in one of them.
+_LINK_REFERENCE_RE = re.compile(r"^ {0,3}\[[^\]]+\]:\s*\S")
+# Blocks that span blank lines: list items of a loose list, and blockquote
+# paragraphs, render as one list or quote only when kept together.
+_LIST_ITEM_RE = re.compile(r"^ {0,3}(?:[*+-]|\d{1,9}[.)])(?:[ \t]|$)")
+_BLOCKQUOTE_RE = re.compile(r"^ {0,3}>")
+
+
+class PreviewBlock(NamedTuple):
+    key: str
+    html: str
+
+
+def split_blocks(text: str) -> tuple[list[str], list[str]]:
+    """Split Markdown into top-level blocks and document-wide link references.
+
+    Blocks are separated by blank lines. Fenced code is kept whole, and
+    indented lines following a blank line stay attached to the previous block
+    (loose list items, indented code), as do further items of a list and
+    further paragraphs of a blockquote, so each block renders on its own the
+    same way it would inside the full document.
+    """
+    blocks: list[list[str]] = []
+    references: list[str] = []
+    current: list[str] = []
+    fence: str | None = None
+    pending_blank = False
+
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if fence is not None:
+            current.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        if not line.strip():
+            if current:
+                pending_blank = True
+            continue
+
+        if _LINK_REFERENCE_RE.match(line):
+            references.append(line)
+            continue
+
+        if pending_blank:
+            if _continues_block(current, line):
+                current.append("")
+            else:
+                blocks.append(current)
+                current = []
+            pending_blank = False
+
+        current.append(line)
+        match = _FENCE_RE.match(line)
+        if match:
+            fence = match.group(1)[:3]
+
+    if current:
+        blocks.append(current)
+    return ["\n".join(block) for block in blocks], references
+
+
+def _continues_block(block: list[str], line: str) -> bool:
+    """Whether ``line``, after a blank line, still belongs to ``block``."""
+    if line[:1] in (" ", "\t"):
+        return True
+    for pattern in (_LIST_ITEM_RE, _BLOCKQUOTE_RE):
+        if pattern.match(line) and any(pattern.match(prev) for prev in block):
+            return True
+    return False
+
+
+def _block_key(renderer: MarkdownRenderer, source: str) -> str:
+    digest = hashlib.sha1(source.encode(), usedforsecurity=False).hexdigest()
+    return f"{renderer.version}:{digest}"
+
+
+def render_preview_blocks(
+    text: str,
+    renderer: MarkdownRenderer | None = None,
+    known: Iterable[str] = (),
+) -> list[PreviewBlock]:
+    """Render Markdown block by block, reusing cached HTML for unchanged blocks.
+
+    Each block's HTML is cached under a hash of its source, so editing one
+    paragraph of a long article only re-renders that paragraph. Blocks whose
+    key is in ``known`` (already displayed by the client) come back with empty
+    HTML so the response stays small as well.
+    """
+    renderer = renderer or get_renderer()
+    if not text.strip():
+        return []
+
+    raw_html = looks_like_html(text)
+    if raw_html:
+        # Legacy HTML content is published verbatim; preview it the same way.
+        sources = [text]
+    else:
+        blocks, references = split_blocks(text)
+        suffix = "\n\n" + "\n".join(references) if references else ""
+        sources = [block + suffix for block in blocks]
+
+    keys = [_block_key(renderer, source) for source in sources]
+    known_keys = set(known)
+    wanted = {f"{PREVIEW_CACHE_PREFIX}:{key}" for key in keys if key not in known_keys}
+    cached: dict[str, str] = cache.get_many(list(wanted)) if wanted else {}
+
+    fresh: dict[str, str] = {}
+    result: list[PreviewBlock] = []
+    for key, source in zip(keys, sources, strict=True):
+        if key in known_keys:
+            result.append(PreviewBlock(key, ""))
+            continue
+        cache_key = f"{PREVIEW_CACHE_PREFIX}:{key}"
+        html = cached.get(cache_key)
+        if html is None:
+            html = fresh.get(cache_key)
+        if html is None:
+            html = source if raw_html else renderer.render(source)
+            fresh[cache_key] = html
+        result.append(PreviewBlock(key, html))
+
+    if fresh:
+        cache.set_many(fresh, PREVIEW_CACHE_TIMEOUT)
+    return result
+
+
+__all__ = ["PreviewBlock", "split_blocks", "render_preview_blocks"]
@@ -0,0 +1,105 @@
+"""In-process map of post slugs used to answer slug redirects without queries."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from django.http import HttpRequest
+
+from .versions import bump_version, current_version
+
+# Bumped whenever a post is saved or deleted; every process compares it with
+# the version its map was built from.
+SLUG_MAP_VERSION_KEY = "blog:slug-redirects:version"
+# Upper bound on the age of a map, for caches that are not shared between
+# processes (e.g. the local-memory default).
+SLUG_MAP_MAX_AGE = 300.0
+
+
+class SlugRedirectMap:
+    """Slugs of published posts, current and historical.
+
+    ``canonical`` maps a language to ``{post_id: slug}`` for the slug each post
+    is rendered under in that language; ``history`` holds ``(slug, post_id)``
+    pairs for every slug a post was ever reachable under, oldest first.
+    """
+
+    __slots__ = ("_canonical", "_rendered", "_owners")
+
+    def __init__(
+        self,
+        canonical: dict[str, dict[int, str]],
+        history: Iterable[tuple[str, int]],
+    ) -> None:
+        self._canonical = canonical
+        self._rendered = {
+            lang: frozenset(slugs.values()) for lang, slugs in canonical.items()
+        }
+        # Current slugs win over historical ones reused by another post.
+        published = {post_id for slugs in canonical.values() for post_id in slugs}
+        owners = {slug: post_id for slug, post_id in history if post_id in published}
+        for slugs in canonical.values():
+            owners.update((slug, post_id) for post_id, slug in slugs.items())
+        self._owners = owners
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def redirect_target(self, slug: str, lang: str) -> str | None:
+        """Return the slug to redirect ``slug`` to in ``lang``, if any.
+
+        ``None`` means the map has nothing to say: either the slug is rendered
+        as is, or it is unknown and left to the view.
+        """
+        canonical = self._canonical.get(lang)
+        if canonical is None or slug in self._rendered[lang]:
+            return None
+        post_id = self._owners.get(slug)
+        if post_id is None:
+            return None
+        return canonical.get(post_id)
+
+
+def with_query_string(path: str, request: HttpRequest) -> str:
+    """Return ``path`` with the query string of ``request``, as received.
+
+    Slug redirects keep tracking and pagination parameters.
+    """
+    query = request.META.get("QUERY_STRING", "")
+    return f"{path}?{query}" if query else path
+
+
+def invalidate_slug_redirects() -> None:
+    """Make every process rebuild its slug map on its next lookup."""
+    bump_version(SLUG_MAP_VERSION_KEY)
+
+
+class SlugRedirectCache:
+    """Holds one process's :class:`SlugRedirectMap`, rebuilding it when stale."""
+
+    def __init__(self, loader: Callable[[], SlugRedirectMap]) -> None:
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._map: SlugRedirectMap | None = None
+        self._version: str | None = None
+        self._built_at = 0.0
+
+    def get(self) -> SlugRedirectMap:
+        version = current_version(SLUG_MAP_VERSION_KEY)
+        current = self._map
+        if (
+            current is not None
+            and version == self._version
+            and time.monotonic() - self._built_at < SLUG_MAP_MAX_AGE
+        ):
+            return current
+        with self._lock:
+            if self._map is not current and self._map is not None:
+                # Another thread rebuilt it while we waited.
+                return self._map
+            rebuilt = self._loader()
+            self._map, self._version = rebuilt, version
+            self._built_at = time.monotonic()
+            return rebuilt
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import math
+import re
+import threading
+import zlib
+from functools import lru_cache
+from html import unescape
+from typing import Callable, NamedTuple, Protocol, Sequence
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.html import strip_tags
+from markdown import Markdown
+
+# Bump whenever the Markdown pipeline (sanitizing, post-processing) changes in
+# code. Backend and extension settings are folded into ``MarkdownRenderer.version``
+# on top of this, so ``rerender_posts`` finds rows rendered by an older pipeline.
+RENDERER_VERSION = 2
+
+EXCERPT_LENGTH = 155
+WORDS_PER_MINUTE = 200
+
+_HTML_TAG_RE = re.compile(r"<[a-zA-Z][^>]*>")
+
+
+class ContentSummary(NamedTuple):
+    """Plain-text facts derived from rendered HTML."""
+
+    excerpt: str
+    word_count: int
+    reading_time: int
+
+
+class MarkdownRenderer(Protocol):
+    """Interface implemented by every Markdown backend."""
+
+    name: str
+    extensions: tuple[str, ...]
+
+    @property
+    def version(self) -> int: ...
+
+    def render(self, text: str) -> str: ...
+
+
+class _BaseRenderer:
+    name = ""
+
+    def __init__(self, extensions: Sequence[str] = ()) -> None:
+        self.extensions = tuple(extensions)
+
+    @property
+    def version(self) -> int:
+        """Stable small integer identifying the pipeline, stored on each post."""
+        if self.name == PythonMarkdownRenderer.name and not self.extensions:
+            # The default pipeline keeps the plain version number so existing
+            # rows rendered before backends became configurable stay fresh.
+            return RENDERER_VERSION
+        signature = f"{RENDERER_VERSION}|{self.name}|{','.join(self.extensions)}"
+        # Fits ``PositiveSmallIntegerField`` and never collides with the plain
+        # version numbers used by the default pipeline.
+        return 1000 + zlib.crc32(signature.encode()) % 31000
+
+
+class PythonMarkdownRenderer(_BaseRenderer):
+    """Python-Markdown backend reusing one ``Markdown`` instance per thread.
+
+    Building a ``Markdown`` object loads and configures every extension, which
+    dominates the cost of short documents. The parser is not thread-safe, so
+    each thread keeps its own and resets it after every document.
+    """
+
+    name = "python-markdown"
+
+    def __init__(self, extensions: Sequence[str] = ()) -> None:
+        super().__init__(extensions)
+        self._local = threading.local()
+
+    def _parser(self) -> Markdown:
+        parser: Markdown | None = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = Markdown(extensions=list(self.extensions))
+            self._local.parser = parser
+        return parser
+
+    def render(self, text: str) -> str:
+        parser = self._parser()
+        try:
+            return parser.convert(text)
+        finally:
+            parser.reset()
+
+
+class MarkdownItRenderer(_BaseRenderer):
+    """markdown-it-py backend (optional dependency).
+
+    Extensions are markdown-it rule names enabled on top of CommonMark, e.g.
+    ``table`` or ``strikethrough``. The parser keeps no per-document state,
+    so a single instance is shared across threads.
+    """
+
+    name = "markdown-it"
+
+    def __init__(self, extensions: Sequence[str] = ()) -> None:
+        super().__init__(extensions)
+        try:
+            from markdown_it import MarkdownIt
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImproperlyConfigured(
+                "MARKDOWN_BACKEND='markdown-it' requires the markdown-it-py package."
+            ) from exc
+        # Raw HTML passes through, matching Python-Markdown's behaviour.
+        self._parser = MarkdownIt("commonmark", {"html": True})
+        if self.extensions:
+            self._parser.enable(list(self.extensions))
+
+    def render(self, text: str) -> str:
+        return self._parser.render(text)
+
+
+RENDERER_BACKENDS: dict[str, Callable[[Sequence[str]], MarkdownRenderer]] = {
+    PythonMarkdownRenderer.name: PythonMarkdownRenderer,
+    MarkdownItRenderer.name: MarkdownItRenderer,
+}
+
+
+@lru_cache(maxsize=8)
+def build_renderer(
+    backend: str = PythonMarkdownRenderer.name, extensions: tuple[str, ...] = ()
+) -> MarkdownRenderer:
+    """Return a (cached) renderer for a backend and extension list."""
+    try:
+        factory = RENDERER_BACKENDS[backend]
+    except KeyError as exc:
+        raise ImproperlyConfigured(
+            f"Unknown MARKDOWN_BACKEND {backend!r}; "
+            f"choose one of {', '.join(RENDERER_BACKENDS)}."
+        ) from exc
+    return factory(extensions)
+
+
+def get_renderer() -> MarkdownRenderer:
+    """Return the renderer configured by ``MARKDOWN_BACKEND``/``MARKDOWN_EXTENSIONS``."""
+    return build_renderer(
+        getattr(settings, "MARKDOWN_BACKEND", PythonMarkdownRenderer.name),
+        tuple(getattr(settings, "MARKDOWN_EXTENSIONS", ())),
+    )
+
+
+def render_markdown(text: str | None, renderer: MarkdownRenderer | None = None) -> str:
+    """Render stored post content from Markdown to HTML.
+
+    Basic backwards-compatibility: if the content already looks like HTML,
+    it is returned untouched instead of being re-run through Markdown.
+    """
+    if not text:
+        return ""
+    if looks_like_html(text):
+        return text
+    return (renderer or get_renderer()).render(text)
+
+
+def looks_like_html(text: str) -> bool:
+    """Return True for legacy content stored as HTML rather than Markdown."""
+    return "<" in text and _HTML_TAG_RE.search(text) is not None
+
+
+def summarize_html(html: str | None) -> ContentSummary:
+    """Return the excerpt, word count and reading time (minutes) of HTML."""
+    # The excerpt is plain text; templates escape it when they output it.
+    normalized = " ".join(unescape(strip_tags(html or "")).split())
+    if not normalized:
+        return ContentSummary("", 0, 0)
+    excerpt = (
+        normalized[:EXCERPT_LENGTH] + "..."
+        if len(normalized) > EXCERPT_LENGTH
+        else normalized
+    )
+    word_count = len(normalized.split(" "))
+    reading_time = max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+    return ContentSummary(excerpt, word_count, reading_time)
+
+
+__all__ = [
+    "RENDERER_VERSION",
+    "RENDERER_BACKENDS",
+    "ContentSummary",
+    "MarkdownRenderer",
+    "PythonMarkdownRenderer",
+    "MarkdownItRenderer",
+    "build_renderer",
+    "get_renderer",
+    "looks_like_html",
+    "render_markdown",
+    "summarize_html",
+]
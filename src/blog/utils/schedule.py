@@ -0,0 +1,195 @@
+"""Clock of the next scheduled publication, for caches that depend on it.
+
+``Post.public.published()`` compares ``published_at`` with the current time,
+so every cached public page, count and redirect map silently goes stale when
+a scheduled post goes live. No save happens at that moment, so no signal
+invalidates anything. This module keeps the moment of the next go-live in the
+cache:
+
+* cached pages expire no later than that moment (:func:`cap_timeout`);
+* the first request (or worker loop) after it bumps the cache versions, once
+  across every process sharing the cache (:func:`check_go_live`);
+* with ``PAGE_CACHE_WARM_URL`` set, the ``run_jobs`` worker (or the
+  ``warm_pages`` command) renders the pages that changed into the cache
+  again (:func:`warm_pages`). Requests never render pages they did not ask for.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db.models import Min
+from django.template.response import SimpleTemplateResponse
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone, translation
+
+from ..models import Post
+from ..models.jobs import Job
+from .page_cache import bump_page_cache_version, page_cache_is_shared
+from .pagination import POST_COUNT_VERSION_KEY
+from .redirects import invalidate_slug_redirects
+from .versions import bump_version
+
+logger = logging.getLogger(__name__)
+
+NEXT_GO_LIVE_KEY = "blog:next-go-live"
+# Recomputed at least this often, in case ``published_at`` was changed
+# without a signal (queryset updates, raw SQL).
+NEXT_GO_LIVE_TIMEOUT = 3600
+GO_LIVE_LOCK_PREFIX = "blog:went-live"
+GO_LIVE_LOCK_TIMEOUT = 3600
+# Earliest go-live whose pages still wait to be warmed.
+WARM_FROM_KEY = "blog:warm-from"
+# Cached in place of ``None`` (no scheduled post), which means "missing".
+_NOTHING_SCHEDULED = ""
+
+
+def next_go_live() -> datetime | None:
+    """Return when the next scheduled post goes live, or ``None``."""
+    moment = cache.get(NEXT_GO_LIVE_KEY)
+    if moment is None:
+        moment = Post.objects.filter(published_at__gt=timezone.now()).aggregate(
+            next=Min("published_at")
+        )["next"]
+        cache.set(NEXT_GO_LIVE_KEY, moment or _NOTHING_SCHEDULED, NEXT_GO_LIVE_TIMEOUT)
+    return moment or None
+
+
+def reset_go_live_clock() -> None:
+    """Forget the cached moment; ``blog.signals`` calls this when posts change."""
+    cache.delete(NEXT_GO_LIVE_KEY)
+
+
+def cap_timeout(timeout: int) -> int:
+    """Shorten a cache ``timeout`` (seconds) so it ends by the next go-live."""
+    moment = next_go_live()
+    if moment is None:
+        return timeout
+    remaining = math.ceil((moment - timezone.now()).total_seconds())
+    return max(1, min(timeout, remaining))
+
+
+def check_go_live() -> bool:
+    """Expire what depends on the published set once a scheduled post is live.
+
+    Cheap enough to call on every request: a cache read, unless the moment
+    has passed. Exactly one caller per moment bumps the page cache, paginator
+    count and slug redirect versions, and gets ``True``. When pages are
+    warmed, it also records the moment for :func:`take_went_live`.
+    """
+    moment = next_go_live()
+    if moment is None or moment > timezone.now():
+        return False
+    if not cache.add(
+        f"{GO_LIVE_LOCK_PREFIX}:{moment.isoformat()}", True, GO_LIVE_LOCK_TIMEOUT
+    ):
+        return False
+    bump_page_cache_version()
+    bump_version(POST_COUNT_VERSION_KEY)
+    invalidate_slug_redirects()
+    reset_go_live_clock()
+    if warming_enabled():
+        # Keeps the earliest moment nobody has warmed the pages of yet.
+        cache.add(WARM_FROM_KEY, moment, None)
+    return True
+
+
+def warming_enabled() -> bool:
+    """Whether pages are warmed: a public URL is set and the cache is shared.
+
+    A per-process cache would only keep warmed pages in the warming process.
+    """
+    return bool(
+        settings.PAGE_CACHE_WARM_URL
+        and settings.PAGE_CACHE_TIMEOUT
+        and page_cache_is_shared()
+    )
+
+
+def take_went_live() -> list[int]:
+    """Return the ids of the posts that went live since the last call."""
+    start = cache.get(WARM_FROM_KEY)
+    if start is None:
+        return []
+    cache.delete(WARM_FROM_KEY)
+    # Read after the delete: a moment recorded in between is covered too.
+    now = timezone.now()
+    return list(
+        Post.objects.filter(published_at__gte=start, published_at__lte=now)
+        .order_by("published_at")
+        .values_list("pk", flat=True)
+    )
+
+
+def schedule_warming() -> list[int]:
+    """Queue a job warming the pages of the posts that went live, if any."""
+    post_ids = take_went_live()
+    if post_ids:
+        Job.objects.enqueue(Job.Kind.WARM_PAGES, payload={"post_ids": post_ids})
+    return post_ids
+
+
+def warm_paths(post_ids: list[int]) -> list[tuple[str, str]]:
+    """``(path, language)`` of the public pages that change when ``post_ids`` go live."""
+    codes = [code for code, _label in settings.LANGUAGES]
+    pages = [(reverse("post_list"), code) for code in codes]
+    for post in Post.objects.filter(pk__in=post_ids).only(
+        "slug", *(f"slug_{code}" for code in codes)
+    ):
+        for code in codes:
+            # Each language renders the post under its own slug only.
+            slug = getattr(post, f"slug_{code}", None) or post.slug
+            pages.append((reverse("post_detail", kwargs={"slug": slug}), code))
+    return pages
+
+
+def warm_pages(post_ids: list[int]) -> int:
+    """Render the pages changed by ``post_ids`` into the page cache.
+
+    Each page is built with ``RequestFactory`` as an anonymous visitor of
+    ``PAGE_CACHE_WARM_URL`` and handed to the view it resolves to, whose page
+    cache stores it under the key real visitors look up. Middleware does not
+    run. Does nothing unless :func:`warming_enabled`. Returns the number of
+    pages rendered.
+    """
+    if not warming_enabled():
+        return 0
+    base = urlsplit(settings.PAGE_CACHE_WARM_URL)
+    # Behind the proxy, the scheme comes from SECURE_PROXY_SSL_HEADER.
+    factory = RequestFactory(
+        headers={"host": base.netloc, "x-forwarded-proto": base.scheme}
+    )
+    warmed = 0
+    for path, code in warm_paths(post_ids):
+        request = factory.get(path, secure=base.scheme == "https")
+        request.user = AnonymousUser()
+        request.auser = _anonymous_user  # type: ignore[attr-defined]
+        request.LANGUAGE_CODE = code
+        request.resolver_match = match = resolve(path)
+        with translation.override(code):
+            if iscoroutinefunction(match.func):
+                view = async_to_sync(match.func)
+            else:
+                view = match.func
+            response = view(request, *match.args, **match.kwargs)
+            if isinstance(response, SimpleTemplateResponse):
+                response.render()
+        if response.status_code == 200:
+            warmed += 1
+        else:
+            logger.warning(
+                "Warming %s (%s) returned %s", path, code, response.status_code
+            )
+    return warmed
+
+
+async def _anonymous_user() -> AnonymousUser:
+    return AnonymousUser()
@@ -0,0 +1,201 @@
+"""Full-text search over posts, with a stored index per language.
+
+On PostgreSQL every post stores a ``tsvector`` per language
+(``search_vector_en``, ``search_vector_uk``), built with that language's text
+search configuration from ``SEARCH_CONFIGS`` and indexed with GIN. Other
+databases (SQLite in tests and local development) keep one FTS5 table per
+language instead, whose ``rowid`` is the post id.
+
+Titles weigh more than bodies. A language missing a translation is indexed
+with the text the page falls back to, so search finds what visitors read.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, Model, QuerySet, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, NullIf
+from django.utils.html import strip_tags
+
+# Longest query accepted; the rest is ignored.
+SEARCH_QUERY_MAX_LENGTH = 200
+# FTS5 tokenizers per language (SQLite fallback); "porter" stems English.
+FTS_TOKENIZERS = {"en": "porter unicode61"}
+FTS_DEFAULT_TOKENIZER = "unicode61"
+# FTS5 column weights for ``bm25()``: title, body.
+FTS_WEIGHTS = (4.0, 1.0)
+
+
+def _language_codes() -> list[str]:
+    return [code for code, _label in settings.LANGUAGES]
+
+
+def _fallbacks(code: str) -> list[str]:
+    return [
+        code,
+        *(c for c in settings.MODELTRANSLATION_FALLBACK_LANGUAGES if c != code),
+    ]
+
+
+def search_config(code: str) -> str:
+    """Return the PostgreSQL text search configuration of language ``code``."""
+    return settings.SEARCH_CONFIGS.get(code, "simple")
+
+
+def fts_table(code: str) -> str:
+    return f"blog_post_search_{code}"
+
+
+def create_search_index(schema_editor: object) -> None:
+    """Create the GIN indexes (PostgreSQL) or FTS5 tables (other databases)."""
+    connection = schema_editor.connection  # type: ignore[attr-defined]
+    for code in _language_codes():
+        if connection.vendor == "postgresql":
+            sql = (
+                f"CREATE INDEX IF NOT EXISTS blog_post_search_{code}_gin "
+                f"ON blog_post USING gin (search_vector_{code})"
+            )
+        else:
+            tokenizer = FTS_TOKENIZERS.get(code, FTS_DEFAULT_TOKENIZER)
+            sql = (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table(code)} "
+                f"USING fts5(title, body, tokenize='{tokenizer}')"
+            )
+        schema_editor.execute(sql)  # type: ignore[attr-defined]
+
+
+def drop_search_index(schema_editor: object) -> None:
+    connection = schema_editor.connection  # type: ignore[attr-defined]
+    for code in _language_codes():
+        if connection.vendor == "postgresql":
+            sql = f"DROP INDEX IF EXISTS blog_post_search_{code}_gin"
+        else:
+            sql = f"DROP TABLE IF EXISTS {fts_table(code)}"
+        schema_editor.execute(sql)  # type: ignore[attr-defined]
+
+
+def index_posts(queryset: QuerySet[Model]) -> None:
+    """Recompute the stored search index of the posts in ``queryset``.
+
+    Takes a queryset rather than ids so migrations can pass their historical
+    model. On PostgreSQL this is a single ``UPDATE`` computing the vectors in
+    the database.
+    """
+    if connections[queryset.db].vendor == "postgresql":
+        queryset.update(
+            **{
+                f"search_vector_{code}": SearchVector(
+                    _localized_column("title", code),
+                    weight="A",
+                    config=search_config(code),
+                )
+                # Tags and entities are not indexed by the text search parser.
+                + SearchVector(
+                    _localized_column("content_html", code),
+                    weight="B",
+                    config=search_config(code),
+                )
+                for code in _language_codes()
+            }
+        )
+        return
+    codes = _language_codes()
+    rows = list(
+        queryset.values(
+            "pk",
+            *(f"{name}_{code}" for name in ("title", "content_html") for code in codes),
+        )
+    )
+    post_ids = [row["pk"] for row in rows]
+    unindex_posts(post_ids, using=queryset.db)
+    with connections[queryset.db].cursor() as cursor:
+        for code in codes:
+            cursor.executemany(
+                f"INSERT INTO {fts_table(code)} (rowid, title, body) VALUES (%s, %s, %s)",  # noqa: S608
+                [
+                    (
+                        row["pk"],
+                        _localized_value(row, "title", code),
+                        strip_tags(_localized_value(row, "content_html", code)),
+                    )
+                    for row in rows
+                ],
+            )
+
+
+def unindex_posts(post_ids: Iterable[int], *, using: str = "default") -> None:
+    """Forget deleted posts (FTS5 only; PostgreSQL vectors go with the row)."""
+    post_ids = list(post_ids)
+    if not post_ids or connections[using].vendor == "postgresql":
+        return
+    placeholders = ", ".join(["%s"] * len(post_ids))
+    with connections[using].cursor() as cursor:
+        for code in _language_codes():
+            cursor.execute(
+                f"DELETE FROM {fts_table(code)} WHERE rowid IN ({placeholders})",  # noqa: S608
+                post_ids,
+            )
+
+
+def search_posts(queryset: QuerySet[Model], query: str, lang: str) -> QuerySet[Model]:
+    """Filter ``queryset`` to posts matching ``query`` in ``lang``, best first.
+
+    Each post carries a ``search_rank`` (higher is better). Ties keep the
+    list order, newest first.
+    """
+    query = query.strip()[:SEARCH_QUERY_MAX_LENGTH]
+    if lang not in _language_codes():
+        lang = settings.LANGUAGE_CODE
+    if connections[queryset.db].vendor == "postgresql":
+        # "websearch" accepts anything a visitor types (quotes, "or", "-").
+        search = SearchQuery(query, config=search_config(lang), search_type="websearch")
+        column = f"search_vector_{lang}"
+        return (
+            queryset.filter(**{column: search})
+            .annotate(search_rank=SearchRank(F(column), search))
+            .order_by("-search_rank", "-published_at", "-id")
+        )
+    # FTS5 has its own query syntax; match the words, all of them, literally.
+    words = re.findall(r"\w+", query)
+    if not words:
+        return queryset.none()
+    match = " ".join(f'"{word}"' for word in words)
+    table = fts_table(lang)
+    weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+    post_id = f'"{queryset.model._meta.db_table}"."id"'
+    # Only the match expression comes from the visitor, as a parameter.
+    rank = RawSQL(  # noqa: S611
+        # bm25() is lower for better matches.
+        f"SELECT -bm25({table}, {weights}) FROM {table} "  # noqa: S608
+        f"WHERE {table} MATCH %s AND rowid = {post_id}",
+        (match,),
+    )
+    return (
+        queryset.annotate(search_rank=rank)
+        .filter(search_rank__isnull=False)
+        .order_by("-search_rank", "-published_at", "-id")
+    )
+
+
+def _localized_column(name: str, code: str) -> Coalesce:
+    """``name`` in ``code``, falling back like modeltranslation does."""
+    # Titles are varchar and bodies text; PostgreSQL needs one type.
+    columns = [
+        NullIf(F(f"{name}_{c}"), Value(""), output_field=TextField())
+        for c in _fallbacks(code)
+    ]
+    return Coalesce(*columns, Value(""), output_field=TextField())
+
+
+def _localized_value(row: dict[str, object], name: str, code: str) -> str:
+    for c in _fallbacks(code):
+        value = row.get(f"{name}_{c}")
+        if value:
+            return str(value)
+    return ""
@@ -0,0 +1,35 @@
+"""Version tokens kept in the cache, used to invalidate derived data at once.
+
+Derived entries embed the current token in their keys (or remember the token
+they were built from); bumping it orphans them in every process that shares
+the cache.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from django.core.cache import cache
+
+
+def current_version(key: str) -> str:
+    """Return the token stored under ``key``, creating one if missing."""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return str(version)
+
+
+async def acurrent_version(key: str) -> str:
+    """Async :func:`current_version`, for async views."""
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, uuid.uuid4().hex, None)
+        version = await cache.aget(key)
+    return str(version)
+
+
+def bump_version(key: str) -> None:
+    """Replace the token under ``key``, invalidating everything built on it."""
+    cache.set(key, uuid.uuid4().hex, None)
@@ -0,0 +1,53 @@
+"""Fill a process's in-memory caches before it serves its first request.
+
+``gunicorn.conf.py`` calls :func:`warm_shared_caches` in the master when the
+app is preloaded, so every forked worker shares the result copy-on-write, and
+:func:`warm_worker_caches` in each worker once it has loaded the app.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.template.loader import get_template
+from django.urls import reverse
+from django.utils import translation
+
+from ..middleware import slug_redirects
+from .schedule import next_go_live
+
+logger = logging.getLogger(__name__)
+
+# Templates of the public pages, compiled by the cached template loader.
+PUBLIC_TEMPLATES = ("post_list.html", "post_detail.html", "post_search.html")
+
+
+def warm_shared_caches() -> None:
+    """Compile the public templates and the URL patterns of every language.
+
+    Needs neither the database nor the cache, so it is safe before a fork.
+    """
+    for name in PUBLIC_TEMPLATES:
+        get_template(name)
+    for code, _label in settings.LANGUAGES:
+        with translation.override(code):
+            reverse("post_list")
+
+
+def warm_worker_caches() -> None:
+    """Load the per-process state public requests read on every request.
+
+    That is the slug redirect map and the go-live clock. A database that is
+    not reachable yet is logged and left to the first requests.
+    """
+    try:
+        slug_redirects.get()
+        next_go_live()
+    except DatabaseError:
+        logger.warning("Could not warm the worker caches", exc_info=True)
+    finally:
+        # Requests run in other threads (ASGI) or reconnect anyway; do not
+        # keep this thread's connection open.
+        connections.close_all()
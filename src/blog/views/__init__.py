@@ -1,13 +1,24 @@
+from .csrf import csrf_token
 from .post_create import PostCreateView, PostManageListView, PostUpdateView
-from .post_detail import PostDetailView
-from .post_list import PostListView
-from .seo import robots_txt
+from .post_detail import AsyncPostDetailView, PostDetailView
+from .post_list import AsyncPostListView, PostListView
+from .post_preview import PostPreviewView
+from .post_search import PostSearchView
+from .seo import apost_sitemap, arobots_txt, post_sitemap, robots_txt
 
 __all__ = [
     "PostListView",
+    "AsyncPostListView",
     "PostDetailView",
+    "AsyncPostDetailView",
     "PostManageListView",
     "PostCreateView",
     "PostUpdateView",
+    "PostPreviewView",
+    "PostSearchView",
+    "post_sitemap",
+    "apost_sitemap",
     "robots_txt",
+    "arobots_txt",
+    "csrf_token",
 ]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.http import HttpRequest, JsonResponse
+from django.middleware.csrf import get_token
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+
+@never_cache
+@require_GET
+def csrf_token(request: HttpRequest) -> JsonResponse:
+    """Return a CSRF token for forms on cached pages (the language switcher).
+
+    Cached HTML is shared by every visitor, so it cannot carry their token;
+    the page fetches one from here right before it posts.
+    """
+    return JsonResponse({"csrfToken": get_token(request)})
@@ -8,7 +8,8 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, ListView, UpdateView
 
 from ..forms.post import PostForm
-from ..models import Post
+from ..models import Job, Post
+from ..utils.pagination import CachedCountPaginator
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +47,24 @@ class PostManageListView(SuperuserRequiredMixin, ListView):
         page_obj = context.get("page_obj")
         if page_obj is not None:
             context["posts"] = page_obj
+            context["page_window"] = context["paginator"].page_window(page_obj.number)
         return context
 
+    def get_paginator(  # type: ignore[override]
+        self,
+        queryset: models.QuerySet[Post],
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+        **kwargs: object,
+    ) -> CachedCountPaginator:
+        return CachedCountPaginator(
+            queryset, per_page, orphans, allow_empty_first_page, cache_key="manage"
+        )
+
     def get_queryset(self) -> models.QuerySet[Post]:  # type: ignore[override]
-        """Prefetch categories for admin listings to reduce queries."""
-        return super().get_queryset().prefetch_related("categories")
+        """List post cards: titles, dates and category names, no content."""
+        return Post.public.all().cards()
 
 
 class PostCreateView(SuperuserRequiredMixin, CreateView):
@@ -85,6 +99,16 @@ class PostUpdateView(SuperuserRequiredMixin, UpdateView):
     template_name = "post_editor.html"
     success_url = reverse_lazy("post_manage_list")
 
+    def get_context_data(self, **kwargs: object) -> dict[str, object]:  # type: ignore[override]
+        """Expose the latest image variant job so editors see its progress."""
+        context = super().get_context_data(**kwargs)
+        context["image_job"] = (
+            Job.objects.filter(post=self.object, kind=Job.Kind.GENERATE_IMAGE_VARIANTS)
+            .order_by("-created_at", "-pk")
+            .first()
+        )
+        return context
+
     def form_valid(self, form: PostForm) -> HttpResponse:  # type: ignore[override]
         response = super().form_valid(form)
         user = self.request.user
@@ -1,14 +1,30 @@
 import json
+from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db.models.query import QuerySet
-from django.http import Http404, HttpRequest, HttpResponse
-from django.shortcuts import redirect
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponsePermanentRedirect,
+)
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.utils.translation import get_language
 from django.views.generic import DetailView
 
 from ..models import Post
+from ..routers import replica_reads
+from ..utils.conditional import (
+    ConditionalGetMixin,
+    aresolve_post,
+    resolve_post,
+    weak_etag,
+)
+from ..utils.page_cache import PageCacheMixin
+from ..utils.redirects import with_query_string
 from ..utils.seo import build_alternate_links, build_canonical_url
 
 
@@ -26,7 +42,8 @@ def _slug_for_lang(post: Post, lang: str) -> str:
     return getattr(post, f"slug_{lang}", None) or post.slug
 
 
-class PostDetailView(DetailView):
+@method_decorator(replica_reads, name="dispatch")
+class PostDetailView(PageCacheMixin, ConditionalGetMixin, DetailView):
     """
     Detail view for displaying individual blog posts with multilingual slug support.
 
@@ -44,7 +61,27 @@ class PostDetailView(DetailView):
 
     def get_queryset(self) -> QuerySet[Post]:
         """Return only publicly available posts."""
-        return Post.public.all().prefetch_related("categories")
+        return Post.public.all()
+
+    def _canonical_post(self, request: HttpRequest) -> Post | None:
+        """Return the post if the requested slug renders it (no redirect)."""
+        lang = get_language() or settings.LANGUAGE_CODE
+        slug = str(self.kwargs[self.slug_url_kwarg])
+        post = resolve_post(request, slug, lang)
+        if post is None or _slug_for_lang(post, lang) != slug:
+            return None
+        return post
+
+    def get_etag(self, request: HttpRequest) -> str | None:
+        post = self._canonical_post(request)
+        if post is None:
+            return None
+        lang = get_language() or settings.LANGUAGE_CODE
+        return weak_etag("post", post.pk, lang, post.updated_at)
+
+    def get_last_modified(self, request: HttpRequest) -> datetime | None:
+        post = self._canonical_post(request)
+        return post.updated_at if post else None
 
     def get_context_data(self, **kwargs: object) -> dict[str, object]:
         context = super().get_context_data(**kwargs)
@@ -82,12 +119,16 @@ class PostDetailView(DetailView):
         """
         Handle GET requests with multilingual slug resolution.
 
-        The lookup strategy:
-        1. Look for canonical slug in current language
-        2. If found but slug doesn't match canonical, redirect to canonical
-        3. If not found in current language, look in other languages
-        4. If found in other language, redirect to canonical slug for current language
-        5. If not found anywhere, raise 404
+        A single query finds the post by any of its slugs, preferring the
+        current language; the decision is then made in Python:
+        1. If the requested slug is the canonical slug for the current
+           language, render the post (category names are stored on it)
+        2. If it is any other slug of the post, current or former, redirect
+           (301) to the canonical slug for the current language
+        3. If no published post has this slug, raise 404
+
+        Most redirects are answered earlier by ``SlugRedirectMiddleware``
+        without a query; this covers slugs its map has not picked up yet.
 
         Args:
             request: The HTTP request object
@@ -102,24 +143,54 @@ class PostDetailView(DetailView):
         """
         lang: str = get_language() or settings.LANGUAGE_CODE
         slug = str(self.kwargs[self.slug_url_kwarg])
-
-        # Step 1: Look for canonical post in current language
-        exact = Post.public.for_slug(slug, lang=lang).first()
-        if exact:
-            canonical = _slug_for_lang(exact, lang)
-            # Redirect to canonical slug if current slug is not canonical
-            if slug != canonical:
-                return redirect("post_detail", slug=canonical, permanent=True)
-            self.object = exact
-            context = self.get_context_data(object=self.object)
-            return self.render_to_response(context)
-
-        # Step 2: Look for post in other languages and redirect to current language canonical
-        cross = Post.public.for_slug(slug).first()
-        if cross:
-            return redirect(
-                "post_detail", slug=_slug_for_lang(cross, lang), permanent=True
+        post = resolve_post(request, slug, lang)
+        redirect = self._redirect_to_canonical(request, post, slug, lang)
+        if redirect is not None:
+            return redirect
+
+        self.object = post
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+    def _redirect_to_canonical(
+        self, request: HttpRequest, post: Post | None, slug: str, lang: str
+    ) -> HttpResponse | None:
+        """Return the redirect to ``post``'s canonical slug, if ``slug`` is not it."""
+        if post is None:
+            raise Http404("Post not found")
+        canonical = _slug_for_lang(post, lang)
+        if slug == canonical:
+            return None
+        return HttpResponsePermanentRedirect(
+            with_query_string(
+                reverse("post_detail", kwargs={"slug": canonical}), request
             )
+        )
+
 
-        # Step 3: Post not found in any language
-        raise Http404("Post not found")
+class AsyncPostDetailView(PostDetailView):
+    """:class:`PostDetailView` for ASGI workers (``settings.ASYNC_VIEWS``).
+
+    The post is resolved with the async ORM, before the validators read it.
+    """
+
+    async def aload_validators(self, request: HttpRequest) -> None:
+        lang = get_language() or settings.LANGUAGE_CODE
+        await aresolve_post(request, str(self.kwargs[self.slug_url_kwarg]), lang)
+
+    async def get(  # type: ignore[override]
+        self, request: HttpRequest, *args: object, **kwargs: dict[str, object]
+    ) -> HttpResponse:
+        """:meth:`PostDetailView.get`, resolving the slug with the async ORM."""
+        lang: str = get_language() or settings.LANGUAGE_CODE
+        slug = str(self.kwargs[self.slug_url_kwarg])
+        post = await aresolve_post(request, slug, lang)
+        redirect = self._redirect_to_canonical(request, post, slug, lang)
+        if redirect is not None:
+            return redirect
+
+        self.object = post
+        # Image URLs come from the storage backend (an S3 client for R2), so
+        # the context is built off the event loop.
+        context = await sync_to_async(self.get_context_data)(object=self.object)
+        return self.render_to_response(context)
@@ -1,20 +1,78 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
 from django.db.models.query import QuerySet
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.decorators import method_decorator
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import ListView
 
 from ..models import Post
+from ..routers import replica_reads
+from ..utils.conditional import (
+    ConditionalGetMixin,
+    apublished_state,
+    published_etag,
+    published_last_modified,
+)
+from ..utils.page_cache import PageCacheMixin
+from ..utils.pagination import (
+    CachedCountPaginator,
+    apaginate_by_cursor,
+    paginate_by_cursor,
+)
 from ..utils.seo import build_alternate_links, build_canonical_url
 
 
-class PostListView(ListView):
+@method_decorator(replica_reads, name="dispatch")
+class PostListView(PageCacheMixin, ConditionalGetMixin, ListView):
     model = Post
     template_name: str = "post_list.html"
     context_object_name: str = "posts"
     paginate_by: int = 20
 
     def get_queryset(self) -> QuerySet[Post]:
-        """Return posts that are considered published based on their date only."""
-        return Post.public.published().prefetch_related("categories")
+        """Return cards of the posts published by now (no content columns)."""
+        return Post.public.published().cards()
+
+    def get_paginator(
+        self,
+        queryset: QuerySet[Post],
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+        **kwargs: object,
+    ) -> CachedCountPaginator:
+        return CachedCountPaginator(
+            queryset,
+            per_page,
+            orphans,
+            allow_empty_first_page,
+            cache_key="public",
+            counter=Post.public.published_count,
+            acounter=Post.public.apublished_count,
+        )
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Post], page_size: int
+    ) -> tuple[CachedCountPaginator | None, object, object, bool]:
+        """Paginate by cursor when enabled or when an ``?after=`` token is given."""
+        after = self.request.GET.get("after")
+        if settings.POST_LIST_PAGINATION != "cursor" and after is None:
+            return super().paginate_queryset(queryset, page_size)
+        try:
+            page = paginate_by_cursor(queryset, page_size, after)
+        except ValueError as exc:
+            raise Http404(_("Invalid cursor.")) from exc
+        is_paginated = page.has_next() or page.has_previous()
+        return None, page, page.object_list, is_paginated
+
+    def get_etag(self, request: HttpRequest) -> str | None:
+        return published_etag(request)
+
+    def get_last_modified(self, request: HttpRequest) -> datetime | None:
+        return published_last_modified(request)
 
     def get_context_data(self, **kwargs: object) -> dict[str, object]:
         context = super().get_context_data(**kwargs)
@@ -27,7 +85,78 @@ class PostListView(ListView):
                 "EchoField publishes bilingual essays, field notes, and research updates."
             ),
         )
+        paginator = context.get("paginator")
+        if isinstance(paginator, CachedCountPaginator):
+            context["page_window"] = paginator.page_window(context["page_obj"].number)
         canonical = build_canonical_url(self.request)
         context["canonical_url"] = canonical
         context["alternate_links"] = build_alternate_links(self.request)
         return context
+
+
+class AsyncPostListView(PostListView):
+    """:class:`PostListView` for ASGI workers (``settings.ASYNC_VIEWS``).
+
+    The count and the page are read with the async ORM and the page cache
+    with the async cache API, so a request waiting on them does not hold a
+    worker thread.
+    """
+
+    async def get(  # type: ignore[override]
+        self, request: HttpRequest, *args: object, **kwargs: object
+    ) -> HttpResponse:
+        """``ListView.get``, with the count and the page read by the async ORM.
+
+        Rendering (in a worker thread) then needs no query.
+        """
+        self.object_list = self.get_queryset()
+        self.loaded_page = await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        context = self.get_context_data()
+        return self.render_to_response(context)
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Post], page_size: int
+    ) -> tuple[CachedCountPaginator | None, object, object, bool]:
+        """Return the page :meth:`get` loaded."""
+        return self.loaded_page
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet[Post], page_size: int
+    ) -> tuple[CachedCountPaginator | None, object, object, bool]:
+        """Load the requested page of cards.
+
+        Pages are numbered, unless cursor pagination is enabled or an
+        ``?after=`` token is given.
+        """
+        after = self.request.GET.get("after")
+        if settings.POST_LIST_PAGINATION == "cursor" or after is not None:
+            try:
+                cursor_page = await apaginate_by_cursor(queryset, page_size, after)
+            except ValueError as exc:
+                raise Http404(_("Invalid cursor.")) from exc
+            is_paginated = cursor_page.has_next() or cursor_page.has_previous()
+            return None, cursor_page, cursor_page.object_list, is_paginated
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        await paginator.acount()
+        # Page numbers are read like ``MultipleObjectMixin.paginate_queryset``.
+        number = self.kwargs.get(self.page_kwarg) or self.request.GET.get(
+            self.page_kwarg, 1
+        )
+        try:
+            page = paginator.page(
+                paginator.num_pages if number == "last" else int(str(number))
+            )
+        except (ValueError, InvalidPage) as exc:
+            raise Http404(_("Invalid page.")) from exc
+        page.object_list = [card async for card in page.object_list]
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def aload_validators(self, request: HttpRequest) -> None:
+        await apublished_state(request)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from ..utils.preview import render_preview_blocks
+from .post_create import SuperuserRequiredMixin
+
+MAX_PREVIEW_LENGTH = 500_000
+
+
+class PostPreviewView(SuperuserRequiredMixin, View):
+    """Render editor Markdown server-side, block by block.
+
+    The editor posts the full field value together with the block keys it is
+    already displaying. Only blocks that changed since the previous preview
+    are rendered (or fetched from the block cache) and sent back with HTML;
+    the rest come back as bare keys the client reuses from its DOM.
+    """
+
+    http_method_names = ["post"]
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            payload = json.loads(request.body or b"{}")
+        except ValueError:
+            return JsonResponse({"error": "Invalid JSON payload."}, status=400)
+
+        content = payload.get("content") if isinstance(payload, dict) else None
+        known = payload.get("known", []) if isinstance(payload, dict) else []
+        if not isinstance(content, str) or not isinstance(known, list):
+            return JsonResponse(
+                {"error": "Expected content and known keys."}, status=400
+            )
+        if len(content) > MAX_PREVIEW_LENGTH:
+            return JsonResponse(
+                {"error": "Content is too long to preview."}, status=413
+            )
+
+        blocks = render_preview_blocks(
+            content, known=[key for key in known if isinstance(key, str)]
+        )
+        return JsonResponse(
+            {"blocks": [{"key": block.key, "html": block.html} for block in blocks]}
+        )
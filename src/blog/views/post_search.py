@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db.models.query import QuerySet
+from django.utils.decorators import method_decorator
+from django.utils.translation import get_language
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import ListView
+
+from ..models import Post
+from ..routers import replica_reads
+from ..utils.search import SEARCH_QUERY_MAX_LENGTH, search_posts
+from ..utils.seo import build_canonical_url
+
+
+@method_decorator(replica_reads, name="dispatch")
+class PostSearchView(ListView):
+    """Full-text search over published posts in the active language.
+
+    Results are ranked by relevance (titles weigh more than bodies) and read
+    as cards. Searches are neither page-cached nor meant to be indexed.
+    """
+
+    model = Post
+    template_name: str = "post_search.html"
+    context_object_name: str = "posts"
+    paginate_by: int = 20
+
+    @property
+    def query(self) -> str:
+        return self.request.GET.get("q", "").strip()[:SEARCH_QUERY_MAX_LENGTH]
+
+    def get_queryset(self) -> QuerySet[Post]:
+        if not self.query:
+            return Post.public.none()
+        lang = get_language() or settings.LANGUAGE_CODE
+        return search_posts(Post.public.published(), self.query, lang).cards()
+
+    def get_context_data(self, **kwargs: object) -> dict[str, object]:
+        context = super().get_context_data(**kwargs)
+        context.update(
+            {
+                "query": self.query,
+                "max_length": SEARCH_QUERY_MAX_LENGTH,
+                "meta_title": _("EchoField — %(label)s") % {"label": _("Search")},
+                "meta_robots": "noindex, follow",
+                "canonical_url": build_canonical_url(self.request),
+            }
+        )
+        return context
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from django.contrib.sitemaps.views import sitemap
 from django.http import HttpRequest, HttpResponse
 from django.urls import reverse
+from django.views.decorators.http import condition
 
+from ..models import Post
+from ..routers import replica_reads
+from ..sitemaps import PostSitemap
+from ..utils.conditional import (
+    apublished_state,
+    published_etag,
+    published_last_modified,
+    robots_etag,
+)
 
-def robots_txt(request: HttpRequest) -> HttpResponse:
+
+def _robots_content(request: HttpRequest) -> HttpResponse:
     sitemap_url = request.build_absolute_uri(reverse("sitemap"))
     content = "\n".join(
         [
@@ -15,3 +27,41 @@ def robots_txt(request: HttpRequest) -> HttpResponse:
         ]
     )
     return HttpResponse(content, content_type="text/plain")
+
+
+@condition(etag_func=robots_etag)
+def robots_txt(request: HttpRequest) -> HttpResponse:
+    return _robots_content(request)
+
+
+@condition(etag_func=robots_etag)
+async def arobots_txt(request: HttpRequest) -> HttpResponse:
+    """Async :func:`robots_txt`, for ASGI workers (``settings.ASYNC_VIEWS``)."""
+    return _robots_content(request)
+
+
+@replica_reads
+@condition(etag_func=published_etag, last_modified_func=published_last_modified)
+def post_sitemap(request: HttpRequest) -> HttpResponse:
+    """``/sitemap.xml`` of published posts, formatted from their cards."""
+    cards = list(Post.public.published().cards())
+    return sitemap(request, {"posts": PostSitemap(cards)})
+
+
+@condition(etag_func=published_etag, last_modified_func=published_last_modified)
+async def _apost_sitemap(request: HttpRequest) -> HttpResponse:
+    cards = [card async for card in Post.public.published().cards()]
+    # Django's sitemap view only formats the loaded cards (rendered off the
+    # event loop).
+    return sitemap(request, {"posts": PostSitemap(cards)})
+
+
+@replica_reads
+async def apost_sitemap(request: HttpRequest) -> HttpResponse:
+    """Async :func:`post_sitemap`, for ASGI workers (``settings.ASYNC_VIEWS``).
+
+    The validators' query runs first, with the async ORM, so ``condition``
+    answers 304 without blocking the event loop.
+    """
+    await apublished_state(request)
+    return await _apost_sitemap(request)
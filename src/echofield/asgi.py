@@ -2,6 +2,8 @@
 ASGI config for echofield project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Production serves it with Gunicorn's uvicorn workers (see the Dockerfile);
+the public pages are async views there.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -18,6 +18,9 @@ _MODULES: tuple[str, ...] = (
     "echofield.settings.components.i18n",
     "echofield.settings.components.database",
     "echofield.settings.components.storage",
+    "echofield.settings.components.cache",
+    "echofield.settings.components.content",
+    "echofield.settings.components.jobs",
     "echofield.settings.components.security",
     "echofield.settings.components.sentry",
 )
@@ -2,16 +2,25 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from echofield.settings.config import cfg
+
 BASE_DIR = Path(__file__).resolve().parents[3]
 
 ROOT_URLCONF = "echofield.urls"
 WSGI_APPLICATION = "echofield.wsgi.application"
+# The public pages are async views under ASGI (uvicorn workers) and sync
+# views under WSGI ("sync"/"gthread"), so neither server adapts each request
+# to the other model (``echofield.urls``).
+ASYNC_VIEWS = cfg.GUNICORN_WORKER_CLASS.strip().lower() == "uvicorn"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "blog.middleware.ReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
+    "blog.middleware.GoLiveMiddleware",
+    "blog.middleware.SlugRedirectMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -39,6 +48,7 @@ __all__ = [
     "BASE_DIR",
     "ROOT_URLCONF",
     "WSGI_APPLICATION",
+    "ASYNC_VIEWS",
     "DEFAULT_AUTO_FIELD",
     "MIDDLEWARE",
     "TEMPLATES",
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+from echofield.settings.config import cfg
+
+
+def _build_caches() -> dict[str, dict[str, object]]:
+    """Build Django CACHES without requiring an external cache service.
+
+    "file" (the default) stores entries on disk so every worker on the host
+    shares them and sees the same invalidation versions. "locmem" keeps them
+    per process, which only suits a single process (``blog.checks`` warns).
+    """
+    backend = cfg.CACHE_BACKEND.strip().lower()
+    if backend == "locmem":
+        default: dict[str, object] = {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": cfg.CACHE_LOCATION or "echofield",
+        }
+    elif backend == "file":
+        location = cfg.CACHE_LOCATION or str(
+            Path(tempfile.gettempdir()) / "echofield-cache"
+        )
+        default = {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location,
+        }
+    else:
+        raise ImproperlyConfigured(
+            f"Unknown CACHE_BACKEND {cfg.CACHE_BACKEND!r}; use 'locmem' or 'file'."
+        )
+    default["OPTIONS"] = {"MAX_ENTRIES": 5000}
+    return {"default": default}
+
+
+CACHES = _build_caches()
+
+# Anonymous list/detail pages are cached for this long (``blog.utils.page_cache``).
+# Edits invalidate them at once, and entries never outlive the next scheduled
+# publication (``blog.utils.schedule``).
+PAGE_CACHE_TIMEOUT = max(0, cfg.PAGE_CACHE_TIMEOUT)
+
+# When set, the ``run_jobs`` worker (or the ``warm_pages`` command) renders the
+# post list and the pages of posts that just went live back into a shared
+# cache, as requests to this host.
+PAGE_CACHE_WARM_URL = (cfg.PAGE_CACHE_WARM_URL or "").strip().rstrip("/")
+
+# Processes that read and invalidate the cache: the Gunicorn workers, plus
+# the ``run_jobs`` worker when background jobs are enabled.
+CACHE_PROCESSES = max(1, cfg.GUNICORN_WORKERS) + int(cfg.BACKGROUND_JOBS_ENABLED)
+
+__all__ = ["CACHES", "CACHE_PROCESSES", "PAGE_CACHE_TIMEOUT", "PAGE_CACHE_WARM_URL"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from echofield.settings.config import cfg
+
+# Markdown pipeline used by ``blog.utils.rendering``. Changing either value
+# changes the renderer version, so ``rerender_posts`` picks up stale rows.
+MARKDOWN_BACKEND = cfg.MARKDOWN_BACKEND
+MARKDOWN_EXTENSIONS: list[str] = [
+    item.strip() for item in (cfg.MARKDOWN_EXTENSIONS or "").split(",") if item.strip()
+]
+
+# "cursor" replaces the numbered post list pages with ``?after=`` links whose
+# cost does not grow with depth (``blog.utils.pagination``).
+POST_LIST_PAGINATION = cfg.POST_LIST_PAGINATION.strip().lower()
+
+# PostgreSQL text search configuration per language (``blog.utils.search``).
+# Stored vectors are built with them: run ``rebuild_search_index`` after a
+# change.
+SEARCH_CONFIGS: dict[str, str] = {
+    "en": cfg.SEARCH_CONFIG_EN,
+    "uk": cfg.SEARCH_CONFIG_UK,
+}
+
+__all__ = [
+    "MARKDOWN_BACKEND",
+    "MARKDOWN_EXTENSIONS",
+    "POST_LIST_PAGINATION",
+    "SEARCH_CONFIGS",
+]
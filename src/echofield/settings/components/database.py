@@ -1,12 +1,53 @@
 from __future__ import annotations
 
 import os
+from importlib.util import find_spec
 
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 from echofield.settings.config import cfg
 
 
+def _pool_options() -> dict[str, object]:
+    """Keyword arguments of ``psycopg_pool.ConnectionPool`` (DB_POOL_*)."""
+    return {
+        "min_size": max(0, cfg.DB_POOL_MIN_SIZE),
+        "max_size": max(1, cfg.DB_POOL_MIN_SIZE, cfg.DB_POOL_MAX_SIZE),
+        "timeout": cfg.DB_POOL_TIMEOUT,
+        "max_lifetime": cfg.DB_POOL_MAX_LIFETIME,
+    }
+
+
+def _tune_postgresql(database: dict[str, object]) -> dict[str, object]:
+    """Apply the connection reuse, pooling and statement settings to an alias.
+
+    Other engines (SQLite in tests) are returned unchanged.
+    """
+    if not str(database.get("ENGINE", "")).endswith("postgresql"):
+        return database
+    options = dict(database.get("OPTIONS") or {})  # type: ignore[call-overload]
+    database["CONN_HEALTH_CHECKS"] = cfg.DB_CONN_HEALTH_CHECKS
+    if cfg.DB_SERVER_SIDE_BINDING:
+        options["server_side_binding"] = True
+        options["prepare_threshold"] = cfg.DB_PREPARE_THRESHOLD
+    if cfg.DB_POOL:
+        if find_spec("psycopg_pool") is None:
+            raise ImproperlyConfigured(
+                "DB_POOL=true requires the psycopg-pool package (psycopg[pool])."
+            )
+        pool = _pool_options()
+        if cfg.DB_CONN_HEALTH_CHECKS:
+            from psycopg_pool import ConnectionPool
+
+            pool["check"] = ConnectionPool.check_connection
+        options["pool"] = pool
+        # The pool replaces persistent connections; Django refuses both.
+        database["CONN_MAX_AGE"] = 0
+    database["OPTIONS"] = options
+    return database
+
+
 def _build_databases() -> dict[str, object]:
     """Build DATABASES setting from environment-aware config.
 
@@ -14,6 +55,11 @@ def _build_databases() -> dict[str, object]:
     1. TEST_DATABASE_URL (explicit override, e.g. for local test runs)
     2. DATABASE_URL (single URL for primary database)
     3. Individual PostgreSQL settings with sensible defaults
+
+    PostgreSQL connections get the DB_CONN_*, DB_POOL_* and server-side
+    binding settings (:func:`_tune_postgresql`). Read replicas from
+    REPLICA_DATABASE_URL are added as ``replica_1``,
+    ``replica_2``, ... next to the primary.
     """
 
     # 1) Explicit test database override (useful for running tests against sqlite).
@@ -23,20 +69,58 @@ def _build_databases() -> dict[str, object]:
 
     # 2) Standard DATABASE_URL configuration.
     if cfg.DATABASE_URL:
-        return {"default": dj_database_url.parse(cfg.DATABASE_URL, conn_max_age=600)}
-
+        databases = {
+            "default": dj_database_url.parse(
+                cfg.DATABASE_URL, conn_max_age=cfg.DB_CONN_MAX_AGE
+            )
+        }
     # 3) Fallback to discrete PostgreSQL settings.
-    return {
-        "default": {
-            "ENGINE": "django.db.backends.postgresql",
-            "NAME": cfg.DB_NAME or "echofield",
-            "USER": cfg.DB_USER or "echouser",
-            "PASSWORD": cfg.DB_PASSWORD or "",
-            "HOST": cfg.DB_HOST,
-            "PORT": str(cfg.DB_PORT),
+    else:
+        databases = {
+            "default": {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": cfg.DB_NAME or "echofield",
+                "USER": cfg.DB_USER or "echouser",
+                "PASSWORD": cfg.DB_PASSWORD or "",
+                "HOST": cfg.DB_HOST,
+                "PORT": str(cfg.DB_PORT),
+                "CONN_MAX_AGE": cfg.DB_CONN_MAX_AGE,
+            }
         }
-    }
+
+    replica_urls = [
+        url.strip()
+        for url in (cfg.REPLICA_DATABASE_URL or "").split(",")
+        if url.strip()
+    ]
+    for number, url in enumerate(replica_urls, start=1):
+        databases[f"replica_{number}"] = dj_database_url.parse(
+            url, conn_max_age=cfg.DB_CONN_MAX_AGE
+        )
+    return {alias: _tune_postgresql(database) for alias, database in databases.items()}
 
 
 DATABASES: dict[str, object] = _build_databases()
-__all__ = ["DATABASES"]
+
+# Also used by the ``benchmark_db_connections`` command.
+DATABASE_POOL_OPTIONS: dict[str, object] = _pool_options()
+
+# Aliases public pages may read from (``blog.routers``); empty without replicas.
+DATABASE_REPLICAS: list[str] = [
+    alias
+    for alias, database in DATABASES.items()
+    if alias != "default" and not database.get("TEST", {}).get("MIRROR")  # type: ignore[attr-defined]
+]
+DATABASE_ROUTERS = ["blog.routers.ReplicaRouter"]
+
+# After a request writes, that visitor's reads stay on the primary this long,
+# so they see their own changes however far the replicas lag.
+REPLICA_PIN_SECONDS = max(0, cfg.REPLICA_PIN_SECONDS)
+
+__all__ = [
+    "DATABASES",
+    "DATABASE_POOL_OPTIONS",
+    "DATABASE_REPLICAS",
+    "DATABASE_ROUTERS",
+    "REPLICA_PIN_SECONDS",
+]
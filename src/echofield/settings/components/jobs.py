@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from echofield.settings.config import cfg
+
+# When enabled, featured-image variants are generated and deleted by the
+# ``run_jobs`` worker instead of inside ``Post.save()``. Without a worker the
+# site keeps serving the original images, since manifests stay empty.
+BACKGROUND_JOBS_ENABLED = cfg.BACKGROUND_JOBS_ENABLED
+
+__all__ = ["BACKGROUND_JOBS_ENABLED"]
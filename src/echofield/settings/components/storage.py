@@ -69,6 +69,20 @@ MEDIA_ROOT = BASE_DIR.parent.parent / "media"
 
 MARKDOWNX_MEDIA_PATH = "uploads/%Y/%m/"
 
+# Featured-image variants (``blog.utils.images``): the responsive width
+# ladder, output formats, encoder processes and the RAM budget that bounds how
+# many variants are encoded at once.
+IMAGE_VARIANT_WIDTHS: list[int] = sorted(
+    {int(item) for item in cfg.IMAGE_VARIANT_WIDTHS.split(",") if item.strip()}
+)
+IMAGE_VARIANT_FORMATS: list[str] = [
+    item.strip().lower()
+    for item in cfg.IMAGE_VARIANT_FORMATS.split(",")
+    if item.strip()
+]
+IMAGE_ENCODE_WORKERS = max(1, cfg.IMAGE_ENCODE_WORKERS)
+IMAGE_MEMORY_BUDGET_MB = max(16, cfg.IMAGE_MEMORY_BUDGET_MB)
+
 __all__ = [
     "STORAGES",
     "STATIC_URL",
@@ -76,4 +90,8 @@ __all__ = [
     "STATIC_ROOT",
     "MEDIA_ROOT",
     "MARKDOWNX_MEDIA_PATH",
+    "IMAGE_VARIANT_WIDTHS",
+    "IMAGE_VARIANT_FORMATS",
+    "IMAGE_ENCODE_WORKERS",
+    "IMAGE_MEMORY_BUDGET_MB",
 ]
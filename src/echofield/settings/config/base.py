@@ -95,6 +95,39 @@ class AppSettings(BaseSettings):
     DB_PORT: int = 5432
     """Database port. Defaults to 5432 for PostgreSQL."""
 
+    DB_CONN_MAX_AGE: int = 600
+    """Seconds a worker keeps its connection between requests when not pooling (0 closes it after each request)."""
+
+    DB_CONN_HEALTH_CHECKS: bool = True
+    """Check that a kept or pooled connection still works before a request uses it."""
+
+    DB_POOL: bool = False
+    """Use psycopg3's connection pool (PostgreSQL, needs the psycopg-pool package) instead of per-worker connections."""
+
+    DB_POOL_MIN_SIZE: int = 2
+    """Connections each process's pool keeps open."""
+
+    DB_POOL_MAX_SIZE: int = 10
+    """Connections each process's pool may open at most."""
+
+    DB_POOL_TIMEOUT: float = 10.0
+    """Seconds a request waits for a free pooled connection before failing."""
+
+    DB_POOL_MAX_LIFETIME: float = 3600.0
+    """Seconds after which a pooled connection is closed and replaced."""
+
+    DB_SERVER_SIDE_BINDING: bool = False
+    """Send query parameters separately from the SQL, so PostgreSQL can prepare statements a connection repeats."""
+
+    DB_PREPARE_THRESHOLD: Optional[int] = 5
+    """Runs of a query before psycopg3 prepares it on the server (unset never prepares; needs server-side binding)."""
+
+    REPLICA_DATABASE_URL: Optional[str] = None
+    """Comma-separated URLs of read replicas serving public pages (unset: the primary serves everything)."""
+
+    REPLICA_PIN_SECONDS: int = 10
+    """Seconds a visitor reads from the primary after a request of theirs wrote (read-your-writes)."""
+
     # --- Static/Media Storage (Cloudflare R2 or local) ---
     USE_R2_STATIC: bool = False
     """Enable Cloudflare R2 for static file storage. If False, uses local storage."""
@@ -114,6 +147,85 @@ class AppSettings(BaseSettings):
     R2_SECRET_ACCESS_KEY: Optional[str] = None
     """R2 secret access key for authentication."""
 
+    # --- Image processing ---
+    IMAGE_VARIANT_WIDTHS: str = "320,640,960,1280,2048"
+    """Comma-separated widths of the responsive featured-image ladder."""
+
+    IMAGE_VARIANT_FORMATS: str = "avif,webp"
+    """Comma-separated variant formats ("avif", "webp")."""
+
+    IMAGE_ENCODE_WORKERS: int = 1
+    """Processes encoding image variants in parallel (1 encodes in-process)."""
+
+    IMAGE_MEMORY_BUDGET_MB: int = 256
+    """Upper bound for the resized frames held plus the pixel buffers of concurrent variant encodes."""
+
+    # --- Content rendering ---
+    MARKDOWN_BACKEND: str = "python-markdown"
+    """Markdown engine used to render posts ("python-markdown" or "markdown-it")."""
+
+    MARKDOWN_EXTENSIONS: Optional[str] = None
+    """Comma-separated Markdown extensions (e.g. "extra,toc,sane_lists")."""
+
+    # --- Public pages ---
+    POST_LIST_PAGINATION: str = "pages"
+    """Post list pagination: "pages" (numbered) or "cursor" (constant-cost `?after=` links)."""
+
+    # --- Search ---
+    SEARCH_CONFIG_EN: str = "english"
+    """PostgreSQL text search configuration for English posts (stems words)."""
+
+    SEARCH_CONFIG_UK: str = "simple"
+    """PostgreSQL text search configuration for Ukrainian posts (a custom one, if installed)."""
+
+    # --- Caching ---
+    CACHE_BACKEND: str = "file"
+    """Cache backend: "file" (shared by every process on the host) or "locmem" (per process; one process only)."""
+
+    CACHE_LOCATION: Optional[str] = None
+    """Directory of the file cache; defaults to a directory under the system temp dir."""
+
+    PAGE_CACHE_TIMEOUT: int = 300
+    """Seconds a public page is served from the cache to anonymous visitors (0 disables)."""
+
+    PAGE_CACHE_WARM_URL: Optional[str] = None
+    """Public base URL (e.g. "https://echofield.example") whose pages the job worker re-caches when a scheduled post goes live."""
+
+    # --- Application server (gunicorn.conf.py) ---
+    GUNICORN_BIND: str = "0.0.0.0:8000"
+    """Address Gunicorn listens on."""
+
+    GUNICORN_WORKER_CLASS: str = "uvicorn"
+    """Worker model: "uvicorn" (ASGI, async public views), "gthread" (WSGI, threaded) or "sync" (WSGI); WSGI workers get the sync public views."""
+
+    GUNICORN_WORKERS: int = 2
+    """Worker processes."""
+
+    GUNICORN_THREADS: int = 4
+    """Threads per worker for the "gthread" worker class."""
+
+    GUNICORN_PRELOAD: bool = True
+    """Load the app in the master before forking, so workers share its memory copy-on-write."""
+
+    GUNICORN_MAX_REQUESTS: int = 1000
+    """Requests after which a worker is replaced, bounding slow memory growth (0 never replaces)."""
+
+    GUNICORN_MAX_REQUESTS_JITTER: int = 100
+    """Random extra requests per worker, so workers are not all replaced at once."""
+
+    GUNICORN_KEEPALIVE: int = 75
+    """Seconds an idle keep-alive connection stays open; longer than nginx's upstream keepalive_timeout (60)."""
+
+    GUNICORN_TIMEOUT: int = 30
+    """Seconds a silent worker is given before it is killed and replaced."""
+
+    GUNICORN_WARM_CACHES: bool = True
+    """Load templates, URL patterns, the slug redirect map and the go-live clock before a worker serves requests."""
+
+    # --- Background jobs ---
+    BACKGROUND_JOBS_ENABLED: bool = False
+    """Hand image variant work to the `run_jobs` worker instead of doing it on save."""
+
     @field_validator(
         "SENTRY_TRACES_SAMPLE_RATE", "SENTRY_PROFILES_SAMPLE_RATE", mode="before"
     )
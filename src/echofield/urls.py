@@ -1,28 +1,49 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.contrib.staticfiles.views import serve
-from django.urls import include, path
+from django.urls import URLPattern, URLResolver, include, path
+from django.views.i18n import set_language
 
-from blog.sitemaps import PostSitemap
-from blog.views import robots_txt
+from blog import urls as blog_urls
+from blog.views import (
+    apost_sitemap,
+    arobots_txt,
+    csrf_token,
+    post_sitemap,
+    robots_txt,
+)
 
 i18n_patterns = [
-    path("i18n/", include("django.conf.urls.i18n")),
+    path("i18n/setlang/", set_language, name="set_language"),
+    # Cached public pages carry no CSRF token; the language switcher fetches one.
+    path("i18n/csrf/", csrf_token, name="csrf_token"),
 ]
 
-sitemaps = {
-    "posts": PostSitemap(),
-}
 
-urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("robots.txt", robots_txt, name="robots_txt"),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
-    path("", include("blog.urls")),
-    *i18n_patterns,
-]
+def build_urlpatterns(*, async_views: bool) -> list[URLPattern | URLResolver]:
+    """Return the project's URLs, with the async or the sync public pages.
+
+    ``settings.ASYNC_VIEWS`` picks them for the server in use: async views
+    under a sync or threaded worker would each run in an event loop of their
+    own (``async_to_sync``), and sync views under ASGI in a thread.
+    """
+    return [
+        path("admin/", admin.site.urls),
+        path(
+            "robots.txt", arobots_txt if async_views else robots_txt, name="robots_txt"
+        ),
+        path(
+            "sitemap.xml",
+            apost_sitemap if async_views else post_sitemap,
+            name="sitemap",
+        ),
+        path("", include(blog_urls.build_urlpatterns(async_views=async_views))),
+        *i18n_patterns,
+    ]
+
+
+urlpatterns = build_urlpatterns(async_views=settings.ASYNC_VIEWS)
 
 # Serve static and media files during development
 if settings.DEBUG:
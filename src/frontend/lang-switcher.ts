@@ -1,3 +1,25 @@
+// Cached pages carry no per-visitor CSRF token, so fetch one before posting.
+async function addCsrfToken(form: HTMLFormElement): Promise<void> {
+    const url = form.dataset.csrfUrl;
+    if (!url) return;
+
+    const response = await fetch(url, {
+      credentials: "same-origin",
+      headers: { Accept: "application/json" },
+    });
+    if (!response.ok) return;
+    const { csrfToken } = await response.json();
+
+    let field = form.querySelector<HTMLInputElement>('input[name="csrfmiddlewaretoken"]');
+    if (!field) {
+      field = document.createElement("input");
+      field.type = "hidden";
+      field.name = "csrfmiddlewaretoken";
+      form.appendChild(field);
+    }
+    field.value = csrfToken;
+}
+
 export function initLangSwitcher(): void {
     console.log('initLangSwitcher');
     const form = <HTMLFormElement>document.getElementById("lang-form");
@@ -7,7 +29,7 @@ export function initLangSwitcher(): void {
     if (!form || !input || pills.length === 0) return;
 
     pills.forEach((pill) => {
-      pill.addEventListener("click", () => {
+      pill.addEventListener("click", async () => {
         const lang = pill.dataset?.lang;
         if (!lang) return;
 
@@ -19,6 +41,7 @@ export function initLangSwitcher(): void {
           p.setAttribute("aria-checked", isActive ? "true" : "false");
         });
 
+        await addCsrfToken(form);
         form.submit();
       });
     });